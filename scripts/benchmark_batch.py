@@ -0,0 +1,82 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark building and serializing copy operations as pydantic models and as a ``CopyBatch``.
+
+Example usage: ``python scripts/benchmark_batch.py --sizes 10000 100000 1000000``
+"""
+
+import argparse
+import time
+
+from ansys.hps.data_transfer.client.models import CopyBatch, SrcDst, StoragePath
+from ansys.hps.data_transfer.client.utils.stream import dump_model, iter_json_array
+
+
+def _paths(n):
+    src = [f"local/dir/{i // 1000}/file_{i}.dat" for i in range(n)]
+    dst = [f"remote/dir/{i // 1000}/file_{i}.dat" for i in range(n)]
+    return src, dst
+
+
+def _models(src, dst):
+    return [
+        SrcDst(src=StoragePath(path=s, remote="local"), dst=StoragePath(path=d, remote="any"))
+        for s, d in zip(src, dst, strict=True)
+    ]
+
+
+def _batch(src, dst):
+    return CopyBatch(src, dst, src_remotes="local", dst_remotes="any")
+
+
+def _serialize(operations):
+    return sum(len(piece) for piece in iter_json_array("operations", operations, dump_model()))
+
+
+def _time(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    """Run the benchmark for the given numbers of entries."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'entries':>10} {'type':>10} {'build [s]':>10} {'dump [s]':>10} {'total [s]':>10} {'speedup':>8}")
+    for n in args.sizes:
+        src, dst = _paths(n)
+        totals = {}
+        for name, build in (("pydantic", _models), ("CopyBatch", _batch)):
+            t_build, ops = _time(build, src, dst)
+            t_dump, _ = _time(_serialize, ops)
+            totals[name] = t_build + t_dump
+            speedup = totals["pydantic"] / totals[name]
+            print(f"{n:>10} {name:>10} {t_build:>10.3f} {t_dump:>10.3f} {totals[name]:>10.3f} {speedup:>7.1f}x")
+            del ops
+
+
+if __name__ == "__main__":
+    main()
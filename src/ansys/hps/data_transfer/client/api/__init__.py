@@ -24,4 +24,11 @@
 
 from .api import DataTransferApi
 from .async_api import AsyncDataTransferApi
-from .handler import AsyncWaitHandler, WaitHandler
+from .batch import OperationBatch
+from .coalesce import AsyncCoalescer, CoalescedOperation, Coalescer
+from .futures import AsyncTransferFuture, TransferFuture
+from .groups import AsyncGroupTracker, GroupTracker, OperationGroup
+from .handler import AsyncSummaryWaitHandler, AsyncWaitHandler, SummaryWaitHandler, WaitHandler
+from .polling import BackoffPolling, ProgressRatePolling
+from .scheduler import AsyncPriorityScheduler, Cost, Limits, Priority, PriorityScheduler
+from .watcher import AsyncOperationWatcher, OperationWatcher
@@ -27,8 +27,13 @@ data transfer operations, managing resources, and handling client interactions.
 """
 
 import builtins
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Sized
+import concurrent.futures
 import logging
+import os
+import posixpath
+import tempfile
+import threading
 import time
 import traceback
 
@@ -36,15 +41,19 @@ import backoff
 from httpx import TimeoutException
 
 from ..client import Client
-from ..exceptions import TimeoutError
+from ..exceptions import ClientError, TimeoutError
 from ..models import (
     CheckPermissionsResponse,
+    CreateArchiveBody,
     DataAssignment,
+    ExtractBody,
+    Format,
     GetPermissionsResponse,
     Operation,
     OperationIdResponse,
     OperationsResponse,
     OperationState,
+    PathBatch,
     RoleAssignment,
     RoleQuery,
     SetMetadataRequest,
@@ -53,12 +62,44 @@ from ..models import (
     StorageConfigResponse,
     StoragePath,
 )
-from ..utils.jitter import get_expo_backoff
+from ..utils.checksum import ChecksumCache, hash_files, identical, remote_checksums
+from ..utils.iterables import chunked
+from ..utils.stream import JsonArrayBody, dump_model, single_pass
+from ..utils.walk import walk_files
+from .batch import OperationBatch
+from .coalesce import CoalescedOperation
+from .futures import TransferFuture
+from .groups import GroupTracker
 from .handler import WaitHandler
+from .packing import (
+    Packer,
+    archive_name,
+    default_pack_size,
+    default_pack_threshold,
+    extract_archive,
+    write_archive,
+)
+from .polling import BackoffPolling
 from .retry import retry
+from .scheduler import Priority, PriorityScheduler, batch_cost
+from .sync import (
+    SyncManifest,
+    SyncPlan,
+    collect_listing,
+    default_manifest_name,
+    directions,
+    filter_remote,
+    join,
+    local_files,
+    plan_download,
+    plan_upload,
+)
+from .watcher import OperationWatcher
 
 log = logging.getLogger(__name__)
 
+_watcher_lock = threading.Lock()
+
 
 class DataTransferApi:
     """Provides the data transfer API.
@@ -74,6 +115,42 @@ class DataTransferApi:
         self.dump_mode = "json"
         self.client = client
         self.wait_handler_factory = WaitHandler
+        # Bounds for polling the status of many operations at once
+        self.max_ids_per_request = 200
+        self.max_concurrent_requests = 4
+        # Number of directories scanned in parallel by upload_tree
+        self.walk_workers = 8
+        # Checksums of local files compared against remote files to skip identical uploads
+        self.checksum_cache = ChecksumCache()
+        self.hash_workers = 8
+        # Coalescer merging small submissions of concurrent callers into one request, disabled if None
+        self.coalescer = None
+
+    @property
+    def operation_watcher(self) -> OperationWatcher:
+        """Operation watcher shared by all APIs of the client. It is created on first use."""
+        with _watcher_lock:
+            if self.client.operation_watcher is None:
+                self.client.operation_watcher = OperationWatcher(self._fetch_operations)
+        return self.client.operation_watcher
+
+    @property
+    def scheduler(self) -> PriorityScheduler | None:
+        """Scheduler shared by all APIs of the client, if the client limits the submissions in flight."""
+        client = self.client
+        if client.max_active_submissions is None and client.limits is None and not client.remote_limits:
+            return None
+        watcher = self.operation_watcher
+        with _watcher_lock:
+            if client.scheduler is None:
+                client.scheduler = PriorityScheduler(
+                    watcher,
+                    client.max_active_submissions,
+                    limits=client.limits,
+                    remote_limits=client.remote_limits,
+                    block=client.block_on_limits,
+                )
+        return client.scheduler
 
     @retry()
     def status(self, wait=False, sleep=5, jitter=True, timeout: float | None = 20.0):
@@ -109,6 +186,41 @@ class DataTransferApi:
         """
         return self._operations(ids, expand=expand)
 
+    # Experimental: the cancel route is not part of the documented worker API yet,
+    # so cancellation stays private until it is confirmed against the route table of the worker.
+    def _cancel_operations(self, operation_ids: builtins.list[str | Operation | OperationIdResponse]):
+        """Cancel operations on the worker.
+
+        Cancelling an operation stops its transfer, so that it does not consume bandwidth
+        or disk space any longer. Operations that already completed are not affected.
+        Cancellation is best-effort: each request is sent once with a short timeout and
+        failures are logged instead of raised. Returns whether all requests were accepted.
+        Shared handles of coalesced submissions are skipped, see ``CoalescedOperation``.
+
+        Parameters
+        ----------
+        operation_ids: List[str | Operation | OperationIdResponse]
+            List of operation ids.
+        """
+        shared = self._shared_ids(operation_ids)
+        if shared:
+            log.warning(f"Not cancelling {len(shared)} operations shared with coalesced submissions of other callers")
+        accepted = True
+        for ids in chunked(
+            [i for i in self._operation_ids(operation_ids) if i not in shared], self.max_ids_per_request
+        ):
+            try:
+                self._cancel(ids)
+            except Exception as e:
+                log.warning(f"Failed to cancel {len(ids)} operations: {e}")
+                accepted = False
+        return accepted
+
+    def _cancel(self, ids: builtins.list[str]):
+        url = "/operations:cancel"
+        # Not retried, so that giving up on a wait or a task is not held up by an unresponsive worker
+        self.client.session.post(url, json={"ids": ids}, timeout=5)
+
     def storages(self):
         """Get types of storages available on the storage backend."""
         url = "/storage"
@@ -116,84 +228,735 @@ class DataTransferApi:
         json = resp.json()
         return StorageConfigResponse(**json).storage
 
-    def copy(self, operations: list[SrcDst]):
+    def copy(
+        self,
+        operations: Iterable[SrcDst],
+        future: bool = False,
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        priority: int = Priority.normal,
+    ):
         """Get the API response for copying a list of files.
 
         Parameters
         ----------
-        operations: List[SrcDst]
+        operations: Iterable[SrcDst]
+        future: bool
+            Whether to return a ``TransferFuture`` resolved with the final operation. Default is False.
+        batch_size: int | None
+            Maximum number of operations per request. Longer lists are submitted in several
+            requests and an ``OperationBatch`` is returned. Default is None, which submits a single request.
+        max_in_flight: int | None
+            Maximum number of batch requests in flight at once. Default is None, which uses
+            ``max_concurrent_requests``.
+        priority: int
+            Priority of the submission, used when the client limits the number of active submissions.
+            Higher values are admitted first. Default is ``Priority.normal``.
         """
-        return self._exec_operation_req("copy", operations)
+        return self._submit(
+            "copy", operations, future=future, batch_size=batch_size, max_in_flight=max_in_flight, priority=priority
+        )
 
-    def exists(self, operations: list[StoragePath]):
+    def exists(
+        self,
+        operations: Iterable[StoragePath],
+        future: bool = False,
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        priority: int = Priority.normal,
+    ):
         """Check if a path exists.
 
         Parameters
         ----------
-        operations: List[StoragePath]
+        operations: Iterable[StoragePath]
+        future: bool
+            Whether to return a ``TransferFuture`` resolved with the final operation. Default is False.
+        batch_size: int | None
+            Maximum number of operations per request. Longer lists are submitted in several
+            requests and an ``OperationBatch`` is returned. Default is None, which submits a single request.
+        max_in_flight: int | None
+            Maximum number of batch requests in flight at once. Default is None, which uses
+            ``max_concurrent_requests``.
+        priority: int
+            Priority of the submission, used when the client limits the number of active submissions.
+            Higher values are admitted first. Default is ``Priority.normal``.
         """
-        return self._exec_operation_req("exists", operations)
+        return self._submit(
+            "exists", operations, future=future, batch_size=batch_size, max_in_flight=max_in_flight, priority=priority
+        )
 
-    def list(self, operations: list[StoragePath]):
+    def list(
+        self,
+        operations: Iterable[StoragePath],
+        future: bool = False,
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        priority: int = Priority.normal,
+    ):
         """List files in a path.
 
         Parameters
         ----------
-        operations: List[StoragePath]
+        operations: Iterable[StoragePath]
+        future: bool
+            Whether to return a ``TransferFuture`` resolved with the final operation. Default is False.
+        batch_size: int | None
+            Maximum number of operations per request. Longer lists are submitted in several
+            requests and an ``OperationBatch`` is returned. Default is None, which submits a single request.
+        max_in_flight: int | None
+            Maximum number of batch requests in flight at once. Default is None, which uses
+            ``max_concurrent_requests``.
+        priority: int
+            Priority of the submission, used when the client limits the number of active submissions.
+            Higher values are admitted first. Default is ``Priority.normal``.
         """
-        return self._exec_operation_req("list", operations, params={"mode": "extended"})
+        return self._submit(
+            "list",
+            operations,
+            params={"mode": "extended"},
+            future=future,
+            batch_size=batch_size,
+            max_in_flight=max_in_flight,
+            priority=priority,
+        )
 
-    def mkdir(self, operations: builtins.list[StoragePath]):
+    def mkdir(
+        self,
+        operations: Iterable[StoragePath],
+        future: bool = False,
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        priority: int = Priority.normal,
+    ):
         """Create a directory.
 
         Parameters
         ----------
-        operations: List[StoragePath]
+        operations: Iterable[StoragePath]
+        future: bool
+            Whether to return a ``TransferFuture`` resolved with the final operation. Default is False.
+        batch_size: int | None
+            Maximum number of operations per request. Longer lists are submitted in several
+            requests and an ``OperationBatch`` is returned. Default is None, which submits a single request.
+        max_in_flight: int | None
+            Maximum number of batch requests in flight at once. Default is None, which uses
+            ``max_concurrent_requests``.
+        priority: int
+            Priority of the submission, used when the client limits the number of active submissions.
+            Higher values are admitted first. Default is ``Priority.normal``.
         """
-        return self._exec_operation_req("mkdir", operations)
+        return self._submit(
+            "mkdir", operations, future=future, batch_size=batch_size, max_in_flight=max_in_flight, priority=priority
+        )
 
-    def move(self, operations: builtins.list[SrcDst]):
+    def move(
+        self,
+        operations: Iterable[SrcDst],
+        future: bool = False,
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        priority: int = Priority.normal,
+    ):
         """Move a file on the backend storage.
 
         Parameters
         ----------
-        operations: List[SrcDst]
+        operations: Iterable[SrcDst]
+        future: bool
+            Whether to return a ``TransferFuture`` resolved with the final operation. Default is False.
+        batch_size: int | None
+            Maximum number of operations per request. Longer lists are submitted in several
+            requests and an ``OperationBatch`` is returned. Default is None, which submits a single request.
+        max_in_flight: int | None
+            Maximum number of batch requests in flight at once. Default is None, which uses
+            ``max_concurrent_requests``.
+        priority: int
+            Priority of the submission, used when the client limits the number of active submissions.
+            Higher values are admitted first. Default is ``Priority.normal``.
         """
-        return self._exec_operation_req("move", operations)
+        return self._submit(
+            "move", operations, future=future, batch_size=batch_size, max_in_flight=max_in_flight, priority=priority
+        )
 
-    def remove(self, operations: builtins.list[StoragePath]):
+    def remove(
+        self,
+        operations: Iterable[StoragePath],
+        future: bool = False,
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        priority: int = Priority.normal,
+    ):
         """Delete a file.
 
         Parameters
         ----------
-        operations: List[StoragePath]
+        operations: Iterable[StoragePath]
+        future: bool
+            Whether to return a ``TransferFuture`` resolved with the final operation. Default is False.
+        batch_size: int | None
+            Maximum number of operations per request. Longer lists are submitted in several
+            requests and an ``OperationBatch`` is returned. Default is None, which submits a single request.
+        max_in_flight: int | None
+            Maximum number of batch requests in flight at once. Default is None, which uses
+            ``max_concurrent_requests``.
+        priority: int
+            Priority of the submission, used when the client limits the number of active submissions.
+            Higher values are admitted first. Default is ``Priority.normal``.
         """
-        return self._exec_operation_req("remove", operations)
+        return self._submit(
+            "remove", operations, future=future, batch_size=batch_size, max_in_flight=max_in_flight, priority=priority
+        )
 
-    def rmdir(self, operations: builtins.list[StoragePath]):
+    def rmdir(
+        self,
+        operations: Iterable[StoragePath],
+        future: bool = False,
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        priority: int = Priority.normal,
+    ):
         """Delete a directory.
 
         Parameters
         ----------
-        operations: List[StoragePath]
+        operations: Iterable[StoragePath]
+        future: bool
+            Whether to return a ``TransferFuture`` resolved with the final operation. Default is False.
+        batch_size: int | None
+            Maximum number of operations per request. Longer lists are submitted in several
+            requests and an ``OperationBatch`` is returned. Default is None, which submits a single request.
+        max_in_flight: int | None
+            Maximum number of batch requests in flight at once. Default is None, which uses
+            ``max_concurrent_requests``.
+        priority: int
+            Priority of the submission, used when the client limits the number of active submissions.
+            Higher values are admitted first. Default is ``Priority.normal``.
+        """
+        return self._submit(
+            "rmdir", operations, future=future, batch_size=batch_size, max_in_flight=max_in_flight, priority=priority
+        )
+
+    def upload_tree(
+        self,
+        local_dir: str,
+        remote_prefix: str,
+        include: str | builtins.list[str] | None = None,
+        exclude: str | builtins.list[str] | None = None,
+        remote: str = "any",
+        future: bool = False,
+        batch_size: int = 1000,
+        max_in_flight: int | None = None,
+        skip_identical: bool = False,
+        priority: int = Priority.normal,
+    ) -> OperationBatch:
+        """Upload a local directory tree.
+
+        The tree is walked with parallel ``os.scandir`` workers and copy operations are submitted
+        while the walk is still running. The first batch holds a single file so that the transfer
+        starts right away, and batches grow up to ``batch_size`` operations.
+
+        Parameters
+        ----------
+        local_dir: str
+            Local directory to upload.
+        remote_prefix: str
+            Remote directory the tree is uploaded to.
+        include: str | List[str] | None
+            Glob patterns of files to upload, matched against the file name and the path relative
+            to ``local_dir``. Default is None, which uploads all files.
+        exclude: str | List[str] | None
+            Glob patterns of files and directories to skip.
+        remote: str
+            Remote to upload to. Default is ``any``.
+        future: bool
+            Whether to return ``TransferFuture`` objects resolved with the final operations. Default is False.
+        batch_size: int
+            Maximum number of operations per request. Default is 1000.
+        max_in_flight: int | None
+            Maximum number of batch requests in flight at once. Default is None, which uses
+            ``max_concurrent_requests``.
+        skip_identical: bool
+            Skip files whose checksum matches the remote file they would replace. Requires the
+            ``xxhash`` package. Default is False.
+        priority: int
+            Priority of the submission, used when the client limits the number of active submissions.
+            Higher values are admitted first. Default is ``Priority.normal``.
+        """
+        prefix = remote_prefix.rstrip("/")
+        files = walk_files(local_dir, include=include, exclude=exclude, workers=self.walk_workers)
+        operations = (
+            SrcDst(
+                src=StoragePath(path=path, remote="local"),
+                dst=StoragePath(path=f"{prefix}/{rel}" if prefix else rel, remote=remote),
+            )
+            for path, rel in files
+        )
+        if skip_identical:
+            operations = (
+                op for chunk in chunked(operations, batch_size, first=1) for op in self.filter_identical(chunk)
+            )
+        return self._submit(
+            "copy",
+            operations,
+            future=future,
+            batch_size=batch_size,
+            max_in_flight=max_in_flight,
+            first_batch_size=1,
+            priority=priority,
+        )
+
+    def upload_packed(
+        self,
+        local_dir: str,
+        remote_prefix: str,
+        include: str | builtins.list[str] | None = None,
+        exclude: str | builtins.list[str] | None = None,
+        remote: str = "any",
+        pack_threshold: int = default_pack_threshold,
+        pack_size: int = default_pack_size,
+        batch_size: int = 1000,
+        timeout: float | None = None,
+    ) -> builtins.list[Operation]:
+        """Upload a local directory tree, packing small files into archives extracted by the worker.
+
+        Files smaller than ``pack_threshold`` bytes are packed into zip archives of up to ``pack_size``
+        bytes. Each archive is uploaded as a single file, extracted into ``remote_prefix`` and removed.
+        Packs are built and transferred by ``max_concurrent_requests`` threads, so that packing
+        overlaps with the transfer of earlier packs. Larger files are uploaded as they are.
+        The final state of the copy operations of the larger files is returned, followed by the
+        extract operations of the packs.
+
+        This method is experimental. The worker routes extracting the packs are not part of the
+        documented worker API yet and may change.
+
+        Parameters
+        ----------
+        local_dir: str
+            Local directory to upload.
+        remote_prefix: str
+            Remote directory the tree is uploaded to.
+        include: str | List[str] | None
+            Glob patterns of files to upload, matched against the file name and the path relative
+            to ``local_dir``. Default is None, which uploads all files.
+        exclude: str | List[str] | None
+            Glob patterns of files and directories to skip.
+        remote: str
+            Remote to upload to. Default is ``any``.
+        pack_threshold: int
+            Size in bytes below which files are packed. Default is 256 KiB.
+        pack_size: int
+            Maximum total size in bytes of the files of a pack. Default is 64 MiB.
+        batch_size: int
+            Maximum number of copy operations of larger files per request. Default is 1000.
+        timeout: float | None
+            Timeout in seconds for each transfer. Default is None.
+        """
+        prefix = join(remote_prefix)
+        files = local_files(local_dir, include=include, exclude=exclude, workers=self.walk_workers)
+        packer = Packer(pack_size)
+        large = []
+        packs = []
+        with (
+            tempfile.TemporaryDirectory(prefix="dt-pack-") as tmp_dir,
+            concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_concurrent_requests, thread_name_prefix="pack"
+            ) as pool,
+        ):
+            for rel, (size, _) in files.items():
+                path = os.path.join(local_dir, rel)
+                if size >= pack_threshold:
+                    dst = StoragePath(path=join(prefix, rel), remote=remote)
+                    large.append(SrcDst(src=StoragePath(path=path, remote="local"), dst=dst))
+                elif pack := packer.add(path, rel, size):
+                    packs.append(pool.submit(self._upload_pack, pack, tmp_dir, prefix, remote, timeout))
+            if pack := packer.flush():
+                packs.append(pool.submit(self._upload_pack, pack, tmp_dir, prefix, remote, timeout))
+
+            log.info(f"Uploading {len(large)} files and {len(files) - len(large)} small files in {len(packs)} packs")
+            ops = []
+            if large:
+                ops = self.wait_for([self.copy(large, batch_size=batch_size)], timeout=timeout)
+            ops.extend(f.result() for f in packs)
+        return ops
+
+    def _upload_pack(
+        self, files: builtins.list[tuple[str, str]], tmp_dir: str, prefix: str, remote: str, timeout: float | None
+    ) -> Operation:
+        """Pack files into an archive, upload it, extract it on the worker and remove it."""
+        archive = write_archive(files, tmp_dir)
+        dst = join(prefix, os.path.basename(archive))
+        try:
+            src_dst = SrcDst(src=StoragePath(path=archive, remote="local"), dst=StoragePath(path=dst, remote=remote))
+            op = self._wait_for_one(self.copy([src_dst]), timeout=timeout)
+        finally:
+            os.remove(archive)
+        if op.state != OperationState.Succeeded:
+            log.warning(f"Upload of a pack of {len(files)} files failed: {op.error}")
+            return op
+
+        try:
+            r = self._extract(ExtractBody(archive_path=dst, destination=prefix, format=Format.Zip, remote=remote))
+            return self._wait_for_one(r, timeout=timeout)
+        finally:
+            self._remove_pack(dst, remote, timeout)
+
+    def download_dir_as_archive(
+        self,
+        remote_dir: str,
+        local_path: str,
+        format: Format | str = Format.Zip,
+        remote: str = "any",
+        extract: bool = False,
+        include_custom_metadata: bool = False,
+        timeout: float | None = None,
+        scratch_dir: str | None = None,
+    ) -> Operation:
+        """Download a remote directory as a single archive built by the worker.
+
+        The archive is created in ``scratch_dir``, downloaded as one file and removed from the
+        backend storage again. Compared to copying the files one by one, this saves a request and
+        the bookkeeping of a child operation per file. The final state of the download is returned.
+
+        This method is experimental. The worker route building the archive is not part of the
+        documented worker API yet and may change.
+
+        Parameters
+        ----------
+        remote_dir: str
+            Remote directory to download.
+        local_path: str
+            Local path of the archive, or the directory the archive is extracted to if ``extract`` is True.
+        format: Format | str
+            Format of the archive. Default is zip.
+        remote: str
+            Remote the directory is on. Default is ``any``.
+        extract: bool
+            Extract the archive into ``local_path`` and delete it afterwards. Default is False.
+        include_custom_metadata: bool
+            Include custom metadata of the files in the archive. Default is False.
+        timeout: float | None
+            Timeout in seconds for each step. Default is None.
+        scratch_dir: str | None
+            Writable remote directory the archive is temporarily stored in. Default is None, which
+            stores it in ``remote_dir`` itself. In that case, the files of ``remote_dir`` are listed
+            first, so that the archive does not include itself.
+        """
+        format = Format(format)
+        src = join(remote_dir)
+        dst = join(src if scratch_dir is None else scratch_dir, archive_name(format))
+        files = None
+        if scratch_dir is None:
+            files = sorted(self._remote_files(src, remote)) or None
+        body = CreateArchiveBody(
+            src=src, dst=dst, paths=files, format=format, remote=remote, include_custom_metadata=include_custom_metadata
+        )
+        op = self._wait_for_one(self._archive(body), timeout=timeout)
+        if op.state != OperationState.Succeeded:
+            log.warning(f"Failed to archive {remote}:{src}: {op.error}")
+            return op
+
+        local = os.path.join(local_path, posixpath.basename(dst)) if extract else local_path
+        os.makedirs(os.path.dirname(os.path.abspath(local)), exist_ok=True)
+        try:
+            src_dst = SrcDst(src=StoragePath(path=dst, remote=remote), dst=StoragePath(path=local, remote="local"))
+            op = self._wait_for_one(self.copy([src_dst]), timeout=timeout)
+        finally:
+            self._remove_pack(dst, remote, timeout)
+
+        if extract and op.state == OperationState.Succeeded:
+            try:
+                extract_archive(local, local_path, format)
+            finally:
+                os.remove(local)
+        return op
+
+    def _remove_pack(self, path: str, remote: str, timeout: float | None):
+        """Remove a temporary archive from the backend storage, logging failures."""
+        try:
+            rm = self._wait_for_one(self.remove([StoragePath(path=path, remote=remote)]), timeout=timeout)
+        except Exception as e:
+            log.warning(f"Failed to remove pack {remote}:{path}: {e}")
+            return
+        if rm.state != OperationState.Succeeded:
+            log.warning(f"Failed to remove pack {remote}:{path}: {rm.error}")
+
+    def sync(
+        self,
+        local_dir: str,
+        remote_dir: str,
+        direction: str = "upload",
+        remote: str = "any",
+        include: str | builtins.list[str] | None = None,
+        exclude: str | builtins.list[str] | None = None,
+        manifest: str | None = None,
+        refresh: bool = False,
+        batch_size: int = 1000,
+        timeout: float | None = None,
+        checksum: bool = False,
+    ) -> builtins.list[Operation]:
+        """Synchronize a local directory with a remote directory, transferring only changed files.
+
+        Files are compared by size and modification time. The state after each sync is kept in
+        a local manifest, so that a repeated upload neither lists the remote directory nor
+        transfers unchanged files. Deleted files are not removed from the other side.
+        The final state of the copy operations is returned, which is empty if nothing changed.
+
+        Parameters
+        ----------
+        local_dir: str
+            Local directory.
+        remote_dir: str
+            Remote directory.
+        direction: str
+            Either ``upload`` or ``download``. Default is ``upload``.
+        remote: str
+            Remote the directory is on. Default is ``any``.
+        include: str | List[str] | None
+            Glob patterns of files to sync, matched against the file name and the relative path.
+            Default is None, which syncs all files.
+        exclude: str | List[str] | None
+            Glob patterns of files and directories to skip.
+        manifest: str | None
+            Path of the manifest file. Default is None, which uses ``.dt_sync_manifest.json`` in ``local_dir``.
+        refresh: bool
+            List the remote directory on upload even if a manifest exists. Default is False.
+        batch_size: int
+            Maximum number of files per copy operation. Default is 1000.
+        timeout: float | None
+            Timeout in seconds for the transfer. Default is None.
+        checksum: bool
+            On upload, also compare checksums of changed files with the remote files and skip
+            identical ones, for example files that were only touched. Requires the ``xxhash`` package.
+            Default is False.
         """
-        return self._exec_operation_req("rmdir", operations)
+        if direction not in directions:
+            raise ValueError(f"Invalid sync direction {direction!r}, expected one of {directions}")
+
+        manifest = SyncManifest(
+            manifest or os.path.join(local_dir, default_manifest_name), f"{remote}:{join(remote_dir)}"
+        )
+        if direction == "upload":
+            local = local_files(local_dir, include=include, exclude=exclude, workers=self.walk_workers)
+            remote_files = None if manifest.loaded and not refresh else self._remote_files(remote_dir, remote)
+            changed = plan_upload(local, manifest, remote_files)
+        else:
+            local = None
+            remote_files = filter_remote(self._remote_files(remote_dir, remote), include=include, exclude=exclude)
+            changed = plan_download(local_dir, remote_files, manifest)
+
+        plan = SyncPlan(direction, local_dir, remote_dir, remote, manifest, local, remote_files, changed)
+        if checksum and direction == "upload" and changed:
+            plan.keep(self.filter_identical(plan.operations()))
+        log.info(f"Sync {direction} of {local_dir}: {len(plan.changed)} changed files")
+        if not plan.changed:
+            plan.finish([], [], batch_size)
+            return []
+
+        batch = self.copy(plan.operations(), batch_size=batch_size)
+        ops = self.wait_for([batch], timeout=timeout)
+        plan.finish(batch.ids, ops, batch_size)
+        return ops
+
+    def filter_identical(self, operations: Iterable[SrcDst]) -> builtins.list[SrcDst]:
+        """Drop uploads whose local file has the same checksum as the remote file it would replace.
+
+        The checksums of the destinations are fetched with a single ``get_metadata`` operation and
+        the local files are hashed in parallel. Local checksums are cached in ``checksum_cache``
+        by inode, size and modification time, so that unchanged files are not hashed again.
+        Operations that are not uploads of local files are kept as they are.
+
+        Parameters
+        ----------
+        operations: Iterable[SrcDst]
+            Copy operations to filter.
+        """
+        operations = builtins.list(operations)
+        uploads = [op for op in operations if op.src.remote == "local"]
+        if not uploads:
+            return operations
+
+        op = self._wait_for_one(self.get_metadata([u.dst.path for u in uploads]))
+        remote = remote_checksums(op, [u.dst.path for u in uploads])
+        candidates = [u.src.path for u in uploads if remote.get(u.dst.path)]
+        local = hash_files(candidates, cache=self.checksum_cache, workers=self.hash_workers)
+        self.checksum_cache.save()
+
+        kept = [op for op in operations if not identical(op, local, remote)]
+        log.debug(f"Skipping {len(operations) - len(kept)} of {len(operations)} uploads with identical checksums")
+        return kept
+
+    def _remote_files(self, remote_dir: str, remote: str) -> dict[str, tuple[int | None, float | None]]:
+        """List a remote directory recursively, one ``list`` operation per directory level."""
+        files = {}
+        dirs = [""]
+        while dirs:
+            paths = [join(remote_dir, d) for d in dirs]
+            r = self.list([StoragePath(path=p, remote=remote) for p in paths])
+            op = self._wait_for_one(r)
+            if op.state != OperationState.Succeeded:
+                # Most likely the remote directory does not exist yet
+                log.debug(f"Listing {remote}:{remote_dir} failed: {op.error}")
+                break
+            dirs = collect_listing(op.result, dirs, paths, remote, files)
+        return files
+
+    def as_future(self, operation: OperationIdResponse) -> TransferFuture:
+        """Get a future resolved with the final state of a submitted operation.
+
+        The operation is polled by the operation watcher shared by all APIs of the client.
+
+        Parameters
+        ----------
+        operation: OperationIdResponse
+            Response of a submitted operation.
+        """
+        handler = self.wait_handler_factory()
+        expand = getattr(handler.Meta, "expand_group", False) if hasattr(handler, "Meta") else False
+        shared = getattr(operation, "shared", False)
+        return TransferFuture(
+            operation,
+            self.operation_watcher,
+            handler=handler,
+            # Shared operations are scoped to the entries of the caller from their children
+            expand=expand or shared,
+            # Cancelling a shared operation would stop the transfers of other callers too
+            cancel_operations=None if shared else self._cancel_operations,
+        )
+
+    def _submit(
+        self,
+        storage_operation: str,
+        operations: Iterable[StoragePath] | Iterable[SrcDst],
+        params: dict | None = None,
+        future: bool = False,
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        first_batch_size: int | None = None,
+        priority: int = Priority.normal,
+    ):
+        if batch_size is None and self.coalescer is not None:
+            r = self._coalesce(storage_operation, operations, params, priority)
+            return self.as_future(r) if future else r
+        if batch_size is None:
+            r = self._send(storage_operation, single_pass(operations), params, priority)
+            return self.as_future(r) if future else r
+
+        max_in_flight = max_in_flight or self.max_concurrent_requests
+        responses = self._submit_batches(
+            storage_operation,
+            operations,
+            params,
+            batch_size,
+            max_in_flight,
+            first_batch_size=first_batch_size,
+            priority=priority,
+        )
+        return OperationBatch([self.as_future(r) for r in responses] if future else responses)
+
+    def _submit_batches(
+        self,
+        storage_operation: str,
+        operations: Iterable[StoragePath] | Iterable[SrcDst],
+        params: dict | None,
+        batch_size: int,
+        max_in_flight: int,
+        first_batch_size: int | None = None,
+        priority: int = Priority.normal,
+    ) -> builtins.list[OperationIdResponse]:
+        """Submit operations in chunks of ``batch_size``, with at most ``max_in_flight`` requests at once.
+
+        Chunks are serialized only when their request is sent, so that memory use stays flat
+        and the worker can start on the first chunks while the remaining ones are prepared.
+        If a chunk fails, the chunks accepted by the worker are cancelled before the error is raised.
+        """
+        responses = {}
+        in_flight = {}
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="submit") as pool:
+                for index, chunk in enumerate(chunked(operations, batch_size, first=first_batch_size)):
+                    if len(in_flight) >= max_in_flight:
+                        done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                        for f in done:
+                            responses[in_flight.pop(f)] = f.result()
+                    f = pool.submit(self._send, storage_operation, chunk, params, priority)
+                    in_flight[f] = index
+                for f in concurrent.futures.as_completed(in_flight):
+                    responses[in_flight[f]] = f.result()
+        except Exception:
+            # Leaving the pool waited for the requests in flight
+            responses.update((i, f.result()) for f, i in in_flight.items() if f.exception() is None)
+            self._cancel_accepted(storage_operation, builtins.list(responses.values()))
+            raise
+
+        log.debug(f"Submitted {storage_operation} operations in {len(responses)} batches")
+        return [responses[i] for i in range(len(responses))]
+
+    def _cancel_accepted(self, storage_operation: str, responses: builtins.list[OperationIdResponse]):
+        """Cancel the batches accepted by the worker when the submission of another batch failed."""
+        if not responses:
+            return
+        log.warning(
+            f"Submission of {storage_operation} operations failed, cancelling {len(responses)} accepted batches"
+        )
+        self._cancel_operations(responses)
+
+    def _coalesce(
+        self,
+        storage_operation: str,
+        operations: Iterable[StoragePath] | Iterable[SrcDst],
+        params: dict | None,
+        priority: int,
+    ) -> CoalescedOperation:
+        """Send operations as part of a merged request with the concurrent submissions of the same kind."""
+        key = (storage_operation, priority, repr(sorted(params.items())) if params else None)
+        return self.coalescer.submit(
+            key,
+            builtins.list(operations),
+            lambda entries: self._send(storage_operation, entries, params, priority),
+        )
+
+    def _send(
+        self,
+        storage_operation: str,
+        operations: Iterable[StoragePath] | Iterable[SrcDst],
+        params: dict | None,
+        priority: int,
+    ) -> OperationIdResponse:
+        """Send a submission request, once admitted by the scheduler of the client if there is one."""
+        scheduler = self.scheduler
+        if scheduler is None:
+            return self._exec_operation_req(storage_operation, operations, params=params)
+        cost = None
+        if scheduler.needs_cost:
+            if not isinstance(operations, Sized):
+                operations = builtins.list(operations)
+            cost = batch_cost(operations, count_bytes=scheduler.needs_bytes)
+        return scheduler.submit(
+            priority, lambda: self._exec_operation_req(storage_operation, operations, params=params), cost=cost
+        )
 
     @retry()
     def _exec_operation_req(
         self,
         storage_operation: str,
-        operations: builtins.list[StoragePath] | builtins.list[SrcDst],
+        operations: Iterable[StoragePath] | Iterable[SrcDst],
         params: dict | None = None,
     ):
         url = f"/storage:{storage_operation}"
-        payload = {"operations": [operation.model_dump(mode=self.dump_mode) for operation in operations]}
-        resp = self.client.session.post(url, json=payload, params=params)
+        # Operations are serialized while the body is sent, instead of building the whole payload in memory
+        content = JsonArrayBody("operations", operations, dump_model(self.dump_mode))
+        resp = self.client.session.post(
+            url, content=content, params=params, headers={"Content-Type": "application/json"}
+        )
         json = resp.json()
         r = OperationIdResponse(**json)
         return r
 
     def _operations(self, ids: builtins.list[str], expand: bool = False):
+        return OperationsResponse(operations=self._operations_raw(ids, expand=expand)).operations
+
+    def _operations_raw(self, ids: builtins.list[str], expand: bool = False):
         url = "/operations"
         params = {"ids": ids}
         if expand:
@@ -202,7 +965,22 @@ class DataTransferApi:
         # If its not, we want to know when its not working properly with some timeout messages.
         resp = self.client.session.get(url, params=params, timeout=2)
         json = resp.json()
-        return OperationsResponse(**json).operations
+        return json.get("operations") or []
+
+    def _fetch_operations(self, ids: builtins.list[str], expand: bool = False, raw: bool = False):
+        """Get operations, splitting large ID lists into bounded concurrent requests.
+
+        With ``raw``, the operations are returned as dictionaries as received from the worker.
+        """
+        fetch = self._operations_raw if raw else self._operations
+        chunks = list(chunked(ids, self.max_ids_per_request))
+        if len(chunks) <= 1:
+            return fetch(ids, expand=expand) if ids else []
+
+        workers = min(len(chunks), self.max_concurrent_requests)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="operations") as pool:
+            results = pool.map(lambda chunk: fetch(chunk, expand=expand), chunks)
+            return [op for ops in results for op in ops or []]
 
     @retry()
     def check_permissions(self, permissions: builtins.list[RoleAssignment]):
@@ -265,7 +1043,7 @@ class DataTransferApi:
         paths: List[str | StoragePath]
         """
         url = "/metadata:get"
-        paths = [p if isinstance(p, str) else p.path for p in paths]
+        paths = paths.paths if isinstance(paths, PathBatch) else [p if isinstance(p, str) else p.path for p in paths]
         payload = {"paths": paths}
         resp = self.client.session.post(url, json=payload)
         json = resp.json()
@@ -287,22 +1065,55 @@ class DataTransferApi:
         json = resp.json()
         return OperationIdResponse(**json)
 
+    # Experimental: the archive and extract routes are not part of the documented worker API yet,
+    # so they stay private until they are confirmed against the route table of the worker.
+    @retry()
+    def _archive(self, body: CreateArchiveBody):
+        """Create an archive of files on the backend storage.
+
+        Parameters
+        ----------
+        body: CreateArchiveBody
+            Source folder, files, destination and format of the archive.
+        """
+        url = "/storage:archive"
+        resp = self.client.session.post(url, json=body.model_dump(mode=self.dump_mode, exclude_none=True))
+        json = resp.json()
+        return OperationIdResponse(**json)
+
+    @retry()
+    def _extract(self, body: ExtractBody):
+        """Extract an archive on the backend storage.
+
+        Parameters
+        ----------
+        body: ExtractBody
+            Path and format of the archive and destination folder of the extracted files.
+        """
+        url = "/storage:extract"
+        resp = self.client.session.post(url, json=body.model_dump(mode=self.dump_mode, exclude_none=True))
+        json = resp.json()
+        return OperationIdResponse(**json)
+
     # Short operations need a short time, but some larger operations will be spammed
     # by too many calls over their lifetime of minutes, so work up to at least 5 seconds by default.
     def wait_for(
         self,
-        operation_ids: builtins.list[str | Operation | OperationIdResponse],
+        operation_ids: builtins.list[str | Operation | OperationIdResponse | TransferFuture | OperationBatch],
         timeout: float | None = None,
         interval: float = 0.1,
         cap: float = 5.0,
         raise_on_error: bool = False,
         handler: Callable[[builtins.list[Operation]], None] = None,
+        shared: bool | None = None,
+        polling: BackoffPolling | None = None,
+        cancel_on_timeout: bool = False,
     ):
         """Wait for operations to complete.
 
         Parameters
         ----------
-        operation_ids: List[str | Operation | OperationIdResponse]
+        operation_ids: List[str | Operation | OperationIdResponse | TransferFuture | OperationBatch]
             List of operation ids.
         timeout: float | None
             Timeout in seconds. Default is None.
@@ -314,20 +1125,188 @@ class DataTransferApi:
             Raise an exception if an error occurs. Default is False.
         operation_handler: Callable[[builtins.list[Operation]], None]
             A callable that will be called with the list of operations when they are fetched.
+            Operations that already completed are not fetched again.
+        shared: bool | None
+            Whether to wait using the operation watcher shared by all waiters of the client,
+            in which case the polling cadence of the watcher applies and ``interval`` and ``cap`` are ignored.
+            Default is None, which uses the ``shared_wait`` setting of the client unless ``polling`` is given.
+        polling: BackoffPolling | None
+            Strategy deciding how long to wait between polls, for example ``ProgressRatePolling``.
+            It cannot be combined with ``shared=True``. Default is None, which uses exponential backoff
+            based on ``interval`` and ``cap``.
+        cancel_on_timeout: bool
+            Cancel the operations that are still running on the worker when the timeout is reached.
+            Experimental, the cancel route of the worker is not confirmed yet. Default is False.
         """
         if handler is None:
             handler = self.wait_handler_factory()
 
+        handles = self._handles(operation_ids)
+        shared_ids = self._shared_ids(handles)
+        operation_ids = self._operation_ids(handles)
+        expand = getattr(handler.Meta, "expand_group", False) if hasattr(handler, "Meta") else False
+        tracker = GroupTracker(self._fetch_operations) if self._delta_group(handler) else None
+
+        if shared and polling is not None:
+            raise ValueError("A polling strategy cannot be used with the shared operation watcher")
+        if shared is None:
+            shared = self.client.shared_wait and polling is None
+        if polling is None:
+            polling = BackoffPolling(interval=interval, cap=cap)
+
+        latest = {}
+        try:
+            if shared:
+                self._wait_for_shared(operation_ids, timeout, raise_on_error, handler, expand, latest)
+                return self._scope_shared(handles, latest)
+
+            for ops in self._poll_operations(
+                operation_ids, timeout, raise_on_error, handler, expand, polling, tracker=tracker
+            ):
+                latest.update((op.id, op) for op in ops)
+        except TimeoutError:
+            if cancel_on_timeout:
+                self._cancel_unfinished(operation_ids, latest, shared_ids)
+            raise
+        return self._scope_shared(handles, latest)
+
+    def iter_completed(
+        self,
+        operation_ids: builtins.list[str | Operation | OperationIdResponse | TransferFuture | OperationBatch],
+        timeout: float | None = None,
+        interval: float = 0.1,
+        cap: float = 5.0,
+        raise_on_error: bool = False,
+        handler: Callable[[builtins.list[Operation]], None] = None,
+        polling: BackoffPolling | None = None,
+    ):
+        """Yield each operation as soon as it completes.
+
+        Operations are yielded in the order they reach a final state, so that results can be
+        processed while the remaining operations are still running.
+
+        Parameters
+        ----------
+        operation_ids: List[str | Operation | OperationIdResponse | TransferFuture | OperationBatch]
+            List of operation ids.
+        timeout: float | None
+            Timeout in seconds for all operations to complete. Default is None.
+        interval: float
+            Interval in seconds. Default is 0.1.
+        cap: float
+            The maximum backoff value used to calculate the next wait time. Default is 5.0.
+        raise_on_error: bool
+            Raise an exception if an error occurs. Default is False.
+        handler: Callable[[builtins.list[Operation]], None]
+            A callable that will be called with the list of operations when they are fetched.
+        polling: BackoffPolling | None
+            Strategy deciding how long to wait between polls. Default is None, which uses
+            exponential backoff based on ``interval`` and ``cap``.
+        """
+        if handler is None:
+            handler = self.wait_handler_factory()
+
+        operation_ids = self._operation_ids(operation_ids)
+        expand = getattr(handler.Meta, "expand_group", False) if hasattr(handler, "Meta") else False
+        tracker = GroupTracker(self._fetch_operations) if self._delta_group(handler) else None
+        if polling is None:
+            polling = BackoffPolling(interval=interval, cap=cap)
+
+        for ops in self._poll_operations(
+            operation_ids, timeout, raise_on_error, handler, expand, polling, tracker=tracker
+        ):
+            for op in ops:
+                if op.state in [OperationState.Succeeded, OperationState.Failed]:
+                    yield op
+
+    def _delta_group(self, handler) -> bool:
+        return getattr(handler.Meta, "delta_group", False) if hasattr(handler, "Meta") else False
+
+    def _cancel_unfinished(self, operation_ids: builtins.list[str], latest: dict[str, Operation], shared_ids: set[str]):
+        ids = [
+            i
+            for i in operation_ids
+            if i not in shared_ids
+            and (i not in latest or latest[i].state not in [OperationState.Succeeded, OperationState.Failed])
+        ]
+        if not ids:
+            return
+        log.info(f"Cancelling {len(ids)} unfinished operations ...")
+        self._cancel_operations(ids)
+
+    def _wait_for_one(self, operation: OperationIdResponse, timeout: float | None = None) -> Operation:
+        """Wait for a single operation, raising a ``ClientError`` if its final state cannot be determined."""
+        ops = self.wait_for([operation], timeout=timeout, raise_on_error=True)
+        if not ops:
+            raise ClientError(f"Failed to get the state of operation {operation.id}")
+        return ops[0]
+
+    def _shared_ids(self, operation_ids) -> set[str]:
+        """Get the IDs of handles shared with the coalesced submissions of other callers."""
+        return {op.id for op in self._handles(operation_ids) if getattr(op, "shared", False)}
+
+    def _handles(self, operation_ids) -> builtins.list:
+        """Get the operation IDs and handles, with the handles of batches listed one by one."""
         if not isinstance(operation_ids, list):
             operation_ids = [operation_ids]
-        operation_ids = [op.id if isinstance(op, Operation | OperationIdResponse) else op for op in operation_ids]
+        handles = []
+        for op in operation_ids:
+            if isinstance(op, OperationBatch):
+                handles.extend(op)
+            else:
+                handles.append(op)
+        return handles
+
+    def _operation_ids(self, operation_ids) -> builtins.list[str]:
+        return [op if isinstance(op, str) else op.id for op in self._handles(operation_ids)]
+
+    def _scope_shared(self, handles: builtins.list, latest: dict[str, Operation]) -> builtins.list[Operation]:
+        """Get the final operations of the handles, with shared handles scoped to the entries of their caller."""
+        shared = {op.id for op in handles if getattr(op, "shared", False) and op.id in latest}
+        if shared:
+            try:
+                # The children are only listed by expanded operations
+                merged = self._fetch_operations(builtins.list(shared), expand=True)
+                latest = {**latest, **{op.id: op for op in merged}}
+            except Exception as e:
+                log.warning(f"Failed to get the children of {len(shared)} coalesced operations: {e}")
+        ops = []
+        for op in handles:
+            op_id = op if isinstance(op, str) else op.id
+            if op_id in latest:
+                ops.append(op.scope(latest[op_id]) if getattr(op, "shared", False) else latest[op_id])
+        return ops
+
+    def _poll_operations(
+        self,
+        operation_ids: builtins.list[str],
+        timeout: float | None,
+        raise_on_error: bool,
+        handler,
+        expand: bool,
+        polling: BackoffPolling,
+        tracker: GroupTracker | None = None,
+    ):
+        """Poll operations until all of them are final, yielding the operations fetched by every poll.
+
+        Only operations that are not final yet are queried again. With a ``tracker``, operation
+        groups are polled by delta instead of requesting the whole expanded group every time.
+        """
         start = time.time()
         attempt = 0
+        completed = set()
         while True:
             attempt += 1
+            ops = []
+            done = False
             try:
-                expand = getattr(handler.Meta, "expand_group", False) if hasattr(handler, "Meta") else False
-                ops = self._operations(operation_ids, expand=expand)
+                pending = [i for i in operation_ids if i not in completed]
+                if tracker is not None:
+                    ops = tracker.poll(pending)
+                else:
+                    ops = self._fetch_operations(pending, expand=expand)
+                completed.update(op.id for op in ops if op.state in [OperationState.Succeeded, OperationState.Failed])
+
                 if handler is not None:
                     try:
                         handler(ops)
@@ -335,9 +1314,8 @@ class DataTransferApi:
                         log.warning(f"Handler error: {e}")
                         log.debug(traceback.format_exc())
 
-                if all(op.state in [OperationState.Succeeded, OperationState.Failed] for op in ops):
-                    log.debug("All operations have completed.")
-                    break
+                # Operations missing from the response are still pending
+                done = all(i in completed for i in operation_ids)
             except (TimeoutException, TimeoutError):
                 log.debug("Operations status call timed out, retrying...")
             except Exception as e:
@@ -345,13 +1323,44 @@ class DataTransferApi:
                 if raise_on_error:
                     raise
                 else:
-                    break
+                    return
+
+            yield ops
+            if done:
+                log.debug("All operations have completed.")
+                return
 
             if timeout is not None and (time.time() - start) > timeout:
                 raise TimeoutError("Timeout waiting for operations to complete")
 
-            # TODO: Adjust based on transfer speed and file size
-            duration = get_expo_backoff(interval, attempts=attempt, cap=cap, jitter=True)
+            duration = polling.next_interval(attempt, ops)
             time.sleep(duration)
 
-        return ops
+    def _wait_for_shared(
+        self,
+        operation_ids: builtins.list[str],
+        timeout: float | None,
+        raise_on_error: bool,
+        handler: Callable[[builtins.list[Operation]], None],
+        expand: bool,
+        latest: dict[str, Operation],
+    ):
+        watcher = self.operation_watcher
+        watch = watcher.watch(operation_ids, expand=expand, handler=handler)
+        try:
+            ops = watch.future.result(timeout=timeout)
+            log.debug("All operations have completed.")
+            return ops
+        except concurrent.futures.TimeoutError as ex:
+            raise TimeoutError("Timeout waiting for operations to complete") from ex
+        except concurrent.futures.CancelledError:
+            log.debug("Operation watcher was stopped.")
+            return watch.ops
+        except Exception as e:
+            log.debug(f"Error getting operations: {e}")
+            if raise_on_error:
+                raise
+            return watch.ops
+        finally:
+            latest.update((op.id, op) for op in watch.ops)
+            watcher.unwatch(watch)
@@ -28,8 +28,12 @@ data transfer operations asynchronously, managing resources, and handling client
 
 import asyncio
 import builtins
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable, Sized
 import logging
+import os
+import posixpath
+import shutil
+import tempfile
 import textwrap
 import time
 import traceback
@@ -39,15 +43,19 @@ from httpx import TimeoutException
 import humanize as hz
 
 from ..client import AsyncClient
-from ..exceptions import TimeoutError
+from ..exceptions import ClientError, TimeoutError
 from ..models import (
     CheckPermissionsResponse,
+    CreateArchiveBody,
     DataAssignment,
+    ExtractBody,
+    Format,
     GetPermissionsResponse,
     Operation,
     OperationIdResponse,
     OperationsResponse,
     OperationState,
+    PathBatch,
     RoleAssignment,
     RoleQuery,
     SetMetadataRequest,
@@ -56,9 +64,39 @@ from ..models import (
     StorageConfigResponse,
     StoragePath,
 )
-from ..utils.jitter import get_expo_backoff
+from ..utils.checksum import ChecksumCache, hash_files, identical, remote_checksums
+from ..utils.iterables import achunked, chunked
+from ..utils.stream import AsyncJsonArrayBody, dump_model, single_pass
+from ..utils.walk import awalk_files
+from .batch import OperationBatch
+from .coalesce import CoalescedOperation
+from .futures import AsyncTransferFuture
+from .groups import AsyncGroupTracker, GroupTracker
 from .handler import AsyncWaitHandler
+from .packing import (
+    Packer,
+    archive_name,
+    default_pack_size,
+    default_pack_threshold,
+    extract_archive,
+    write_archive,
+)
+from .polling import BackoffPolling
 from .retry import retry
+from .scheduler import AsyncPriorityScheduler, Priority, batch_cost
+from .sync import (
+    SyncManifest,
+    SyncPlan,
+    collect_listing,
+    default_manifest_name,
+    directions,
+    filter_remote,
+    join,
+    local_files,
+    plan_download,
+    plan_upload,
+)
+from .watcher import AsyncOperationWatcher
 
 log = logging.getLogger(__name__)
 
@@ -71,6 +109,39 @@ class AsyncDataTransferApi:
         self.dump_mode = "json"
         self.client = client
         self.wait_handler_factory = AsyncWaitHandler
+        # Bounds for polling the status of many operations at once
+        self.max_ids_per_request = 200
+        self.max_concurrent_requests = 4
+        # Number of directories scanned in parallel by upload_tree
+        self.walk_workers = 8
+        # Checksums of local files compared against remote files to skip identical uploads
+        self.checksum_cache = ChecksumCache()
+        self.hash_workers = 8
+        # AsyncCoalescer merging small submissions of concurrent tasks into one request, disabled if None
+        self.coalescer = None
+
+    @property
+    def operation_watcher(self) -> AsyncOperationWatcher:
+        """Operation watcher shared by all APIs of the client. It is created on first use."""
+        if self.client.operation_watcher is None:
+            self.client.operation_watcher = AsyncOperationWatcher(self._fetch_operations)
+        return self.client.operation_watcher
+
+    @property
+    def scheduler(self) -> AsyncPriorityScheduler | None:
+        """Scheduler shared by all APIs of the client, if the client limits the submissions in flight."""
+        client = self.client
+        if client.max_active_submissions is None and client.limits is None and not client.remote_limits:
+            return None
+        if client.scheduler is None:
+            client.scheduler = AsyncPriorityScheduler(
+                self.operation_watcher,
+                client.max_active_submissions,
+                limits=client.limits,
+                remote_limits=client.remote_limits,
+                block=client.block_on_limits,
+            )
+        return client.scheduler
 
     @retry()
     async def status(self, wait=False, sleep=5, jitter=True, timeout: float | None = 20.0):
@@ -101,6 +172,41 @@ class AsyncDataTransferApi:
         """Provides an async interface to get a list of operations by their IDs."""
         return await self._operations(ids, expand=expand)
 
+    # Experimental: the cancel route is not part of the documented worker API yet,
+    # so cancellation stays private until it is confirmed against the route table of the worker.
+    async def _cancel_operations(self, operation_ids: builtins.list[str | Operation | OperationIdResponse]):
+        """Cancel operations on the worker.
+
+        Cancelling an operation stops its transfer, so that it does not consume bandwidth
+        or disk space any longer. Operations that already completed are not affected.
+        Cancellation is best-effort: each request is sent once with a short timeout and
+        failures are logged instead of raised. Returns whether all requests were accepted.
+        Shared handles of coalesced submissions are skipped, see ``CoalescedOperation``.
+
+        Parameters
+        ----------
+        operation_ids: List[str | Operation | OperationIdResponse]
+            List of operation ids.
+        """
+        shared = self._shared_ids(operation_ids)
+        if shared:
+            log.warning(f"Not cancelling {len(shared)} operations shared with coalesced submissions of other callers")
+        accepted = True
+        for ids in chunked(
+            [i for i in self._operation_ids(operation_ids) if i not in shared], self.max_ids_per_request
+        ):
+            try:
+                await self._cancel(ids)
+            except Exception as e:
+                log.warning(f"Failed to cancel {len(ids)} operations: {e}")
+                accepted = False
+        return accepted
+
+    async def _cancel(self, ids: builtins.list[str]):
+        url = "/operations:cancel"
+        # Not retried, so that giving up on a wait or a task is not held up by an unresponsive worker
+        await self.client.session.post(url, json={"ids": ids}, timeout=5)
+
     async def storages(self):
         """Provides an async interface to get the list of storage configurations."""
         url = "/storage"
@@ -108,52 +214,773 @@ class AsyncDataTransferApi:
         json = resp.json()
         return StorageConfigResponse(**json).storage
 
-    async def copy(self, operations: list[SrcDst]):
-        """Provides an async interface to copy a list of ``SrcDst`` objects."""
-        return await self._exec_async_operation_req("copy", operations)
+    async def copy(
+        self,
+        operations: Iterable[SrcDst] | AsyncIterable[SrcDst],
+        future: bool = False,
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        priority: int = Priority.normal,
+    ):
+        """Provides an async interface to copy a list of ``SrcDst`` objects.
+
+        Parameters
+        ----------
+        future: bool
+            Whether to return an ``AsyncTransferFuture`` resolved with the final operation. Default is False.
+        batch_size: int | None
+            Maximum number of operations per request. Longer lists are submitted in several
+            requests and an ``OperationBatch`` is returned. Default is None, which submits a single request.
+        max_in_flight: int | None
+            Maximum number of batch requests in flight at once. Default is None, which uses
+            ``max_concurrent_requests``.
+        priority: int
+            Priority of the submission, used when the client limits the number of active submissions.
+            Higher values are admitted first. Default is ``Priority.normal``.
+        """
+        return await self._submit(
+            "copy", operations, future=future, batch_size=batch_size, max_in_flight=max_in_flight, priority=priority
+        )
+
+    async def exists(
+        self,
+        operations: Iterable[StoragePath] | AsyncIterable[StoragePath],
+        future: bool = False,
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        priority: int = Priority.normal,
+    ):
+        """Provides an async interface to check if a list of ``StoragePath`` objects exist.
+
+        Parameters
+        ----------
+        future: bool
+            Whether to return an ``AsyncTransferFuture`` resolved with the final operation. Default is False.
+        batch_size: int | None
+            Maximum number of operations per request. Longer lists are submitted in several
+            requests and an ``OperationBatch`` is returned. Default is None, which submits a single request.
+        max_in_flight: int | None
+            Maximum number of batch requests in flight at once. Default is None, which uses
+            ``max_concurrent_requests``.
+        priority: int
+            Priority of the submission, used when the client limits the number of active submissions.
+            Higher values are admitted first. Default is ``Priority.normal``.
+        """
+        return await self._submit(
+            "exists", operations, future=future, batch_size=batch_size, max_in_flight=max_in_flight, priority=priority
+        )
+
+    async def list(
+        self,
+        operations: Iterable[StoragePath] | AsyncIterable[StoragePath],
+        future: bool = False,
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        priority: int = Priority.normal,
+    ):
+        """Provides an async interface to get a list of ``StoragePath`` objects.
+
+        Parameters
+        ----------
+        future: bool
+            Whether to return an ``AsyncTransferFuture`` resolved with the final operation. Default is False.
+        batch_size: int | None
+            Maximum number of operations per request. Longer lists are submitted in several
+            requests and an ``OperationBatch`` is returned. Default is None, which submits a single request.
+        max_in_flight: int | None
+            Maximum number of batch requests in flight at once. Default is None, which uses
+            ``max_concurrent_requests``.
+        priority: int
+            Priority of the submission, used when the client limits the number of active submissions.
+            Higher values are admitted first. Default is ``Priority.normal``.
+        """
+        return await self._submit(
+            "list", operations, future=future, batch_size=batch_size, max_in_flight=max_in_flight, priority=priority
+        )
+
+    async def mkdir(
+        self,
+        operations: Iterable[StoragePath] | AsyncIterable[StoragePath],
+        future: bool = False,
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        priority: int = Priority.normal,
+    ):
+        """Provides an async interface to create a list of directories in the remote backend.
+
+        Parameters
+        ----------
+        future: bool
+            Whether to return an ``AsyncTransferFuture`` resolved with the final operation. Default is False.
+        batch_size: int | None
+            Maximum number of operations per request. Longer lists are submitted in several
+            requests and an ``OperationBatch`` is returned. Default is None, which submits a single request.
+        max_in_flight: int | None
+            Maximum number of batch requests in flight at once. Default is None, which uses
+            ``max_concurrent_requests``.
+        priority: int
+            Priority of the submission, used when the client limits the number of active submissions.
+            Higher values are admitted first. Default is ``Priority.normal``.
+        """
+        return await self._submit(
+            "mkdir", operations, future=future, batch_size=batch_size, max_in_flight=max_in_flight, priority=priority
+        )
+
+    async def move(
+        self,
+        operations: Iterable[SrcDst] | AsyncIterable[SrcDst],
+        future: bool = False,
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        priority: int = Priority.normal,
+    ):
+        """Provides an async interface to move a list of ``SrcDst`` objects in the remote backend.
+
+        Parameters
+        ----------
+        future: bool
+            Whether to return an ``AsyncTransferFuture`` resolved with the final operation. Default is False.
+        batch_size: int | None
+            Maximum number of operations per request. Longer lists are submitted in several
+            requests and an ``OperationBatch`` is returned. Default is None, which submits a single request.
+        max_in_flight: int | None
+            Maximum number of batch requests in flight at once. Default is None, which uses
+            ``max_concurrent_requests``.
+        priority: int
+            Priority of the submission, used when the client limits the number of active submissions.
+            Higher values are admitted first. Default is ``Priority.normal``.
+        """
+        return await self._submit(
+            "move", operations, future=future, batch_size=batch_size, max_in_flight=max_in_flight, priority=priority
+        )
+
+    async def remove(
+        self,
+        operations: Iterable[StoragePath] | AsyncIterable[StoragePath],
+        future: bool = False,
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        priority: int = Priority.normal,
+    ):
+        """Provides an async interface to remove files in the remote backend.
+
+        Parameters
+        ----------
+        future: bool
+            Whether to return an ``AsyncTransferFuture`` resolved with the final operation. Default is False.
+        batch_size: int | None
+            Maximum number of operations per request. Longer lists are submitted in several
+            requests and an ``OperationBatch`` is returned. Default is None, which submits a single request.
+        max_in_flight: int | None
+            Maximum number of batch requests in flight at once. Default is None, which uses
+            ``max_concurrent_requests``.
+        priority: int
+            Priority of the submission, used when the client limits the number of active submissions.
+            Higher values are admitted first. Default is ``Priority.normal``.
+        """
+        return await self._submit(
+            "remove", operations, future=future, batch_size=batch_size, max_in_flight=max_in_flight, priority=priority
+        )
+
+    async def rmdir(
+        self,
+        operations: Iterable[StoragePath] | AsyncIterable[StoragePath],
+        future: bool = False,
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        priority: int = Priority.normal,
+    ):
+        """Provides an async interface to remove directories in the remote backend.
+
+        Parameters
+        ----------
+        future: bool
+            Whether to return an ``AsyncTransferFuture`` resolved with the final operation. Default is False.
+        batch_size: int | None
+            Maximum number of operations per request. Longer lists are submitted in several
+            requests and an ``OperationBatch`` is returned. Default is None, which submits a single request.
+        max_in_flight: int | None
+            Maximum number of batch requests in flight at once. Default is None, which uses
+            ``max_concurrent_requests``.
+        priority: int
+            Priority of the submission, used when the client limits the number of active submissions.
+            Higher values are admitted first. Default is ``Priority.normal``.
+        """
+        return await self._submit(
+            "rmdir", operations, future=future, batch_size=batch_size, max_in_flight=max_in_flight, priority=priority
+        )
+
+    async def upload_tree(
+        self,
+        local_dir: str,
+        remote_prefix: str,
+        include: str | builtins.list[str] | None = None,
+        exclude: str | builtins.list[str] | None = None,
+        remote: str = "any",
+        future: bool = False,
+        batch_size: int = 1000,
+        max_in_flight: int | None = None,
+        skip_identical: bool = False,
+        priority: int = Priority.normal,
+    ) -> OperationBatch:
+        """Upload a local directory tree.
+
+        The tree is walked with parallel ``os.scandir`` workers and copy operations are submitted
+        while the walk is still running. The first batch holds a single file so that the transfer
+        starts right away, and batches grow up to ``batch_size`` operations.
+
+        Parameters
+        ----------
+        local_dir: str
+            Local directory to upload.
+        remote_prefix: str
+            Remote directory the tree is uploaded to.
+        include: str | List[str] | None
+            Glob patterns of files to upload, matched against the file name and the path relative
+            to ``local_dir``. Default is None, which uploads all files.
+        exclude: str | List[str] | None
+            Glob patterns of files and directories to skip.
+        remote: str
+            Remote to upload to. Default is ``any``.
+        future: bool
+            Whether to return ``AsyncTransferFuture`` objects resolved with the final operations. Default is False.
+        batch_size: int
+            Maximum number of operations per request. Default is 1000.
+        max_in_flight: int | None
+            Maximum number of batch requests in flight at once. Default is None, which uses
+            ``max_concurrent_requests``.
+        skip_identical: bool
+            Skip files whose checksum matches the remote file they would replace. Requires the
+            ``xxhash`` package. Default is False.
+        priority: int
+            Priority of the submission, used when the client limits the number of active submissions.
+            Higher values are admitted first. Default is ``Priority.normal``.
+        """
+        prefix = remote_prefix.rstrip("/")
+        files = awalk_files(local_dir, include=include, exclude=exclude, workers=self.walk_workers)
+        operations = (
+            SrcDst(
+                src=StoragePath(path=path, remote="local"),
+                dst=StoragePath(path=f"{prefix}/{rel}" if prefix else rel, remote=remote),
+            )
+            async for path, rel in files
+        )
+        if skip_identical:
+            operations = (
+                op
+                async for chunk in achunked(operations, batch_size, first=1)
+                for op in await self.filter_identical(chunk)
+            )
+        return await self._submit(
+            "copy",
+            operations,
+            future=future,
+            batch_size=batch_size,
+            max_in_flight=max_in_flight,
+            first_batch_size=1,
+            priority=priority,
+        )
+
+    async def upload_packed(
+        self,
+        local_dir: str,
+        remote_prefix: str,
+        include: str | builtins.list[str] | None = None,
+        exclude: str | builtins.list[str] | None = None,
+        remote: str = "any",
+        pack_threshold: int = default_pack_threshold,
+        pack_size: int = default_pack_size,
+        batch_size: int = 1000,
+        timeout: float | None = None,
+    ) -> builtins.list[Operation]:
+        """Upload a local directory tree, packing small files into archives extracted by the worker.
+
+        Files smaller than ``pack_threshold`` bytes are packed into zip archives of up to ``pack_size``
+        bytes. Each archive is uploaded as a single file, extracted into ``remote_prefix`` and removed.
+        At most ``max_concurrent_requests`` packs are built and transferred at once, so that packing
+        overlaps with the transfer of earlier packs. Larger files are uploaded as they are.
+        The final state of the copy operations of the larger files is returned, followed by the
+        extract operations of the packs.
+
+        This method is experimental. The worker routes extracting the packs are not part of the
+        documented worker API yet and may change.
+
+        Parameters
+        ----------
+        local_dir: str
+            Local directory to upload.
+        remote_prefix: str
+            Remote directory the tree is uploaded to.
+        include: str | List[str] | None
+            Glob patterns of files to upload, matched against the file name and the path relative
+            to ``local_dir``. Default is None, which uploads all files.
+        exclude: str | List[str] | None
+            Glob patterns of files and directories to skip.
+        remote: str
+            Remote to upload to. Default is ``any``.
+        pack_threshold: int
+            Size in bytes below which files are packed. Default is 256 KiB.
+        pack_size: int
+            Maximum total size in bytes of the files of a pack. Default is 64 MiB.
+        batch_size: int
+            Maximum number of copy operations of larger files per request. Default is 1000.
+        timeout: float | None
+            Timeout in seconds for each transfer. Default is None.
+        """
+        prefix = join(remote_prefix)
+        files = await asyncio.to_thread(
+            local_files, local_dir, include=include, exclude=exclude, workers=self.walk_workers
+        )
+        packer = Packer(pack_size)
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        large = []
+        bins = []
+        for rel, (size, _) in files.items():
+            path = os.path.join(local_dir, rel)
+            if size >= pack_threshold:
+                dst = StoragePath(path=join(prefix, rel), remote=remote)
+                large.append(SrcDst(src=StoragePath(path=path, remote="local"), dst=dst))
+            elif pack := packer.add(path, rel, size):
+                bins.append(pack)
+        if pack := packer.flush():
+            bins.append(pack)
+
+        tmp_dir = await asyncio.to_thread(tempfile.mkdtemp, prefix="dt-pack-")
+        packs = [
+            asyncio.create_task(self._upload_pack(pack, tmp_dir, prefix, remote, timeout, semaphore)) for pack in bins
+        ]
+        try:
+            log.info(f"Uploading {len(large)} files and {len(files) - len(large)} small files in {len(packs)} packs")
+            ops = []
+            if large:
+                ops = await self.wait_for([await self.copy(large, batch_size=batch_size)], timeout=timeout)
+            ops.extend(await asyncio.gather(*packs))
+        finally:
+            for task in packs:
+                task.cancel()
+            await asyncio.gather(*packs, return_exceptions=True)
+            await asyncio.to_thread(shutil.rmtree, tmp_dir, ignore_errors=True)
+        return ops
+
+    async def _upload_pack(
+        self,
+        files: builtins.list[tuple[str, str]],
+        tmp_dir: str,
+        prefix: str,
+        remote: str,
+        timeout: float | None,
+        semaphore: asyncio.Semaphore,
+    ) -> Operation:
+        """Pack files into an archive, upload it, extract it on the worker and remove it."""
+        async with semaphore:
+            archive = await asyncio.to_thread(write_archive, files, tmp_dir)
+            dst = join(prefix, os.path.basename(archive))
+            try:
+                src_dst = SrcDst(
+                    src=StoragePath(path=archive, remote="local"), dst=StoragePath(path=dst, remote=remote)
+                )
+                op = await self._wait_for_one(await self.copy([src_dst]), timeout=timeout)
+            finally:
+                await asyncio.to_thread(os.remove, archive)
+            if op.state != OperationState.Succeeded:
+                log.warning(f"Upload of a pack of {len(files)} files failed: {op.error}")
+                return op
+
+            try:
+                body = ExtractBody(archive_path=dst, destination=prefix, format=Format.Zip, remote=remote)
+                return await self._wait_for_one(await self._extract(body), timeout=timeout)
+            finally:
+                await self._remove_pack(dst, remote, timeout)
+
+    async def download_dir_as_archive(
+        self,
+        remote_dir: str,
+        local_path: str,
+        format: Format | str = Format.Zip,
+        remote: str = "any",
+        extract: bool = False,
+        include_custom_metadata: bool = False,
+        timeout: float | None = None,
+        scratch_dir: str | None = None,
+    ) -> Operation:
+        """Download a remote directory as a single archive built by the worker.
+
+        The archive is created in ``scratch_dir``, downloaded as one file and removed from the
+        backend storage again. Compared to copying the files one by one, this saves a request and
+        the bookkeeping of a child operation per file. The final state of the download is returned.
+
+        This method is experimental. The worker route building the archive is not part of the
+        documented worker API yet and may change.
+
+        Parameters
+        ----------
+        remote_dir: str
+            Remote directory to download.
+        local_path: str
+            Local path of the archive, or the directory the archive is extracted to if ``extract`` is True.
+        format: Format | str
+            Format of the archive. Default is zip.
+        remote: str
+            Remote the directory is on. Default is ``any``.
+        extract: bool
+            Extract the archive into ``local_path`` and delete it afterwards. Default is False.
+        include_custom_metadata: bool
+            Include custom metadata of the files in the archive. Default is False.
+        timeout: float | None
+            Timeout in seconds for each step. Default is None.
+        scratch_dir: str | None
+            Writable remote directory the archive is temporarily stored in. Default is None, which
+            stores it in ``remote_dir`` itself. In that case, the files of ``remote_dir`` are listed
+            first, so that the archive does not include itself.
+        """
+        format = Format(format)
+        src = join(remote_dir)
+        dst = join(src if scratch_dir is None else scratch_dir, archive_name(format))
+        files = None
+        if scratch_dir is None:
+            files = sorted(await self._remote_files(src, remote)) or None
+        body = CreateArchiveBody(
+            src=src, dst=dst, paths=files, format=format, remote=remote, include_custom_metadata=include_custom_metadata
+        )
+        op = await self._wait_for_one(await self._archive(body), timeout=timeout)
+        if op.state != OperationState.Succeeded:
+            log.warning(f"Failed to archive {remote}:{src}: {op.error}")
+            return op
 
-    async def exists(self, operations: list[StoragePath]):
-        """Provides an async interface to check if a list of ``StoragePath`` objects exist."""
-        return await self._exec_async_operation_req("exists", operations)
+        local = os.path.join(local_path, posixpath.basename(dst)) if extract else local_path
+        await asyncio.to_thread(os.makedirs, os.path.dirname(os.path.abspath(local)), exist_ok=True)
+        try:
+            src_dst = SrcDst(src=StoragePath(path=dst, remote=remote), dst=StoragePath(path=local, remote="local"))
+            op = await self._wait_for_one(await self.copy([src_dst]), timeout=timeout)
+        finally:
+            await self._remove_pack(dst, remote, timeout)
 
-    async def list(self, operations: list[StoragePath]):
-        """Provides an async interface to get a list of ``StoragePath`` objects."""
-        return await self._exec_async_operation_req("list", operations)
+        if extract and op.state == OperationState.Succeeded:
+            try:
+                await asyncio.to_thread(extract_archive, local, local_path, format)
+            finally:
+                await asyncio.to_thread(os.remove, local)
+        return op
 
-    async def mkdir(self, operations: builtins.list[StoragePath]):
-        """Provides an async interface to create a list of directories in the remote backend."""
-        return await self._exec_async_operation_req("mkdir", operations)
+    async def _remove_pack(self, path: str, remote: str, timeout: float | None):
+        """Remove a temporary archive from the backend storage, logging failures."""
+        try:
+            r = await self.remove([StoragePath(path=path, remote=remote)])
+            rm = await self._wait_for_one(r, timeout=timeout)
+        except Exception as e:
+            log.warning(f"Failed to remove pack {remote}:{path}: {e}")
+            return
+        if rm.state != OperationState.Succeeded:
+            log.warning(f"Failed to remove pack {remote}:{path}: {rm.error}")
 
-    async def move(self, operations: builtins.list[SrcDst]):
-        """Provides an async interface to move a list of ``SrcDst`` objects in the remote backend."""
-        return await self._exec_async_operation_req("move", operations)
+    async def sync(
+        self,
+        local_dir: str,
+        remote_dir: str,
+        direction: str = "upload",
+        remote: str = "any",
+        include: str | builtins.list[str] | None = None,
+        exclude: str | builtins.list[str] | None = None,
+        manifest: str | None = None,
+        refresh: bool = False,
+        batch_size: int = 1000,
+        timeout: float | None = None,
+        checksum: bool = False,
+    ) -> builtins.list[Operation]:
+        """Synchronize a local directory with a remote directory, transferring only changed files.
+
+        Files are compared by size and modification time. The state after each sync is kept in
+        a local manifest, so that a repeated upload neither lists the remote directory nor
+        transfers unchanged files. Deleted files are not removed from the other side.
+        The final state of the copy operations is returned, which is empty if nothing changed.
+
+        Parameters
+        ----------
+        local_dir: str
+            Local directory.
+        remote_dir: str
+            Remote directory.
+        direction: str
+            Either ``upload`` or ``download``. Default is ``upload``.
+        remote: str
+            Remote the directory is on. Default is ``any``.
+        include: str | List[str] | None
+            Glob patterns of files to sync, matched against the file name and the relative path.
+            Default is None, which syncs all files.
+        exclude: str | List[str] | None
+            Glob patterns of files and directories to skip.
+        manifest: str | None
+            Path of the manifest file. Default is None, which uses ``.dt_sync_manifest.json`` in ``local_dir``.
+        refresh: bool
+            List the remote directory on upload even if a manifest exists. Default is False.
+        batch_size: int
+            Maximum number of files per copy operation. Default is 1000.
+        timeout: float | None
+            Timeout in seconds for the transfer. Default is None.
+        checksum: bool
+            On upload, also compare checksums of changed files with the remote files and skip
+            identical ones, for example files that were only touched. Requires the ``xxhash`` package.
+            Default is False.
+        """
+        if direction not in directions:
+            raise ValueError(f"Invalid sync direction {direction!r}, expected one of {directions}")
 
-    async def remove(self, operations: builtins.list[StoragePath]):
-        """Provides an async interface to remove files in the remote backend."""
-        return await self._exec_async_operation_req("remove", operations)
+        # Reading the manifest and scanning the local tree block, so keep them off the event loop
+        manifest = await asyncio.to_thread(
+            SyncManifest, manifest or os.path.join(local_dir, default_manifest_name), f"{remote}:{join(remote_dir)}"
+        )
+        if direction == "upload":
+            local = await asyncio.to_thread(
+                local_files, local_dir, include=include, exclude=exclude, workers=self.walk_workers
+            )
+            remote_files = None if manifest.loaded and not refresh else await self._remote_files(remote_dir, remote)
+            changed = plan_upload(local, manifest, remote_files)
+        else:
+            local = None
+            remote_files = filter_remote(await self._remote_files(remote_dir, remote), include=include, exclude=exclude)
+            changed = await asyncio.to_thread(plan_download, local_dir, remote_files, manifest)
 
-    async def rmdir(self, operations: builtins.list[StoragePath]):
-        """Provides an async interface to remove directories in the remote backend."""
-        return await self._exec_async_operation_req("rmdir", operations)
+        plan = SyncPlan(direction, local_dir, remote_dir, remote, manifest, local, remote_files, changed)
+        if checksum and direction == "upload" and changed:
+            plan.keep(await self.filter_identical(plan.operations()))
+        log.info(f"Sync {direction} of {local_dir}: {len(plan.changed)} changed files")
+        if not plan.changed:
+            await asyncio.to_thread(plan.finish, [], [], batch_size)
+            return []
+
+        batch = await self.copy(plan.operations(), batch_size=batch_size)
+        ops = await self.wait_for([batch], timeout=timeout)
+        await asyncio.to_thread(plan.finish, batch.ids, ops, batch_size)
+        return ops
+
+    async def filter_identical(self, operations: Iterable[SrcDst]) -> builtins.list[SrcDst]:
+        """Drop uploads whose local file has the same checksum as the remote file it would replace.
+
+        The checksums of the destinations are fetched with a single ``get_metadata`` operation and
+        the local files are hashed in parallel threads. Local checksums are cached in ``checksum_cache``
+        by inode, size and modification time, so that unchanged files are not hashed again.
+        Operations that are not uploads of local files are kept as they are.
+
+        Parameters
+        ----------
+        operations: Iterable[SrcDst]
+            Copy operations to filter.
+        """
+        operations = builtins.list(operations)
+        uploads = [op for op in operations if op.src.remote == "local"]
+        if not uploads:
+            return operations
+
+        op = await self._wait_for_one(await self.get_metadata([u.dst.path for u in uploads]))
+        remote = remote_checksums(op, [u.dst.path for u in uploads])
+        candidates = [u.src.path for u in uploads if remote.get(u.dst.path)]
+        local = await asyncio.to_thread(hash_files, candidates, cache=self.checksum_cache, workers=self.hash_workers)
+        await asyncio.to_thread(self.checksum_cache.save)
+
+        kept = [op for op in operations if not identical(op, local, remote)]
+        log.debug(f"Skipping {len(operations) - len(kept)} of {len(operations)} uploads with identical checksums")
+        return kept
+
+    async def _remote_files(self, remote_dir: str, remote: str) -> dict[str, tuple[int | None, float | None]]:
+        """List a remote directory recursively, one ``list`` operation per directory level."""
+        files = {}
+        dirs = [""]
+        while dirs:
+            paths = [join(remote_dir, d) for d in dirs]
+            r = await self._exec_async_operation_req(
+                "list", [StoragePath(path=p, remote=remote) for p in paths], params={"mode": "extended"}
+            )
+            op = await self._wait_for_one(r)
+            if op.state != OperationState.Succeeded:
+                # Most likely the remote directory does not exist yet
+                log.debug(f"Listing {remote}:{remote_dir} failed: {op.error}")
+                break
+            dirs = collect_listing(op.result, dirs, paths, remote, files)
+        return files
+
+    def as_future(self, operation: OperationIdResponse) -> AsyncTransferFuture:
+        """Get an asyncio future resolved with the final state of a submitted operation.
+
+        The operation is polled by the operation watcher shared by all APIs of the client.
+        """
+        handler = self.wait_handler_factory()
+        expand = getattr(handler.Meta, "expand_group", False) if hasattr(handler, "Meta") else False
+        shared = getattr(operation, "shared", False)
+        return AsyncTransferFuture(
+            operation,
+            self.operation_watcher,
+            handler=handler,
+            # Shared operations are scoped to the entries of the caller from their children
+            expand=expand or shared,
+            # Cancelling a shared operation would stop the transfers of other callers too
+            cancel_operations=None if shared else self._cancel_operations,
+        )
+
+    async def _submit(
+        self,
+        storage_operation: str,
+        operations: Iterable[StoragePath] | Iterable[SrcDst] | AsyncIterable[StoragePath] | AsyncIterable[SrcDst],
+        future: bool = False,
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        first_batch_size: int | None = None,
+        priority: int = Priority.normal,
+    ):
+        if batch_size is None and self.coalescer is not None:
+            r = await self._coalesce(storage_operation, operations, priority)
+            return self.as_future(r) if future else r
+        if batch_size is None:
+            r = await self._send(storage_operation, single_pass(operations), priority)
+            return self.as_future(r) if future else r
+
+        max_in_flight = max_in_flight or self.max_concurrent_requests
+        responses = await self._submit_batches(
+            storage_operation,
+            operations,
+            batch_size,
+            max_in_flight,
+            first_batch_size=first_batch_size,
+            priority=priority,
+        )
+        return OperationBatch([self.as_future(r) for r in responses] if future else responses)
+
+    async def _submit_batches(
+        self,
+        storage_operation: str,
+        operations: Iterable[StoragePath] | Iterable[SrcDst] | AsyncIterable[StoragePath] | AsyncIterable[SrcDst],
+        batch_size: int,
+        max_in_flight: int,
+        first_batch_size: int | None = None,
+        priority: int = Priority.normal,
+    ) -> builtins.list[OperationIdResponse]:
+        """Submit operations in chunks of ``batch_size``, with at most ``max_in_flight`` requests at once.
+
+        Chunks are serialized only when their request is sent, so that memory use stays flat
+        and the worker can start on the first chunks while the remaining ones are prepared.
+        If a chunk fails, the chunks accepted by the worker are cancelled before the error is raised.
+        """
+        responses = {}
+        in_flight = {}
+        try:
+            index = 0
+            async for chunk in achunked(operations, batch_size, first=first_batch_size):
+                if len(in_flight) >= max_in_flight:
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for t in done:
+                        responses[in_flight.pop(t)] = t.result()
+                t = asyncio.create_task(self._send(storage_operation, chunk, priority))
+                in_flight[t] = index
+                index += 1
+            for t, index in in_flight.items():
+                responses[index] = await t
+        except Exception:
+            # Let the requests in flight finish, so that the batches they submit can be cancelled too
+            results = await asyncio.gather(*in_flight, return_exceptions=True)
+            responses.update(
+                (i, r) for i, r in zip(in_flight.values(), results, strict=True) if isinstance(r, OperationIdResponse)
+            )
+            await self._cancel_accepted(storage_operation, builtins.list(responses.values()))
+            raise
+        except BaseException:
+            for t in in_flight:
+                t.cancel()
+            raise
+
+        log.debug(f"Submitted {storage_operation} operations in {len(responses)} batches")
+        return [responses[i] for i in range(len(responses))]
+
+    async def _cancel_accepted(self, storage_operation: str, responses: builtins.list[OperationIdResponse]):
+        """Cancel the batches accepted by the worker when the submission of another batch failed."""
+        if not responses:
+            return
+        log.warning(
+            f"Submission of {storage_operation} operations failed, cancelling {len(responses)} accepted batches"
+        )
+        await self._cancel_operations(responses)
+
+    async def _coalesce(
+        self,
+        storage_operation: str,
+        operations: Iterable[StoragePath] | Iterable[SrcDst] | AsyncIterable[StoragePath] | AsyncIterable[SrcDst],
+        priority: int,
+    ) -> CoalescedOperation:
+        """Send operations as part of a merged request with the concurrent submissions of the same kind."""
+        if isinstance(operations, AsyncIterable):
+            operations = [op async for op in operations]
+        return await self.coalescer.submit(
+            (storage_operation, priority),
+            builtins.list(operations),
+            lambda entries: self._send(storage_operation, entries, priority),
+        )
+
+    async def _send(
+        self,
+        storage_operation: str,
+        operations: Iterable[StoragePath] | Iterable[SrcDst] | AsyncIterable[StoragePath] | AsyncIterable[SrcDst],
+        priority: int,
+    ) -> OperationIdResponse:
+        """Send a submission request, once admitted by the scheduler of the client if there is one."""
+        scheduler = self.scheduler
+        if scheduler is None:
+            return await self._exec_async_operation_req(storage_operation, operations)
+        cost = None
+        if scheduler.needs_cost:
+            if isinstance(operations, AsyncIterable):
+                operations = [op async for op in operations]
+            elif not isinstance(operations, Sized):
+                operations = builtins.list(operations)
+            # Sizes of local files are read off the event loop
+            cost = await asyncio.to_thread(batch_cost, operations, scheduler.needs_bytes)
+        return await scheduler.submit(
+            priority, lambda: self._exec_async_operation_req(storage_operation, operations), cost=cost
+        )
 
     @retry()
     async def _exec_async_operation_req(
-        self, storage_operation: str, operations: builtins.list[StoragePath] | builtins.list[SrcDst]
+        self,
+        storage_operation: str,
+        operations: Iterable[StoragePath] | Iterable[SrcDst] | AsyncIterable[StoragePath] | AsyncIterable[SrcDst],
+        params: dict | None = None,
     ):
         url = f"/storage:{storage_operation}"
-        payload = {"operations": [operation.model_dump(mode=self.dump_mode) for operation in operations]}
-        resp = await self.client.session.post(url, json=payload)
+        # Operations are serialized while the body is sent, instead of building the whole payload in memory
+        content = AsyncJsonArrayBody("operations", operations, dump_model(self.dump_mode))
+        resp = await self.client.session.post(
+            url, content=content, params=params, headers={"Content-Type": "application/json"}
+        )
         json = resp.json()
         return OperationIdResponse(**json)
 
     async def _operations(self, ids: builtins.list[str], expand: bool = False):
+        return OperationsResponse(operations=await self._operations_raw(ids, expand=expand)).operations
+
+    async def _operations_raw(self, ids: builtins.list[str], expand: bool = False):
         url = "/operations"
         params = {"ids": ids}
         if expand:
             params["expand"] = "true"
         resp = await self.client.session.get(url, params=params, timeout=2)
         json = resp.json()
-        return OperationsResponse(**json).operations
+        return json.get("operations") or []
+
+    async def _fetch_operations(self, ids: builtins.list[str], expand: bool = False, raw: bool = False):
+        """Get operations, splitting large ID lists into bounded concurrent requests.
+
+        With ``raw``, the operations are returned as dictionaries as received from the worker.
+        """
+        fetch = self._operations_raw if raw else self._operations
+        chunks = list(chunked(ids, self.max_ids_per_request))
+        if len(chunks) <= 1:
+            return await fetch(ids, expand=expand) if ids else []
+
+        sem = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def _fetch(chunk):
+            async with sem:
+                return await fetch(chunk, expand=expand)
+
+        results = await asyncio.gather(*[_fetch(chunk) for chunk in chunks])
+        return [op for ops in results for op in ops or []]
 
     @retry()
     async def check_permissions(self, permissions: builtins.list[RoleAssignment]):
@@ -191,7 +1018,7 @@ class AsyncDataTransferApi:
     async def get_metadata(self, paths: builtins.list[str | StoragePath]):
         """Provides an async interface to get metadata of a list of ``StoragePath`` objects."""
         url = "/metadata:get"
-        paths = [p if isinstance(p, str) else p.path for p in paths]
+        paths = paths.paths if isinstance(paths, PathBatch) else [p if isinstance(p, str) else p.path for p in paths]
         payload = {"paths": paths}
         resp = await self.client.session.post(url, json=payload)
         json = resp.json()
@@ -207,6 +1034,24 @@ class AsyncDataTransferApi:
         json = resp.json()
         return OperationIdResponse(**json)
 
+    # Experimental: the archive and extract routes are not part of the documented worker API yet,
+    # so they stay private until they are confirmed against the route table of the worker.
+    @retry()
+    async def _archive(self, body: CreateArchiveBody):
+        """Provides an async interface to create an archive of files on the backend storage."""
+        url = "/storage:archive"
+        resp = await self.client.session.post(url, json=body.model_dump(mode=self.dump_mode, exclude_none=True))
+        json = resp.json()
+        return OperationIdResponse(**json)
+
+    @retry()
+    async def _extract(self, body: ExtractBody):
+        """Provides an async interface to extract an archive on the backend storage."""
+        url = "/storage:extract"
+        resp = await self.client.session.post(url, json=body.model_dump(mode=self.dump_mode, exclude_none=True))
+        json = resp.json()
+        return OperationIdResponse(**json)
+
     async def wait_for(
         self,
         operation_ids: builtins.list[str | Operation],
@@ -215,6 +1060,10 @@ class AsyncDataTransferApi:
         cap: float = 5.0,
         raise_on_error: bool = False,
         handler: Callable[[builtins.list[Operation]], Awaitable[None]] = None,
+        shared: bool | None = None,
+        polling: BackoffPolling | None = None,
+        cancel_on_timeout: bool = False,
+        cancel_on_task_cancel: bool = False,
     ):
         """Provides an async interface to wait for a list of operations to complete.
 
@@ -232,22 +1081,205 @@ class AsyncDataTransferApi:
             Raise an exception if an error occurs. Default is False.
         operation_handler: Callable[[builtins.list[Operation]], None]
             A callable that will be called with the list of operations when they are fetched.
+            Operations that already completed are not fetched again.
+        shared: bool | None
+            Whether to wait using the operation watcher shared by all waiters of the client,
+            in which case the polling cadence of the watcher applies and ``interval`` and ``cap`` are ignored.
+            Default is None, which uses the ``shared_wait`` setting of the client unless ``polling`` is given.
+        polling: BackoffPolling | None
+            Strategy deciding how long to wait between polls, for example ``ProgressRatePolling``.
+            It cannot be combined with ``shared=True``. Default is None, which uses exponential backoff
+            based on ``interval`` and ``cap``.
+        cancel_on_timeout: bool
+            Cancel the operations that are still running on the worker when the timeout is reached.
+            Experimental, the cancel route of the worker is not confirmed yet. Default is False.
+        cancel_on_task_cancel: bool
+            Cancel the operations that are still running on the worker when the task waiting
+            for them is cancelled. Experimental, the cancel route of the worker is not confirmed yet.
+            Default is False.
         """
         if handler is None:
             handler = self.wait_handler_factory()
 
+        handles = self._handles(operation_ids)
+        shared_ids = self._shared_ids(handles)
+        operation_ids = self._operation_ids(handles)
+        expand = getattr(handler.Meta, "expand_group", False) if hasattr(handler, "Meta") else False
+        tracker = AsyncGroupTracker(self._fetch_operations) if self._delta_group(handler) else None
+
+        if shared and polling is not None:
+            raise ValueError("A polling strategy cannot be used with the shared operation watcher")
+        if shared is None:
+            shared = self.client.shared_wait and polling is None
+        if polling is None:
+            polling = BackoffPolling(interval=interval, cap=cap)
+
+        start = time.time()
+        op_str = textwrap.wrap(", ".join(operation_ids), width=60, placeholder="...")
+        # log.debug(f"Waiting for operations to complete: {op_str}")
+        latest = {}
+        try:
+            if shared:
+                await self._wait_for_shared(operation_ids, timeout, raise_on_error, handler, expand, latest)
+                return await self._scope_shared(handles, latest)
+
+            async for ops in self._poll_operations(
+                operation_ids, timeout, raise_on_error, handler, expand, polling, tracker=tracker
+            ):
+                latest.update((op.id, op) for op in ops)
+        except TimeoutError:
+            if cancel_on_timeout:
+                await self._cancel_unfinished(operation_ids, latest, shared_ids)
+            raise
+        except asyncio.CancelledError:
+            if cancel_on_task_cancel:
+                # Shielded, so that the cancellation of the task does not abort the request
+                await asyncio.shield(self._cancel_unfinished(operation_ids, latest, shared_ids))
+            raise
+
+        duration = hz.naturalsize(time.time() - start)
+        log.debug(f"Operations completed after {duration}: {op_str}")
+        return await self._scope_shared(handles, latest)
+
+    async def iter_completed(
+        self,
+        operation_ids: builtins.list[str | Operation | OperationIdResponse],
+        timeout: float | None = None,
+        interval: float = 0.1,
+        cap: float = 5.0,
+        raise_on_error: bool = False,
+        handler: Callable[[builtins.list[Operation]], Awaitable[None]] = None,
+        polling: BackoffPolling | None = None,
+    ):
+        """Provides an async iterator over operations that yields each operation as soon as it completes.
+
+        Operations are yielded in the order they reach a final state, so that results can be
+        processed while the remaining operations are still running.
+
+        Parameters
+        ----------
+        operation_ids: List[str | Operation | OperationIdResponse]
+            List of operation ids.
+        timeout: float | None
+            Timeout in seconds for all operations to complete. Default is None.
+        interval: float
+            Interval in seconds. Default is 0.1.
+        cap: float
+            The maximum backoff value used to calculate the next wait time. Default is 5.0.
+        raise_on_error: bool
+            Raise an exception if an error occurs. Default is False.
+        handler: Callable[[builtins.list[Operation]], None]
+            A callable that will be called with the list of operations when they are fetched.
+        polling: BackoffPolling | None
+            Strategy deciding how long to wait between polls. Default is None, which uses
+            exponential backoff based on ``interval`` and ``cap``.
+        """
+        if handler is None:
+            handler = self.wait_handler_factory()
+
+        operation_ids = self._operation_ids(operation_ids)
+        expand = getattr(handler.Meta, "expand_group", False) if hasattr(handler, "Meta") else False
+        tracker = AsyncGroupTracker(self._fetch_operations) if self._delta_group(handler) else None
+        if polling is None:
+            polling = BackoffPolling(interval=interval, cap=cap)
+
+        async for ops in self._poll_operations(
+            operation_ids, timeout, raise_on_error, handler, expand, polling, tracker=tracker
+        ):
+            for op in ops:
+                if op.state in [OperationState.Succeeded, OperationState.Failed]:
+                    yield op
+
+    def _delta_group(self, handler) -> bool:
+        return getattr(handler.Meta, "delta_group", False) if hasattr(handler, "Meta") else False
+
+    async def _cancel_unfinished(
+        self, operation_ids: builtins.list[str], latest: dict[str, Operation], shared_ids: set[str]
+    ):
+        ids = [
+            i
+            for i in operation_ids
+            if i not in shared_ids
+            and (i not in latest or latest[i].state not in [OperationState.Succeeded, OperationState.Failed])
+        ]
+        if not ids:
+            return
+        log.info(f"Cancelling {len(ids)} unfinished operations ...")
+        await self._cancel_operations(ids)
+
+    async def _wait_for_one(self, operation: OperationIdResponse, timeout: float | None = None) -> Operation:
+        """Wait for a single operation, raising a ``ClientError`` if its final state cannot be determined."""
+        ops = await self.wait_for([operation], timeout=timeout, raise_on_error=True)
+        if not ops:
+            raise ClientError(f"Failed to get the state of operation {operation.id}")
+        return ops[0]
+
+    def _shared_ids(self, operation_ids) -> set[str]:
+        """Get the IDs of handles shared with the coalesced submissions of other callers."""
+        return {op.id for op in self._handles(operation_ids) if getattr(op, "shared", False)}
+
+    def _handles(self, operation_ids) -> builtins.list:
+        """Get the operation IDs and handles, with the handles of batches listed one by one."""
         if not isinstance(operation_ids, list):
             operation_ids = [operation_ids]
-        operation_ids = [op.id if isinstance(op, Operation | OperationIdResponse) else op for op in operation_ids]
+        handles = []
+        for op in operation_ids:
+            if isinstance(op, OperationBatch):
+                handles.extend(op)
+            else:
+                handles.append(op)
+        return handles
+
+    def _operation_ids(self, operation_ids) -> builtins.list[str]:
+        return [op if isinstance(op, str) else op.id for op in self._handles(operation_ids)]
+
+    async def _scope_shared(self, handles: builtins.list, latest: dict[str, Operation]) -> builtins.list[Operation]:
+        """Get the final operations of the handles, with shared handles scoped to the entries of their caller."""
+        shared = {op.id for op in handles if getattr(op, "shared", False) and op.id in latest}
+        if shared:
+            try:
+                # The children are only listed by expanded operations
+                merged = await self._fetch_operations(builtins.list(shared), expand=True)
+                latest = {**latest, **{op.id: op for op in merged}}
+            except Exception as e:
+                log.warning(f"Failed to get the children of {len(shared)} coalesced operations: {e}")
+        ops = []
+        for op in handles:
+            op_id = op if isinstance(op, str) else op.id
+            if op_id in latest:
+                ops.append(op.scope(latest[op_id]) if getattr(op, "shared", False) else latest[op_id])
+        return ops
+
+    async def _poll_operations(
+        self,
+        operation_ids: builtins.list[str],
+        timeout: float | None,
+        raise_on_error: bool,
+        handler,
+        expand: bool,
+        polling: BackoffPolling,
+        tracker: GroupTracker | None = None,
+    ):
+        """Poll operations until all of them are final, yielding the operations fetched by every poll.
+
+        Only operations that are not final yet are queried again. With a ``tracker``, operation
+        groups are polled by delta instead of requesting the whole expanded group every time.
+        """
         start = time.time()
         attempt = 0
-        op_str = textwrap.wrap(", ".join(operation_ids), width=60, placeholder="...")
-        # log.debug(f"Waiting for operations to complete: {op_str}")
+        completed = set()
         while True:
             attempt += 1
+            ops = []
+            done = False
             try:
-                expand = getattr(handler.Meta, "expand_group", False) if hasattr(handler, "Meta") else False
-                ops = await self._operations(operation_ids, expand=expand)
+                pending = [i for i in operation_ids if i not in completed]
+                if tracker is not None:
+                    ops = await tracker.poll(pending)
+                else:
+                    ops = await self._fetch_operations(pending, expand=expand)
+                completed.update(op.id for op in ops if op.state in [OperationState.Succeeded, OperationState.Failed])
+
                 if handler is not None:
                     try:
                         await handler(ops)
@@ -255,8 +1287,8 @@ class AsyncDataTransferApi:
                         log.warning(f"Handler error: {e}")
                         log.debug(traceback.format_exc())
 
-                if all(op.state in [OperationState.Succeeded, OperationState.Failed] for op in ops):
-                    break
+                # Operations missing from the response are still pending
+                done = all(i in completed for i in operation_ids)
             except (TimeoutException, TimeoutError):
                 log.debug("Operations status call timed out, retrying...")
             except Exception as e:
@@ -264,15 +1296,45 @@ class AsyncDataTransferApi:
                 if raise_on_error:
                     raise
                 else:
-                    break
+                    return
+
+            yield ops
+            if done:
+                log.debug("All operations have completed.")
+                return
 
             if timeout is not None and (time.time() - start) > timeout:
                 raise TimeoutError("Timeout waiting for operations to complete")
 
-            # TODO: Adjust based on transfer speed and file size
-            duration = get_expo_backoff(interval, attempts=attempt, cap=cap, jitter=True)
+            duration = polling.next_interval(attempt, ops)
             await asyncio.sleep(duration)
 
-        duration = hz.naturalsize(time.time() - start)
-        log.debug(f"Operations completed after {duration}: {op_str}")
-        return ops
+    async def _wait_for_shared(
+        self,
+        operation_ids: builtins.list[str],
+        timeout: float | None,
+        raise_on_error: bool,
+        handler: Callable[[builtins.list[Operation]], Awaitable[None]],
+        expand: bool,
+        latest: dict[str, Operation],
+    ):
+        watcher = self.operation_watcher
+        watch = watcher.watch(operation_ids, expand=expand, handler=handler)
+        try:
+            # Shield the future so that a timeout leaves cleanup to unwatch()
+            return await asyncio.wait_for(asyncio.shield(watch.future), timeout=timeout)
+        except asyncio.TimeoutError as ex:
+            raise TimeoutError("Timeout waiting for operations to complete") from ex
+        except asyncio.CancelledError:
+            if not watch.future.cancelled():
+                raise
+            log.debug("Operation watcher was stopped.")
+            return watch.ops
+        except Exception as e:
+            log.debug(f"Error getting operations: {e}")
+            if raise_on_error:
+                raise
+            return watch.ops
+        finally:
+            latest.update((op.id, op) for op in watch.ops)
+            watcher.unwatch(watch)
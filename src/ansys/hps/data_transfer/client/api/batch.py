@@ -0,0 +1,62 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Provides the handle returned for operations submitted in several batches."""
+
+from collections.abc import Iterator
+
+from ..models import OperationIdResponse
+
+
+class OperationBatch:
+    """Provides a composite handle for an operation list that was submitted in several requests.
+
+    The handle can be passed to ``wait_for`` and ``iter_completed`` like a single operation,
+    in which case all its operations are waited for.
+
+    Parameters
+    ----------
+    operations: list[OperationIdResponse | TransferFuture | AsyncTransferFuture]
+        Responses or futures of the submitted batches, in submission order.
+    """
+
+    def __init__(self, operations: list[OperationIdResponse]):
+        """Initialize the OperationBatch class object."""
+        self.operations = operations
+
+    @property
+    def ids(self) -> list[str]:
+        """IDs of the operations of all batches."""
+        return [op.id for op in self.operations]
+
+    def __iter__(self) -> Iterator[OperationIdResponse]:
+        """Iterate over the responses or futures of the batches."""
+        return iter(self.operations)
+
+    def __len__(self) -> int:
+        """Number of batches."""
+        return len(self.operations)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the batch."""
+        return f"OperationBatch(ids={self.ids})"
@@ -0,0 +1,297 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides coalescing of small concurrent submissions into a single request.
+
+Each submission costs one request and one operation to poll, which dominates when many threads
+or tasks submit a single file each. Submissions of the same kind that arrive within a short
+window are merged and sent as one request, like Nagle's algorithm does for small TCP segments.
+The first submission of a window waits for the window to close, or for the merged request to
+reach ``max_entries``, then sends it on behalf of all callers. Each caller gets a handle scoped to
+its own entries, resolved from the children of the merged operation.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+import concurrent.futures
+import logging
+import threading
+
+from pydantic import Field
+
+from ..models import Operation, OperationIdResponse, OperationState, SrcDst, StoragePath
+
+log = logging.getLogger(__name__)
+
+
+class CoalescedOperation(OperationIdResponse):
+    """Provides the response of a submission that was sent as part of a merged request.
+
+    ``id`` is the ID of the operation of the merged request, shared by all ``submissions`` of the
+    merged request. The handle is scoped to the ``entries`` of its caller: ``wait_for`` and futures
+    resolve it with ``scope``, which keeps the children of the merged operation matching the entries
+    of the caller. A failed entry of another caller does not fail the handle. It still completes with
+    the merged operation, and shared handles are not cancelled on the worker, since that would stop
+    the transfers of the other callers.
+    """
+
+    submissions: int = 1
+    entries: list = Field(default_factory=list, exclude=True)
+
+    @property
+    def shared(self) -> bool:
+        """Whether the operation is shared with the submissions of other callers."""
+        return self.submissions > 1
+
+    def scope(self, op: Operation) -> Operation:
+        """Get the state of the entries of this submission from the expanded merged operation.
+
+        Children are matched to the entries by the paths named in their description, both source and
+        destination for copies and moves. If any entry matches no child, for example because the
+        worker did not split the merged request into children, the merged operation is returned as it is.
+
+        Parameters
+        ----------
+        op: Operation
+            Merged operation, requested with ``expand=True``.
+        """
+        if not self.shared:
+            return op
+        children = _match(op.children_detail or [], self.entries)
+        if children is None:
+            log.debug(f"Cannot match the entries of a coalesced submission to the children of {op.id}")
+            return op
+
+        failed = [ch for ch in children if ch.state == OperationState.Failed]
+        if failed:
+            state = OperationState.Failed
+        elif all(ch.state == OperationState.Succeeded for ch in children):
+            state = OperationState.Succeeded
+        elif op.state in [OperationState.Succeeded, OperationState.Failed]:
+            state = OperationState.Running
+        else:
+            state = op.state
+        return op.model_copy(
+            update={
+                "state": state,
+                "error": "; ".join(ch.error for ch in failed if ch.error) or None,
+                "error_detail": failed[0].error_detail if failed else None,
+                "children": [ch.id for ch in children],
+                "children_detail": children,
+                "progress_current": sum(ch.progress_current or 0 for ch in children),
+                "progress_total": sum(ch.progress_total or 0 for ch in children) or None,
+            }
+        )
+
+
+def _paths(entry: SrcDst | StoragePath) -> list[str]:
+    if isinstance(entry, SrcDst):
+        return [entry.src.path, entry.dst.path]
+    return [entry.path]
+
+
+def _named(description: str | None) -> set[str]:
+    """Get the paths named in an operation description, with and without their remote."""
+    names = set()
+    for word in (description or "").split():
+        name = word.strip("'\"")
+        names.add(name)
+        names.add(name.partition(":")[2])
+    return names
+
+
+def _match(children: list[Operation], entries: list) -> list[Operation] | None:
+    """Get a child for each entry, or None if an entry matches no child."""
+    names = [_named(ch.description) for ch in children]
+    matched = {}
+    for entry in entries:
+        paths = _paths(entry)
+        i = next((i for i, n in enumerate(names) if i not in matched and all(p in n for p in paths)), None)
+        if i is None:
+            return None
+        matched[i] = children[i]
+    return list(matched.values())
+
+
+class _Window:
+    """Provides the submissions collected for one merged request."""
+
+    def __init__(self, full):
+        self.parts = []
+        self.size = 0
+        self.full = full
+        self.sent = False
+        self.future = None
+        self.task = None
+
+    @property
+    def entries(self) -> list:
+        """Entries of the merged request."""
+        return [entry for part in self.parts for entry in part]
+
+
+class _CoalescerBase:
+    def __init__(self, window: float = 0.005, max_entries: int = 1000):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.window = window
+        self.max_entries = max_entries
+        self._open = {}
+
+    def _join(self, key: Hashable, operations: list, make_window) -> tuple[_Window, bool]:
+        """Add operations to the open window of ``key``, returning the window and whether to lead it."""
+        w = self._open.get(key)
+        leader = w is None
+        if leader:
+            w = self._open[key] = make_window()
+        w.parts.append(operations)
+        w.size += len(operations)
+        if w.size >= self.max_entries:
+            # Send right away instead of waiting for the window to close
+            self._close(key, w)
+        return w, leader
+
+    def _close(self, key: Hashable, w: _Window):
+        if self._open.get(key) is w:
+            del self._open[key]
+        w.full.set()
+
+    @staticmethod
+    def _handle(r: OperationIdResponse, submissions: int, entries: list) -> CoalescedOperation:
+        return CoalescedOperation(**r.model_dump(), submissions=submissions, entries=entries)
+
+
+class Coalescer(_CoalescerBase):
+    """Provides thread-safe coalescing of submissions into merged requests.
+
+    Parameters
+    ----------
+    window: float
+        Time in seconds to wait for further submissions before a merged request is sent.
+        Default is 0.005.
+    max_entries: int
+        Number of entries at which a merged request is sent without waiting for the window
+        to close. Default is 1000.
+    """
+
+    def __init__(self, window: float = 0.005, max_entries: int = 1000):
+        """Initialize the Coalescer class object."""
+        super().__init__(window, max_entries)
+        self._lock = threading.Lock()
+
+    def submit(
+        self, key: Hashable, operations: list, send: Callable[[list], OperationIdResponse]
+    ) -> CoalescedOperation:
+        """Submit operations as part of the merged request of their kind.
+
+        Parameters
+        ----------
+        key: Hashable
+            Kind of the submission. Only submissions of the same kind are merged.
+        operations: list
+            Operations of the submission.
+        send: Callable[[list], OperationIdResponse]
+            Callable sending a merged request with the given operations.
+        """
+        if len(operations) >= self.max_entries:
+            return self._handle(send(operations), 1, operations)
+
+        with self._lock:
+            w, leader = self._join(key, operations, lambda: _Window(threading.Event()))
+            if leader:
+                w.future = concurrent.futures.Future()
+            future = w.future
+
+        if leader:
+            w.full.wait(self.window)
+            with self._lock:
+                self._close(key, w)
+                w.sent = True
+            log.debug(f"Sending {w.size} entries of {len(w.parts)} coalesced submissions")
+            try:
+                future.set_result(send(w.entries))
+            except BaseException as ex:
+                future.set_exception(ex)
+        return self._handle(future.result(), len(w.parts), operations)
+
+
+class AsyncCoalescer(_CoalescerBase):
+    """Provides coalescing of submissions of asyncio tasks into merged requests.
+
+    Parameters
+    ----------
+    window: float
+        Time in seconds to wait for further submissions before a merged request is sent.
+        Default is 0.005.
+    max_entries: int
+        Number of entries at which a merged request is sent without waiting for the window
+        to close. Default is 1000.
+    """
+
+    async def submit(
+        self, key: Hashable, operations: list, send: Callable[[list], Awaitable[OperationIdResponse]]
+    ) -> CoalescedOperation:
+        """Submit operations as part of the merged request of their kind.
+
+        Parameters
+        ----------
+        key: Hashable
+            Kind of the submission. Only submissions of the same kind are merged.
+        operations: list
+            Operations of the submission.
+        send: Callable[[list], Awaitable[OperationIdResponse]]
+            Coroutine function sending a merged request with the given operations.
+        """
+        if len(operations) >= self.max_entries:
+            return self._handle(await send(operations), 1, operations)
+
+        w, leader = self._join(key, operations, lambda: _Window(asyncio.Event()))
+        if leader:
+            # Sent by a separate task, so that cancelling the first caller does not affect the others
+            w.future = asyncio.get_running_loop().create_future()
+            w.task = asyncio.create_task(self._flush(key, w, send))
+        try:
+            r = await asyncio.shield(w.future)
+        except asyncio.CancelledError:
+            if not w.sent:
+                # Withdraw the entries of the cancelled caller from the merged request
+                w.parts = [part for part in w.parts if part is not operations]
+                w.size -= len(operations)
+            raise
+        return self._handle(r, len(w.parts), operations)
+
+    async def _flush(self, key: Hashable, w: _Window, send: Callable[[list], Awaitable[OperationIdResponse]]):
+        try:
+            await asyncio.wait_for(w.full.wait(), self.window)
+        except asyncio.TimeoutError:
+            pass
+        self._close(key, w)
+        w.sent = True
+        if not w.parts:
+            log.debug("All coalesced submissions were cancelled, nothing to send")
+            w.future.cancel()
+            return
+        log.debug(f"Sending {w.size} entries of {len(w.parts)} coalesced submissions")
+        try:
+            w.future.set_result(await send(w.entries))
+        except Exception as ex:
+            w.future.set_exception(ex)
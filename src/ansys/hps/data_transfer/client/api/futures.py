@@ -0,0 +1,191 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides futures representing submitted data transfer operations.
+
+The futures are resolved by the operation watcher of the client with the final
+state of the operation, so they can be used with ``concurrent.futures.wait``,
+``asyncio.wrap_future``, ``asyncio.gather`` and similar patterns.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+
+from ..models import Operation, OperationIdResponse
+from .watcher import AsyncOperationWatcher, OperationWatcher
+
+log = logging.getLogger(__name__)
+
+
+class TransferFuture(concurrent.futures.Future):
+    """Provides a ``concurrent.futures.Future`` resolved with the final ``Operation`` of a submission.
+
+    Parameters
+    ----------
+    operation: OperationIdResponse
+        Response of the submitted operation.
+    watcher: OperationWatcher
+        Watcher polling the operation.
+    handler: Callable[[list[Operation]], None]
+        Optional callable that is called with the operation on every poll.
+    expand: bool
+        Whether to request expanded operation groups. Default is False.
+    cancel_operations: Callable[[list[str]], bool] | None
+        Optional callable cancelling operations on the worker. Experimental, the cancel route of the
+        worker is not confirmed yet.
+    """
+
+    def __init__(
+        self,
+        operation: OperationIdResponse,
+        watcher: OperationWatcher,
+        handler=None,
+        expand: bool = False,
+        cancel_operations=None,
+    ):
+        """Initialize the TransferFuture class object."""
+        super().__init__()
+        self.operation_id = operation.id
+        self.location = operation.location
+        self.shared = getattr(operation, "shared", False)
+        self._operation = operation
+        self._watcher = watcher
+        self._cancel_operations = cancel_operations
+        self._watch = watcher.watch([operation.id], expand=expand, handler=handler)
+        self._watch.future.add_done_callback(self._on_watch_done)
+
+    @property
+    def id(self):
+        """ID of the operation, allowing the future to be passed to ``wait_for``."""
+        return self.operation_id
+
+    def scope(self, op: Operation) -> Operation:
+        """Get the state of the entries of a coalesced submission, see ``CoalescedOperation.scope``."""
+        return self._operation.scope(op) if self.shared else op
+
+    def cancel(self):
+        """Cancel the future and stop watching the operation.
+
+        The operation is also cancelled on the worker, on a best-effort basis, if the future was
+        given ``cancel_operations``. This is experimental, the cancel route of the worker is not
+        confirmed yet.
+        """
+        cancelled = super().cancel()
+        if cancelled:
+            self._watcher.unwatch(self._watch)
+            if self._cancel_operations is not None:
+                self._cancel_operations([self.operation_id])
+        return cancelled
+
+    def _on_watch_done(self, f):
+        if f.cancelled():
+            super().cancel()
+            return
+        try:
+            exc = f.exception()
+            if exc is not None:
+                self.set_exception(exc)
+            else:
+                ops = f.result()
+                self.set_result(self.scope(ops[0]) if ops else None)
+        except concurrent.futures.InvalidStateError:
+            # Cancelled by the caller in the meantime
+            pass
+
+
+class AsyncTransferFuture(asyncio.Future):
+    """Provides an ``asyncio.Future`` resolved with the final ``Operation`` of a submission.
+
+    Parameters
+    ----------
+    operation: OperationIdResponse
+        Response of the submitted operation.
+    watcher: AsyncOperationWatcher
+        Watcher polling the operation.
+    handler: Callable[[list[Operation]], Awaitable[None]]
+        Optional coroutine function that is awaited with the operation on every poll.
+    expand: bool
+        Whether to request expanded operation groups. Default is False.
+    cancel_operations: Callable[[list[str]], Awaitable[bool]] | None
+        Optional coroutine function cancelling operations on the worker. Experimental, the cancel route
+        of the worker is not confirmed yet.
+    """
+
+    def __init__(
+        self,
+        operation: OperationIdResponse,
+        watcher: AsyncOperationWatcher,
+        handler=None,
+        expand: bool = False,
+        cancel_operations=None,
+    ):
+        """Initialize the AsyncTransferFuture class object."""
+        super().__init__(loop=asyncio.get_running_loop())
+        self.operation_id = operation.id
+        self.location = operation.location
+        self.shared = getattr(operation, "shared", False)
+        self._operation = operation
+        self._watcher = watcher
+        self._cancel_operations = cancel_operations
+        self._cancel_task = None
+        self._watch = watcher.watch([operation.id], expand=expand, handler=handler)
+        self._watch.future.add_done_callback(self._on_watch_done)
+
+    @property
+    def id(self):
+        """ID of the operation, allowing the future to be passed to ``wait_for``."""
+        return self.operation_id
+
+    def scope(self, op: Operation) -> Operation:
+        """Get the state of the entries of a coalesced submission, see ``CoalescedOperation.scope``."""
+        return self._operation.scope(op) if self.shared else op
+
+    def cancel(self, msg=None):
+        """Cancel the future and stop watching the operation.
+
+        The operation is also cancelled on the worker, on a best-effort basis, by a task
+        available as ``cancel_task``, if the future was given ``cancel_operations``. This is
+        experimental, the cancel route of the worker is not confirmed yet.
+        """
+        cancelled = super().cancel(msg=msg)
+        if cancelled:
+            self._watcher.unwatch(self._watch)
+            if self._cancel_operations is not None:
+                self._cancel_task = asyncio.ensure_future(self._cancel_operations([self.operation_id]))
+        return cancelled
+
+    @property
+    def cancel_task(self) -> asyncio.Task | None:
+        """Task cancelling the operation on the worker, if the future was cancelled."""
+        return self._cancel_task
+
+    def _on_watch_done(self, f):
+        if self.done():
+            return
+        if f.cancelled():
+            super().cancel()
+        elif f.exception() is not None:
+            self.set_exception(f.exception())
+        else:
+            ops = f.result()
+            self.set_result(self.scope(ops[0]) if ops else None)
@@ -0,0 +1,273 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Provides delta polling of operation groups with a very large number of children.
+
+Expanded ``/operations`` responses contain the full ``children_detail`` of every group on every
+poll. Delta polling keeps a compact per-child state (state and bytes transferred) on the client
+and turns only children whose state changed since the previous poll into ``Operation`` objects.
+Instead of the whole expanded group, a bounded number of unfinished children is requested by ID
+on every poll, so that the cost of a poll does not grow with the size of the group.
+"""
+
+from collections import Counter
+import itertools
+import logging
+
+from ..models import Operation, OperationState
+from .watcher import final_states
+
+log = logging.getLogger(__name__)
+
+
+class OperationGroup(Operation):
+    """Provides an operation group with aggregated child state, as returned by delta polling.
+
+    ``children_detail`` only contains the children whose state changed since the previous poll.
+    ``children`` is not set, ``num_children`` gives the number of children.
+    """
+
+    num_children: int = 0
+    child_counts: dict[OperationState, int] = {}
+    children_bytes: int = 0
+    failed_children: list[str] = []
+
+
+class GroupState:
+    """Provides the compact client-side state of an operation group.
+
+    Parameters
+    ----------
+    id: str
+        ID of the operation group.
+    """
+
+    def __init__(self, id: str):
+        """Initialize the GroupState class object."""
+        self.id = id
+        self.counts = Counter()
+        self.bytes = 0
+        # Latest group operation as returned by the worker, without its children
+        self.data = {"id": id}
+        # child id -> (state, progress_current)
+        self._children = {}
+        # Unfinished children, in the order they are requested in, the dict keeps insertion order
+        self._pending = {}
+        self._failed = set()
+
+    @property
+    def num_children(self) -> int:
+        """Number of known children."""
+        return len(self._children)
+
+    @property
+    def num_pending(self) -> int:
+        """Number of children that are not final yet."""
+        return len(self._pending)
+
+    @property
+    def pending_ids(self) -> list[str]:
+        """IDs of the children that are not final yet."""
+        return list(self._pending)
+
+    def next_pending(self, n: int) -> list[str]:
+        """Get the IDs of the next ``n`` unfinished children to request."""
+        return list(itertools.islice(self._pending, n))
+
+    def rotate(self, ids: list[str]):
+        """Move requested children that are still unfinished behind the others."""
+        for i in ids:
+            if i in self._pending:
+                del self._pending[i]
+                self._pending[i] = None
+
+    @property
+    def failed_ids(self) -> list[str]:
+        """IDs of the children that failed."""
+        return list(self._failed)
+
+    def update(self, children: list[dict]) -> list[Operation]:
+        """Apply raw child operations and return the ones whose state changed.
+
+        Parameters
+        ----------
+        children: list[dict]
+            Child operations as returned by the worker.
+        """
+        changed = []
+        for ch in children:
+            key = (OperationState(ch.get("state") or OperationState.Unknown), ch.get("progress_current") or 0)
+            prev = self._children.get(ch["id"])
+            if prev == key:
+                continue
+            if prev is not None:
+                self.counts[prev[0]] -= 1
+                self.bytes -= prev[1]
+            self.counts[key[0]] += 1
+            self.bytes += key[1]
+            self._children[ch["id"]] = key
+            if key[0] in final_states:
+                self._pending.pop(ch["id"], None)
+            else:
+                self._pending.setdefault(ch["id"], None)
+            if key[0] == OperationState.Failed:
+                self._failed.add(ch["id"])
+            else:
+                self._failed.discard(ch["id"])
+            if prev is None or prev[0] != key[0]:
+                changed.append(Operation(**ch))
+        return changed
+
+    def add_ids(self, ids: list[str]):
+        """Register children known by ID only, for example from a non-expanded group."""
+        for i in ids:
+            if i not in self._children:
+                self._children[i] = (OperationState.Unknown, 0)
+                self._pending[i] = None
+                self.counts[OperationState.Unknown] += 1
+
+    def to_operation(self, group: dict, changed: list[Operation]) -> OperationGroup:
+        """Build the operation handed out to waiters and handlers.
+
+        Parameters
+        ----------
+        group: dict
+            Raw group operation without ``children_detail``.
+        changed: list[Operation]
+            Children whose state changed since the previous poll.
+        """
+        return OperationGroup(
+            **group,
+            children_detail=changed,
+            num_children=self.num_children,
+            child_counts={s: n for s, n in self.counts.items() if n},
+            children_bytes=self.bytes,
+            failed_children=self.failed_ids,
+        )
+
+
+class GroupTracker:
+    """Provides delta polling of operations, tracking the children of operation groups.
+
+    The operations are requested without expansion. The first response for a group gives the IDs
+    of its children. From then on, the group is not requested again while it has unfinished
+    children. Instead, up to ``max_children`` of them are requested by ID on every poll, in turn,
+    so that the size of every request is bounded whatever the size of the group. Once all of its
+    children are final, the group is requested again to get its own final state.
+
+    Parameters
+    ----------
+    fetch: Callable[[list[str], bool, bool], list]
+        Callable fetching operations, for example ``DataTransferApi._fetch_operations``.
+    max_children: int
+        Maximum number of children of a group requested per poll. Default is 800.
+    """
+
+    def __init__(self, fetch, max_children: int = 800):
+        """Initialize the GroupTracker class object."""
+        self._fetch = fetch
+        self.max_children = max_children
+        self.groups = {}
+
+    def poll(self, ids: list[str]) -> list[Operation]:
+        """Fetch the operations, returning groups as ``OperationGroup`` objects.
+
+        Parameters
+        ----------
+        ids: list[str]
+            IDs of the operations to fetch.
+        """
+        fetch_ids = self._fetch_ids(ids)
+        raw = self._fetch(fetch_ids, expand=False, raw=True) if fetch_ids else []
+        requested = self._plan(ids, raw)
+
+        child_ids = [i for chunk in requested.values() for i in chunk]
+        children = self._fetch(child_ids, expand=False, raw=True) if child_ids else []
+        return self._apply(ids, raw, children, requested)
+
+    def _fetch_ids(self, ids: list[str]) -> list[str]:
+        # Groups are only requested until their children are known, and once all of them are final
+        return [i for i in ids if i not in self.groups or not self.groups[i].num_pending]
+
+    def _plan(self, ids: list[str], raw: list[dict]) -> dict[str, list[str]]:
+        for op in raw:
+            if not op.get("children"):
+                continue
+            group = self.groups.setdefault(op["id"], GroupState(op["id"]))
+            group.add_ids(op["children"])
+            group.data = {k: v for k, v in op.items() if k not in ("children", "children_detail")}
+        # group id -> IDs of the children requested by this poll
+        return {i: self.groups[i].next_pending(self.max_children) for i in ids if i in self.groups}
+
+    def _apply(
+        self, ids: list[str], raw: list[dict], children: list[dict], requested: dict[str, list[str]]
+    ) -> list[Operation]:
+        raw = {op["id"]: op for op in raw}
+        owners = {i: group_id for group_id, chunk in requested.items() for i in chunk}
+        by_group = {}
+        for ch in children:
+            by_group.setdefault(owners.get(ch["id"]), []).append(ch)
+
+        ops = []
+        for i in ids:
+            group = self.groups.get(i)
+            if group is None:
+                if i in raw:
+                    ops.append(Operation(**raw[i]))
+                continue
+            changed = group.update(by_group.get(i, []))
+            group.rotate(requested[i])
+            data = group.data
+            if i not in raw:
+                # The progress of the group was not requested by this poll, the children tell it
+                data = {k: v for k, v in data.items() if not k.startswith("progress")}
+            ops.append(group.to_operation(data, changed))
+        return ops
+
+
+class AsyncGroupTracker(GroupTracker):
+    """Provides asynchronous delta polling of operations, tracking the children of operation groups.
+
+    Parameters
+    ----------
+    fetch: Callable[[list[str], bool, bool], Awaitable[list]]
+        Coroutine function fetching operations, for example ``AsyncDataTransferApi._fetch_operations``.
+    max_children: int
+        Maximum number of children of a group requested per poll. Default is 800.
+    """
+
+    async def poll(self, ids: list[str]) -> list[Operation]:
+        """Fetch the operations, returning groups as ``OperationGroup`` objects.
+
+        Parameters
+        ----------
+        ids: list[str]
+            IDs of the operations to fetch.
+        """
+        fetch_ids = self._fetch_ids(ids)
+        raw = await self._fetch(fetch_ids, expand=False, raw=True) if fetch_ids else []
+        requested = self._plan(ids, raw)
+
+        child_ids = [i for chunk in requested.values() for i in chunk]
+        children = await self._fetch(child_ids, expand=False, raw=True) if child_ids else []
+        return self._apply(ids, raw, children, requested)
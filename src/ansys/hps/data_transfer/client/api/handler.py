@@ -22,6 +22,7 @@
 
 """Provides functionality for monitoring of operations."""
 
+from collections import Counter
 import datetime
 import logging
 import time
@@ -29,6 +30,7 @@ import time
 import humanize as hz
 
 from ..models import Operation, OperationState
+from .groups import OperationGroup
 
 log = logging.getLogger(__name__)
 
@@ -40,6 +42,7 @@ class WaitHandler:
         """Meta class for WaitHandler."""
 
         expand_group = True
+        delta_group = False
 
     final = [OperationState.Succeeded, OperationState.Failed]
 
@@ -49,7 +52,7 @@ class WaitHandler:
         self.report_threshold = 2.0  # seconds
         self.min_progress_interval = 15.0  # seconds
         self.last_progress = {}
-        self.completed_ids = []
+        self.completed_ids = set()
 
     def __call__(self, ops: list[Operation]):
         """Handle operations after they are fetched."""
@@ -68,8 +71,8 @@ class WaitHandler:
                         self._log_op(logging.DEBUG, ch)
                     if ch.state not in self.final:
                         num_running += 1
-                    elif ch.id not in self.completed_ids:
-                        self.completed_ids.append(ch.id)
+                    else:
+                        self.completed_ids.add(ch.id)
 
             if op.state not in self.final:
                 num_running += 1
@@ -106,6 +109,8 @@ class WaitHandler:
 
         state = op.state.value
         if op_done:
+            # Nothing to throttle anymore, keeps memory bounded for long running waits
+            self.last_progress.pop(op.id, None)
             msg += f"{state.title()} after {duration_str}"
             msg += self._info_str(op)
             # if op.messages:
@@ -127,6 +132,84 @@ class WaitHandler:
         return f", {info}"
 
 
+class SummaryWaitHandler(WaitHandler):
+    """Allows handling of operation groups with a very large number of children.
+
+    Instead of logging every child, the handler logs aggregated per-state counts and
+    throughput of each group. Only a few counters are kept per group, and only failed
+    children are logged individually, up to ``max_failures_logged`` per group.
+
+    Groups are polled by delta, so that only children whose state changed are parsed.
+    """
+
+    class Meta(WaitHandler.Meta):
+        """Meta class for SummaryWaitHandler."""
+
+        expand_group = True
+        delta_group = True
+
+    def __init__(self):
+        """Initializes the SummaryWaitHandler class object."""
+        super().__init__()
+        self.max_failures_logged = 20
+        self._groups = {}
+
+    def _log_ops(self, ops: list[Operation]):
+        for op in ops:
+            if not op.children_detail and not isinstance(op, OperationGroup):
+                self._log_op(logging.INFO, op)
+                continue
+            self._log_group(op)
+
+    def _log_group(self, op: Operation):
+        now = time.time()
+        failed = [ch for ch in op.children_detail or [] if ch.state == OperationState.Failed]
+        if isinstance(op, OperationGroup):
+            counts = Counter(op.child_counts)
+            done_bytes = op.children_bytes
+            num_children = op.num_children
+        else:
+            counts = Counter(ch.state for ch in op.children_detail)
+            done_bytes = sum(ch.progress_current or 0 for ch in op.children_detail)
+            num_children = len(op.children_detail)
+
+        group = self._groups.setdefault(op.id, {"start": now, "last": 0.0, "failed_ids": set()})
+        self._log_failures(group, failed)
+
+        op_done = op.state in self.final
+        if not op_done and now - group["last"] < self.min_progress_interval:
+            return
+        group["last"] = now
+
+        if op.progress_current is not None:
+            done_bytes = op.progress_current
+        num_done = counts[OperationState.Succeeded] + counts[OperationState.Failed]
+        elapsed = max(now - group["start"], 1e-6)
+
+        op_state = "finished" if op_done else "is in progress"
+        msg = f"Data transfer operation group '{op.description}'({op.id}) {op_state}: "
+        msg += ", ".join(f"{counts[s]} {s.value}" for s in OperationState if counts[s])
+        msg += f", {num_done}/{num_children} done"
+        msg += f", {num_done / elapsed:.1f} operations/s"
+        if done_bytes:
+            msg += f", {hz.naturalsize(done_bytes / elapsed)}/s"
+        msg += self._info_str(op)
+        log.info(msg)
+
+        if op_done:
+            self._groups.pop(op.id, None)
+
+    def _log_failures(self, group: dict, failed: list[Operation]):
+        logged = group["failed_ids"]
+        for ch in failed:
+            if len(logged) >= self.max_failures_logged:
+                return
+            if ch.id in logged:
+                continue
+            logged.add(ch.id)
+            log.warning(f"Data transfer operation '{ch.description}'({ch.id}) failed: {ch.error or ch.messages}")
+
+
 class AsyncWaitHandler(WaitHandler):
     """Allows additional, asynchronous handling of operation status on wait."""
 
@@ -137,3 +220,15 @@ class AsyncWaitHandler(WaitHandler):
     async def __call__(self, ops: list[Operation]):
         """Handle operations after they are fetched."""
         self._log_ops(ops)
+
+
+class AsyncSummaryWaitHandler(SummaryWaitHandler):
+    """Allows asynchronous handling of operation groups with a very large number of children."""
+
+    def __init__(self):
+        """Initializes the AsyncSummaryWaitHandler class object."""
+        super().__init__()
+
+    async def __call__(self, ops: list[Operation]):
+        """Handle operations after they are fetched."""
+        self._log_ops(ops)
@@ -0,0 +1,145 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides the packing of many small files into archives, so that they are transferred as one object.
+
+Every file transferred on its own costs at least one request and one storage object, which
+dominates the transfer time of many small files. On upload, small files are packed into zip
+archives of up to ``pack_size`` bytes, each extracted in place by the worker. On download,
+the worker builds a single archive of a directory, which is extracted locally.
+"""
+
+import logging
+import os
+import tarfile
+import uuid
+import zipfile
+
+from ..models import Format
+
+log = logging.getLogger(__name__)
+
+default_pack_threshold = 256 * 1024
+default_pack_size = 64 * 1024 * 1024
+default_pack_files = 10_000
+
+
+class Packer:
+    """Provides the binning of small files into packs of bounded size.
+
+    Parameters
+    ----------
+    pack_size: int
+        Maximum total size in bytes of the files of a pack.
+    max_files: int
+        Maximum number of files in a pack.
+    """
+
+    def __init__(self, pack_size: int = default_pack_size, max_files: int = default_pack_files):
+        """Initialize the Packer class object."""
+        self.pack_size = pack_size
+        self.max_files = max_files
+        self._files = []
+        self._size = 0
+
+    def add(self, path: str, rel: str, size: int) -> list[tuple[str, str]] | None:
+        """Add a file, returning the completed pack if the file does not fit into the current one.
+
+        Parameters
+        ----------
+        path: str
+            Local path of the file.
+        rel: str
+            Path of the file inside the pack.
+        size: int
+            Size of the file in bytes.
+        """
+        full = None
+        if self._files and (self._size + size > self.pack_size or len(self._files) >= self.max_files):
+            full = self.flush()
+        self._files.append((path, rel))
+        self._size += size
+        return full
+
+    def flush(self) -> list[tuple[str, str]] | None:
+        """Get the current pack, if it holds any files, and start a new one."""
+        files, self._files, self._size = self._files, [], 0
+        return files or None
+
+
+def write_archive(files: list[tuple[str, str]], tmp_dir: str) -> str:
+    """Write files to a new zip archive, returning its path.
+
+    The files are compressed with the fastest deflate level, since input decks and other small
+    text files shrink well and the archive is written while earlier packs are transferred.
+
+    Parameters
+    ----------
+    files: list[tuple[str, str]]
+        Local path and path inside the archive of each file.
+    tmp_dir: str
+        Directory the archive is written to.
+    """
+    path = os.path.join(tmp_dir, archive_name())
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for local_path, rel in files:
+            zf.write(local_path, rel)
+    log.debug(f"Packed {len(files)} files into {path} of {os.path.getsize(path)} bytes")
+    return path
+
+
+def archive_name(format: Format = Format.Zip) -> str:
+    """Get a unique name for a pack, hidden so that it is not mistaken for a transferred file."""
+    return f".dt-pack-{uuid.uuid4().hex}.{format.value}"
+
+
+def extract_archive(path: str, dst: str, format: Format):
+    """Extract a local archive into a directory.
+
+    Tar archives are read as a stream, so that they are extracted in a single pass without seeking.
+    Members with absolute paths or paths leaving ``dst`` are rejected.
+
+    Parameters
+    ----------
+    path: str
+        Path of the archive.
+    dst: str
+        Directory the archive is extracted to.
+    format: Format
+        Format of the archive.
+    """
+    if format == Format.Zip:
+        # Zip members are sanitized by extractall, which never writes outside of dst
+        with zipfile.ZipFile(path) as zf:
+            zf.extractall(dst)
+        return
+
+    with tarfile.open(path, mode="r|gz") as tf:
+        if hasattr(tarfile, "data_filter"):
+            tf.extractall(dst, filter="data")
+            return
+        root = os.path.realpath(dst)
+        for member in tf:
+            target = os.path.realpath(os.path.join(root, member.name))
+            if os.path.commonpath([root, target]) != root or member.issym() or member.islnk():
+                raise ValueError(f"Refusing to extract {member.name} from {path}")
+            tf.extract(member, root)
@@ -0,0 +1,146 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides polling strategies that decide how long to wait between operation status requests."""
+
+import logging
+import time
+
+from ..models import Operation, OperationState
+from ..utils.jitter import get_expo_backoff
+
+log = logging.getLogger(__name__)
+
+
+class BackoffPolling:
+    """Provides exponential backoff with jitter between polls.
+
+    Short operations need a short time, but larger operations would be spammed by too many
+    calls over their lifetime of minutes, so the interval grows up to ``cap`` seconds.
+
+    Parameters
+    ----------
+    interval: float
+        Interval in seconds for the first poll. Default is 0.1.
+    cap: float
+        The maximum backoff value used to calculate the next wait time. Default is 5.0.
+    """
+
+    def __init__(self, interval: float = 0.1, cap: float = 5.0):
+        """Initialize the BackoffPolling class object."""
+        self.interval = interval
+        self.cap = cap
+
+    def next_interval(self, attempt: int, ops: list[Operation]) -> float:
+        """Get the time to wait before the next poll.
+
+        Parameters
+        ----------
+        attempt: int
+            Number of polls made so far.
+        ops: list[Operation]
+            Operations returned by the last poll.
+        """
+        return get_expo_backoff(self.interval, attempts=attempt, cap=self.cap, jitter=True)
+
+
+class ProgressRatePolling(BackoffPolling):
+    """Provides polling scheduled around the predicted completion time of running operations.
+
+    The transfer rate of each operation is estimated from the change of ``progress_current``
+    (or ``progress``) between two polls. The next poll is scheduled at the earliest predicted
+    completion, bounded by ``min_interval`` and ``max_interval``. Operations without progress
+    information fall back to exponential backoff.
+
+    Parameters
+    ----------
+    min_interval: float
+        Minimum time in seconds between polls. Default is 0.1.
+    max_interval: float
+        Maximum time in seconds between polls. Default is 30.0.
+    cap: float
+        The maximum backoff value used while no rate is known. Default is 5.0.
+    margin: float
+        Fraction of the predicted time to completion to wait, slightly below one so that
+        the poll lands close to, but not after, the completion. Default is 0.9.
+    """
+
+    def __init__(self, min_interval: float = 0.1, max_interval: float = 30.0, cap: float = 5.0, margin: float = 0.9):
+        """Initialize the ProgressRatePolling class object."""
+        super().__init__(interval=min_interval, cap=min(cap, max_interval))
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.margin = margin
+        self._samples = {}
+
+    def next_interval(self, attempt: int, ops: list[Operation]) -> float:
+        """Get the time to wait before the next poll.
+
+        Parameters
+        ----------
+        attempt: int
+            Number of polls made so far.
+        ops: list[Operation]
+            Operations returned by the last poll.
+        """
+        now = time.monotonic()
+        etas = []
+        for op in ops:
+            if op.state in [OperationState.Succeeded, OperationState.Failed]:
+                self._samples.pop(op.id, None)
+                continue
+            eta = self._eta(op, now)
+            if eta is not None:
+                etas.append(eta)
+
+        if not etas:
+            return super().next_interval(attempt, ops)
+        return min(max(min(etas) * self.margin, self.min_interval), self.max_interval)
+
+    def _eta(self, op: Operation, now: float) -> float | None:
+        current, total = self._progress(op)
+        if current is None:
+            return None
+
+        prev = self._samples.get(op.id)
+        self._samples[op.id] = (now, current)
+        if prev is None:
+            return None
+
+        prev_time, prev_current = prev
+        if current == prev_current:
+            # No progress since last poll, keep the previous sample to measure over a longer window
+            self._samples[op.id] = prev
+            return None
+        if current < prev_current or now <= prev_time:
+            # The operation started over, for example after a retry
+            return None
+
+        rate = (current - prev_current) / (now - prev_time)
+        return (total - current) / rate
+
+    def _progress(self, op: Operation) -> tuple[float | None, float | None]:
+        if op.progress_total and op.progress_current is not None:
+            return float(op.progress_current), float(op.progress_total)
+        if op.progress is not None:
+            return float(op.progress), 1.0
+        return None, None
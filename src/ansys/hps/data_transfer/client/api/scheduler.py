@@ -0,0 +1,432 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides client-side admission control and scheduling of submissions by priority.
+
+The worker runs operations in submission order and queues everything it is sent. To keep
+small interactive transfers from queueing behind bulk transfers, and to keep the queue of
+the worker short, the scheduler bounds the work that is submitted but not finished yet:
+the number of batches, of operations, of bytes of local files to upload and of operations
+still queued at the worker, globally and per remote. Further submissions wait and are
+admitted highest priority first, or are rejected if the scheduler does not block.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+import enum
+import heapq
+import itertools
+import logging
+import os
+import threading
+
+from ..exceptions import AdmissionError
+from ..models import Operation, OperationIdResponse, OperationState
+
+log = logging.getLogger(__name__)
+
+
+class Priority(enum.IntEnum):
+    """Provides the priority classes of submissions. Higher values are admitted first."""
+
+    bulk = 0
+    normal = 50
+    interactive = 100
+
+
+class Cost:
+    """Provides the size of a submitted batch.
+
+    Parameters
+    ----------
+    operations: int
+        Number of operations, counting every file or path of the batch. Default is 1.
+    bytes: int
+        Number of bytes of local files uploaded by the batch. Default is 0.
+    remote: str
+        Remote the batch works on. Default is ``any``.
+    """
+
+    def __init__(self, operations: int = 1, bytes: int = 0, remote: str = "any"):
+        """Initialize the Cost class object."""
+        self.operations = operations
+        self.bytes = bytes
+        self.remote = remote
+
+    def __repr__(self):
+        """Get a string representation of the cost."""
+        return f"Cost(operations={self.operations}, bytes={self.bytes}, remote={self.remote!r})"
+
+
+class Limits:
+    """Provides bounds on the work that is submitted to the worker but not finished yet.
+
+    A batch exceeding a bound on its own is admitted once nothing else counts against that
+    bound, so that it cannot wait forever. Bounds that are None are not enforced.
+
+    Parameters
+    ----------
+    max_operations: int | None
+        Maximum number of unfinished operations, counting every file or path of a batch.
+    max_bytes: int | None
+        Maximum number of bytes of local files of unfinished uploads.
+    max_queued: int | None
+        Maximum number of operations queued at the worker that are not running yet.
+    """
+
+    def __init__(self, max_operations: int | None = None, max_bytes: int | None = None, max_queued: int | None = None):
+        """Initialize the Limits class object."""
+        self.max_operations = max_operations
+        self.max_bytes = max_bytes
+        self.max_queued = max_queued
+
+    def allows(self, usage: tuple[int, int, int], cost: Cost) -> bool:
+        """Check whether a batch fits next to the unfinished work.
+
+        Parameters
+        ----------
+        usage: tuple[int, int, int]
+            Unfinished operations, bytes and queued operations.
+        cost: Cost
+            Size of the batch.
+        """
+        operations, size, queued = usage
+        for limit, used, needed in (
+            (self.max_operations, operations, cost.operations),
+            (self.max_bytes, size, cost.bytes),
+            (self.max_queued, queued, cost.operations),
+        ):
+            if limit is not None and used > 0 and used + needed > limit:
+                return False
+        return True
+
+
+def batch_cost(operations: Iterable, count_bytes: bool = False) -> Cost:
+    """Get the size of a batch of ``StoragePath`` or ``SrcDst`` operations.
+
+    The remote of the batch is taken from its first operation: the destination of uploads of
+    local files, otherwise the source or the path itself.
+
+    Parameters
+    ----------
+    operations: Iterable
+        Operations of the batch, which must be sized.
+    count_bytes: bool
+        Whether to sum up the sizes of uploaded local files. Default is False.
+    """
+    remote = "any"
+    for op in operations:
+        src = getattr(op, "src", None)
+        if src is None:
+            remote = op.remote
+        else:
+            remote = op.dst.remote if src.remote == "local" else src.remote
+        break
+
+    size = 0
+    if count_bytes:
+        for op in operations:
+            src = getattr(op, "src", None)
+            if src is not None and src.remote == "local":
+                try:
+                    size += os.path.getsize(src.path)
+                except OSError:
+                    pass
+    return Cost(len(operations), size, remote or "any")
+
+
+class _Ticket:
+    """Provides the state of a submission from its request for admission until it finishes."""
+
+    def __init__(self, priority: int, seq: int, cost: Cost):
+        self.key = (-int(priority), seq)
+        self.priority = priority
+        self.cost = cost
+        self.queued = True
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+class _SchedulerBase:
+    """Provides the admission bookkeeping shared by the thread and asyncio schedulers."""
+
+    def __init__(
+        self,
+        watcher,
+        max_active: int | None = None,
+        reserved: int = 1,
+        limits: Limits | None = None,
+        remote_limits: dict[str, Limits] | None = None,
+        block: bool = True,
+    ):
+        if max_active is not None and max_active < 1:
+            raise ValueError(f"max_active must be at least 1, got {max_active}")
+        self.watcher = watcher
+        self.max_active = max_active
+        self.reserved = reserved if max_active is not None and reserved < max_active else 0
+        self.limits = limits
+        self.remote_limits = remote_limits or {}
+        self.block = block
+        self._active = set()
+        self._waiting = []
+        self._seq = itertools.count()
+
+    @property
+    def num_active(self) -> int:
+        """Number of admitted batches that are not finished yet."""
+        return len(self._active)
+
+    @property
+    def num_waiting(self) -> int:
+        """Number of submissions waiting for admission."""
+        return len(self._waiting)
+
+    @property
+    def needs_cost(self) -> bool:
+        """Whether admission depends on the size of the batches."""
+        return self.limits is not None or bool(self.remote_limits)
+
+    @property
+    def needs_bytes(self) -> bool:
+        """Whether admission depends on the bytes uploaded by the batches."""
+        limits = [self.limits, *self.remote_limits.values()]
+        return any(lim is not None and lim.max_bytes is not None for lim in limits)
+
+    def usage(self, remote: str | None = None) -> tuple[int, int, int]:
+        """Get the unfinished operations, bytes and queued operations, of all remotes or of one."""
+        operations = size = queued = 0
+        for t in self._active:
+            if remote is None or t.cost.remote == remote:
+                operations += t.cost.operations
+                size += t.cost.bytes
+                queued += t.cost.operations if t.queued else 0
+        return operations, size, queued
+
+    def _enqueue(self, priority: int, cost: Cost | None) -> _Ticket:
+        ticket = _Ticket(priority, next(self._seq), cost or Cost())
+        heapq.heappush(self._waiting, ticket)
+        return ticket
+
+    def _dequeue(self, ticket: _Ticket):
+        self._waiting.remove(ticket)
+        heapq.heapify(self._waiting)
+
+    def _admissible(self, ticket: _Ticket) -> bool:
+        return self._next_admissible() is ticket
+
+    def _next_admissible(self) -> _Ticket | None:
+        """Get the waiting ticket to admit next, if any.
+
+        Tickets are considered highest priority first. A ticket held back only by the limits of its
+        own remote does not block the tickets of other remotes, while ``max_active`` and the global
+        limits keep the order strict.
+        """
+        blocked = set()
+        for ticket in sorted(self._waiting):
+            if not self._globally_admissible(ticket):
+                return None
+            remote = ticket.cost.remote
+            if remote in blocked:
+                continue
+            remote_limits = self.remote_limits.get(remote)
+            if remote_limits is not None and not remote_limits.allows(self.usage(remote), ticket.cost):
+                blocked.add(remote)
+                continue
+            return ticket
+        return None
+
+    def _globally_admissible(self, ticket: _Ticket) -> bool:
+        if self.max_active is not None:
+            # Reserved slots keep room for interactive submissions while bulk batches run
+            limit = self.max_active if ticket.priority >= Priority.interactive else self.max_active - self.reserved
+            if len(self._active) >= limit:
+                return False
+        return self.limits is None or self.limits.allows(self.usage(), ticket.cost)
+
+    def _admit(self, ticket: _Ticket):
+        self._dequeue(ticket)
+        self._active.add(ticket)
+
+    def _reject(self, ticket: _Ticket):
+        self._dequeue(ticket)
+        raise AdmissionError(
+            f"Submission of {ticket.cost.operations} operations on remote '{ticket.cost.remote}' rejected, "
+            f"{len(self._active)} batches with {self.usage()[0]} operations are still in flight"
+        )
+
+    def _observe(self, ticket: _Ticket, ops: list[Operation]) -> bool:
+        """Update whether a batch is still queued at the worker, returning True if it changed."""
+        queued = bool(ops) and ops[0].state in (OperationState.Queued, OperationState.Unknown)
+        changed = queued != ticket.queued
+        ticket.queued = queued
+        return changed
+
+
+class PriorityScheduler(_SchedulerBase):
+    """Provides thread-safe admission of submissions by priority.
+
+    Parameters
+    ----------
+    watcher: OperationWatcher
+        Watcher polling the submitted operations, to learn when they run and finish.
+    max_active: int | None
+        Maximum number of submitted batches unfinished on the worker at once. Default is None.
+    reserved: int
+        Number of the ``max_active`` slots only used by submissions of ``Priority.interactive``
+        or higher. Default is 1.
+    limits: Limits | None
+        Bounds on the unfinished work of all remotes. Default is None.
+    remote_limits: dict[str, Limits] | None
+        Bounds on the unfinished work by remote name. Default is None.
+    block: bool
+        Whether submissions wait for admission. Otherwise ``AdmissionError`` is raised for
+        submissions that cannot be admitted right away. Default is True.
+    """
+
+    def __init__(self, watcher, max_active: int | None = None, reserved: int = 1, **kwargs):
+        """Initialize the PriorityScheduler class object."""
+        super().__init__(watcher, max_active, reserved=reserved, **kwargs)
+        self._cond = threading.Condition()
+
+    def submit(
+        self, priority: int, fn: Callable[[], OperationIdResponse], cost: Cost | None = None
+    ) -> OperationIdResponse:
+        """Wait for admission, then submit a batch.
+
+        Parameters
+        ----------
+        priority: int
+            Priority of the batch, higher values are admitted first.
+        fn: Callable[[], OperationIdResponse]
+            Callable sending the submission request.
+        cost: Cost | None
+            Size of the batch. Default is None, which counts a single operation.
+        """
+        with self._cond:
+            ticket = self._enqueue(priority, cost)
+            if not self.block and not self._admissible(ticket):
+                self._reject(ticket)
+            self._cond.wait_for(lambda: self._admissible(ticket))
+            self._admit(ticket)
+            # The next waiter may fit as well
+            self._cond.notify_all()
+
+        try:
+            r = fn()
+        except BaseException:
+            self._release(ticket)
+            raise
+        w = self.watcher.watch([r.id], handler=lambda ops: self._on_poll(ticket, ops))
+        w.future.add_done_callback(lambda _: self._release(ticket))
+        return r
+
+    def _on_poll(self, ticket: _Ticket, ops: list[Operation]):
+        with self._cond:
+            if self._observe(ticket, ops):
+                self._cond.notify_all()
+
+    def _release(self, ticket: _Ticket):
+        with self._cond:
+            self._active.discard(ticket)
+            self._cond.notify_all()
+
+
+class AsyncPriorityScheduler(_SchedulerBase):
+    """Provides admission of submissions by priority for asyncio tasks.
+
+    Parameters
+    ----------
+    watcher: AsyncOperationWatcher
+        Watcher polling the submitted operations, to learn when they run and finish.
+    max_active: int | None
+        Maximum number of submitted batches unfinished on the worker at once. Default is None.
+    reserved: int
+        Number of the ``max_active`` slots only used by submissions of ``Priority.interactive``
+        or higher. Default is 1.
+    limits: Limits | None
+        Bounds on the unfinished work of all remotes. Default is None.
+    remote_limits: dict[str, Limits] | None
+        Bounds on the unfinished work by remote name. Default is None.
+    block: bool
+        Whether submissions wait for admission. Otherwise ``AdmissionError`` is raised for
+        submissions that cannot be admitted right away. Default is True.
+    """
+
+    def __init__(self, watcher, max_active: int | None = None, reserved: int = 1, **kwargs):
+        """Initialize the AsyncPriorityScheduler class object."""
+        super().__init__(watcher, max_active, reserved=reserved, **kwargs)
+        self._futures = {}
+
+    async def submit(
+        self, priority: int, fn: Callable[[], Awaitable[OperationIdResponse]], cost: Cost | None = None
+    ) -> OperationIdResponse:
+        """Wait for admission, then submit a batch.
+
+        Parameters
+        ----------
+        priority: int
+            Priority of the batch, higher values are admitted first.
+        fn: Callable[[], Awaitable[OperationIdResponse]]
+            Coroutine function sending the submission request.
+        cost: Cost | None
+            Size of the batch. Default is None, which counts a single operation.
+        """
+        ticket = self._enqueue(priority, cost)
+        if not self.block and not self._admissible(ticket):
+            self._reject(ticket)
+        admitted = asyncio.get_running_loop().create_future()
+        self._futures[ticket] = admitted
+        self._dispatch()
+        try:
+            await admitted
+        except asyncio.CancelledError:
+            if admitted.cancelled():
+                self._futures.pop(ticket, None)
+                self._dequeue(ticket)
+                self._dispatch()
+            else:
+                self._release(ticket)
+            raise
+
+        try:
+            r = await fn()
+        except BaseException:
+            self._release(ticket)
+            raise
+
+        async def on_poll(ops):
+            if self._observe(ticket, ops):
+                self._dispatch()
+
+        w = self.watcher.watch([r.id], handler=on_poll)
+        w.future.add_done_callback(lambda _: self._release(ticket))
+        return r
+
+    def _dispatch(self):
+        while (ticket := self._next_admissible()) is not None:
+            self._admit(ticket)
+            self._futures.pop(ticket).set_result(None)
+
+    def _release(self, ticket: _Ticket):
+        self._active.discard(ticket)
+        self._dispatch()
@@ -0,0 +1,421 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides the bookkeeping of incremental directory synchronization.
+
+Local files are compared by size and modification time against the state recorded in a
+local manifest after the previous sync. Without a manifest, or when asked to refresh it,
+the remote state is taken from an extended listing of the remote directory.
+"""
+
+import datetime
+import json
+import logging
+import os
+
+from ..models import CopyBatch, Operation, OperationState
+from ..utils.walk import as_patterns, matches, walk_files
+
+log = logging.getLogger(__name__)
+
+directions = ("upload", "download")
+default_manifest_name = ".dt_sync_manifest.json"
+_time_keys = ("mtime", "mod_time", "modified", "modified_at", "last_modified", "updated_at")
+
+
+class SyncManifest:
+    """Provides the state of files after the last sync of a local directory with a remote directory.
+
+    The manifest is a JSON file holding one entry per relative path with the local size and
+    modification time, and the remote size and modification time if known. A single file can
+    hold the state of several remote targets.
+
+    Parameters
+    ----------
+    path: str
+        Path of the manifest file.
+    target: str
+        Key of the synced remote directory, for example ``any:results``.
+    """
+
+    version = 1
+
+    def __init__(self, path: str, target: str):
+        """Initialize the SyncManifest class object."""
+        self.path = path
+        self.target = target
+        self._data = {"version": self.version, "targets": {}}
+        self.loaded = False
+        self.load()
+
+    @property
+    def files(self) -> dict[str, dict]:
+        """Recorded state of the files of the target by relative path."""
+        return self._data["targets"].setdefault(self.target, {})
+
+    def load(self):
+        """Load the manifest from disk, starting over if it is missing or unreadable."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable sync manifest {self.path}: {e}")
+            return
+        if data.get("version") != self.version:
+            log.info(f"Ignoring sync manifest {self.path} with unsupported version {data.get('version')}")
+            return
+        self._data = data
+        self.loaded = self.target in data.get("targets", {})
+
+    def save(self):
+        """Write the manifest atomically."""
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._data, f, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    def record(self, rel: str, local: tuple[int, int], remote: tuple[int, float | None] | None = None):
+        """Record the state of a synced file.
+
+        Parameters
+        ----------
+        rel: str
+            Path relative to the synced directories.
+        local: tuple[int, int]
+            Local size in bytes and modification time in nanoseconds.
+        remote: tuple[int, float | None] | None
+            Remote size in bytes and modification time in seconds, if known.
+        """
+        entry = {"size": local[0], "mtime_ns": local[1]}
+        if remote is not None:
+            entry["remote_size"] = remote[0]
+            entry["remote_mtime"] = remote[1]
+        self.files[rel] = entry
+
+
+class SyncPlan:
+    """Provides the files to transfer for one sync and records them in the manifest once transferred.
+
+    Parameters
+    ----------
+    direction: str
+        Either ``upload`` or ``download``.
+    local_dir: str
+        Local directory.
+    remote_dir: str
+        Remote directory.
+    remote: str
+        Remote the directory is on.
+    manifest: SyncManifest
+        State recorded by the previous sync.
+    local: dict[str, tuple[int, int]] | None
+        Local size and modification time in nanoseconds by relative path. Only used for uploads.
+    remote_files: dict[str, tuple[int | None, float | None]] | None
+        Remote size and modification time by relative path, if listed.
+    changed: list[str]
+        Relative paths of the files to transfer.
+    """
+
+    def __init__(
+        self,
+        direction: str,
+        local_dir: str,
+        remote_dir: str,
+        remote: str,
+        manifest: SyncManifest,
+        local: dict[str, tuple[int, int]] | None,
+        remote_files: dict[str, tuple[int | None, float | None]] | None,
+        changed: list[str],
+    ):
+        """Initialize the SyncPlan class object."""
+        self.direction = direction
+        self.local_dir = local_dir
+        self.remote_dir = remote_dir
+        self.remote = remote
+        self.manifest = manifest
+        self.local = local
+        self.remote_files = remote_files
+        self.changed = changed
+
+    def operations(self) -> CopyBatch:
+        """Get the copy operations transferring the changed files."""
+        local_paths = [os.path.join(self.local_dir, rel) for rel in self.changed]
+        remote_paths = [join(self.remote_dir, rel) for rel in self.changed]
+        if self.direction == "upload":
+            return CopyBatch(local_paths, remote_paths, src_remotes="local", dst_remotes=self.remote)
+        return CopyBatch(remote_paths, local_paths, src_remotes=self.remote, dst_remotes="local")
+
+    def keep(self, operations: list):
+        """Restrict the changed files to those transferred by the given copy operations."""
+        if self.direction == "upload":
+            kept = {op.src.path for op in operations}
+        else:
+            kept = {op.dst.path for op in operations}
+        self.changed = [rel for rel in self.changed if os.path.join(self.local_dir, rel) in kept]
+
+    def finish(self, ids: list[str], ops: list[Operation], batch_size: int):
+        """Record the transferred and unchanged files in the manifest and save it.
+
+        Parameters
+        ----------
+        ids: list[str]
+            IDs of the copy operations, one per batch of ``batch_size`` changed files.
+        ops: list[Operation]
+            Final state of the copy operations.
+        batch_size: int
+            Number of files per copy operation.
+        """
+        files = self.manifest.files
+        current = self.local if self.direction == "upload" else self.remote_files
+        for rel in [rel for rel in files if rel not in current]:
+            del files[rel]
+
+        changed = set(self.changed)
+        for rel in current:
+            if rel not in changed:
+                self._record(rel, transferred=False)
+
+        by_id = {op.id: op for op in ops}
+        for index, id in enumerate(ids):
+            chunk = self.changed[index * batch_size : (index + 1) * batch_size]
+            op = by_id.get(id)
+            if op is None or op.state != OperationState.Succeeded:
+                log.warning(f"Sync {self.direction} of {len(chunk)} files did not succeed, they are retried next time")
+                for rel in chunk:
+                    files.pop(rel, None)
+                continue
+            for rel in chunk:
+                self._record(rel, transferred=True)
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.manifest.path)), exist_ok=True)
+        self.manifest.save()
+
+    def _record(self, rel: str, transferred: bool):
+        if self.direction == "upload":
+            local = self.local[rel]
+            if transferred:
+                # The remote time of the new copy is unknown until the next listing
+                self.manifest.record(rel, local, (local[0], None))
+            elif self.remote_files is not None:
+                self.manifest.record(rel, local, self.remote_files.get(rel))
+            else:
+                # Unchanged since the last sync, or skipped because the remote file is identical
+                entry = self.manifest.files.get(rel, {})
+                self.manifest.record(rel, local, (entry.get("remote_size", local[0]), entry.get("remote_mtime")))
+            return
+
+        local = local_state(os.path.join(self.local_dir, rel))
+        if local is not None:
+            self.manifest.record(rel, local, self.remote_files[rel])
+
+
+def local_files(local_dir: str, include=None, exclude=None, workers: int = 8) -> dict[str, tuple[int, int]]:
+    """Get size and modification time in nanoseconds of the files below a local directory by relative path."""
+    exclude = [*as_patterns(exclude), default_manifest_name, f"{default_manifest_name}.tmp"]
+    files = {}
+    for path, rel in walk_files(local_dir, include=include, exclude=exclude, workers=workers):
+        try:
+            st = os.stat(path)
+        except OSError as e:
+            log.warning(f"Skipping {path}: {e}")
+            continue
+        files[rel] = (st.st_size, st.st_mtime_ns)
+    return files
+
+
+def local_state(path: str) -> tuple[int, int] | None:
+    """Get size and modification time in nanoseconds of a local file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def listing_entries(result: dict, path: str, remote: str) -> list | None:
+    """Get the entries of a directory from the result of a ``list`` operation."""
+    if not result:
+        return None
+    for key in (f"{remote}:{path}", path):
+        if key in result:
+            return result[key]
+    for key, entries in result.items():
+        if key.endswith(f":{path}"):
+            return entries
+    return None
+
+
+def collect_listing(
+    result: dict,
+    dirs: list[str],
+    paths: list[str],
+    remote: str,
+    files: dict[str, tuple[int | None, float | None]],
+) -> list[str]:
+    """Add the files of listed remote directories to ``files`` and get their subdirectories.
+
+    Parameters
+    ----------
+    result: dict
+        Result of the ``list`` operation.
+    dirs: list[str]
+        Listed directories relative to the synced remote directory.
+    paths: list[str]
+        Listed remote paths, in the same order as ``dirs``.
+    remote: str
+        Remote the directories are on.
+    files: dict[str, tuple[int | None, float | None]]
+        Remote size and modification time by relative path, updated in place.
+    """
+    subdirs = []
+    for rel_dir, path in zip(dirs, paths, strict=True):
+        for item in listing_entries(result, path, remote) or []:
+            name, is_dir, size, mtime = parse_entry(item)
+            if not name:
+                continue
+            rel = join(rel_dir, name)
+            if is_dir:
+                subdirs.append(rel)
+            else:
+                files[rel] = (size, mtime)
+    return subdirs
+
+
+def parse_entry(item) -> tuple[str, bool, int | None, float | None]:
+    """Parse an entry of an extended listing into name, whether it is a directory, size and modification time."""
+    if not isinstance(item, dict):
+        # Basic listing, names only
+        name = str(item)
+        return name.rstrip("/"), name.endswith("/"), None, None
+
+    name = item.get("name") or ""
+    is_dir = bool(item.get("is_dir") or item.get("dir") or item.get("type") in ("dir", "directory"))
+    is_dir = is_dir or name.endswith("/")
+    size = item.get("size")
+    mtime = next((parse_time(item[k]) for k in _time_keys if item.get(k) is not None), None)
+    return name.rstrip("/"), is_dir, size, mtime
+
+
+def parse_time(value) -> float | None:
+    """Parse a timestamp given as seconds since the epoch or as an ISO 8601 string."""
+    if isinstance(value, int | float):
+        return float(value)
+    try:
+        return datetime.datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def plan_upload(
+    local: dict[str, tuple[int, int]],
+    manifest: SyncManifest,
+    remote: dict[str, tuple[int | None, float | None]] | None,
+) -> list[str]:
+    """Get the relative paths of the local files that need to be uploaded.
+
+    Parameters
+    ----------
+    local: dict[str, tuple[int, int]]
+        Local size and modification time in nanoseconds by relative path.
+    manifest: SyncManifest
+        State recorded by the previous sync.
+    remote: dict[str, tuple[int | None, float | None]] | None
+        Remote size and modification time by relative path, or None to rely on the manifest only.
+    """
+    changed = []
+    for rel, (size, mtime_ns) in local.items():
+        if remote is None:
+            entry = manifest.files.get(rel)
+            if entry is None or entry["size"] != size or entry["mtime_ns"] != mtime_ns:
+                changed.append(rel)
+            continue
+
+        remote_size, remote_mtime = remote.get(rel, (None, None))
+        # Without a remote time, the file can only be trusted if it is unchanged since the last sync
+        entry = manifest.files.get(rel)
+        unchanged = entry is not None and entry["size"] == size and entry["mtime_ns"] == mtime_ns
+        if remote_size != size:
+            changed.append(rel)
+        elif remote_mtime is not None:
+            if mtime_ns / 1e9 > remote_mtime:
+                changed.append(rel)
+        elif not unchanged:
+            changed.append(rel)
+    return changed
+
+
+def plan_download(
+    local_dir: str,
+    remote: dict[str, tuple[int | None, float | None]],
+    manifest: SyncManifest,
+) -> list[str]:
+    """Get the relative paths of the remote files that need to be downloaded.
+
+    Parameters
+    ----------
+    local_dir: str
+        Local directory the files are downloaded to.
+    remote: dict[str, tuple[int | None, float | None]]
+        Remote size and modification time by relative path.
+    manifest: SyncManifest
+        State recorded by the previous sync.
+    """
+    changed = []
+    for rel, (remote_size, remote_mtime) in remote.items():
+        local = local_state(os.path.join(local_dir, rel))
+        if local is None:
+            changed.append(rel)
+            continue
+
+        entry = manifest.files.get(rel)
+        if entry is not None:
+            local_unchanged = entry["size"] == local[0] and entry["mtime_ns"] == local[1]
+            remote_unchanged = entry.get("remote_size") == remote_size and entry.get("remote_mtime") == remote_mtime
+            if not (local_unchanged and remote_unchanged):
+                changed.append(rel)
+        elif remote_size != local[0] or remote_mtime is None or local[1] / 1e9 < remote_mtime:
+            changed.append(rel)
+    return changed
+
+
+def filter_remote(
+    remote: dict[str, tuple[int | None, float | None]], include=None, exclude=None
+) -> dict[str, tuple[int | None, float | None]]:
+    """Apply include and exclude glob patterns to remote files given by relative path."""
+    include, exclude = as_patterns(include), as_patterns(exclude)
+    files = {}
+    for rel, state in remote.items():
+        parts = rel.split("/")
+        # Excluded directories exclude everything below them
+        if exclude and any(matches(parts[i], "/".join(parts[: i + 1]), exclude) for i in range(len(parts))):
+            continue
+        if include and not matches(parts[-1], rel, include):
+            continue
+        files[rel] = state
+    return files
+
+
+def join(*parts: str) -> str:
+    """Join remote path parts with forward slashes, ignoring empty parts."""
+    return "/".join(p.strip("/") for p in parts if p and p.strip("/"))
@@ -0,0 +1,429 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides a shared watcher that multiplexes operation polling for concurrent waiters.
+
+Instead of every waiter running its own loop against the worker, waiters register
+their operation IDs with a single watcher. The watcher merges all outstanding IDs
+into one batched status request per tick and fans the results out to the waiters.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import traceback
+
+from httpx import TimeoutException, TransportError
+
+from ..exceptions import APIError, TimeoutError
+from ..models import Operation, OperationState
+from .polling import BackoffPolling
+
+log = logging.getLogger(__name__)
+
+final_states = [OperationState.Succeeded, OperationState.Failed]
+
+
+class OperationWatch:
+    """Provides the registration of a single waiter with an operation watcher.
+
+    Parameters
+    ----------
+    ids: list[str]
+        IDs of the operations to wait for.
+    expand: bool
+        Whether to request expanded operation groups.
+    handler: Callable[[list[Operation]], None]
+        Optional callable that is called with the operations of this watch fetched on every poll.
+    future: concurrent.futures.Future | asyncio.Future
+        Future resolved with the list of operations once all of them are final.
+    """
+
+    def __init__(self, ids: list[str], expand: bool, handler, future):
+        """Initialize the OperationWatch class object."""
+        self.ids = ids
+        self.expand = expand
+        self.handler = handler
+        self.future = future
+        self._latest = {}
+        self._completed = set()
+
+    @property
+    def ops(self) -> list[Operation]:
+        """Latest known state of the watched operations."""
+        return [self._latest[i] for i in self.ids if i in self._latest]
+
+    @property
+    def pending_ids(self) -> list[str]:
+        """IDs of the watched operations that are not final yet."""
+        return [i for i in self.ids if i not in self._completed]
+
+    def done(self):
+        """Check whether the watch is resolved."""
+        return self.future.done()
+
+    def _collect(self, by_id: dict[str, Operation]):
+        fetched = [by_id[i] for i in self.pending_ids if i in by_id]
+        for op in fetched:
+            self._latest[op.id] = op
+            if op.state in final_states:
+                self._completed.add(op.id)
+        return fetched
+
+    def _resolve(self):
+        # Operations missing from the response are still pending
+        if self.future.done() or self.pending_ids:
+            return
+        try:
+            self.future.set_result(self.ops)
+        except (concurrent.futures.InvalidStateError, asyncio.InvalidStateError):
+            # The waiter gave up in the meantime
+            pass
+
+    def _fail(self, exc: Exception):
+        if self.future.done():
+            return
+        try:
+            self.future.set_exception(exc)
+        except (concurrent.futures.InvalidStateError, asyncio.InvalidStateError):
+            pass
+
+
+def _merge_ids(watches: list[OperationWatch]):
+    # dict keeps insertion order, so the request stays stable between ticks
+    return list(dict.fromkeys(i for w in watches for i in w.pending_ids))
+
+
+def _transient(e: Exception) -> bool:
+    """Check whether a failed status request is worth retrying, like connection errors and 5xx responses."""
+    return isinstance(e, TransportError | APIError)
+
+
+def _on_error(watcher, watches: list[OperationWatch], expand: bool, e: Exception):
+    """Keep polling after transient errors, failing the waiters once too many happened in a row."""
+    watcher._failures[expand] += 1
+    if _transient(e) and watcher._failures[expand] < watcher.max_failures:
+        log.debug(f"Error getting operations ({watcher._failures[expand]} in a row), retrying: {e}")
+        return
+    log.debug(f"Error getting operations: {e}")
+    watcher._failures[expand] = 0
+    for w in watches:
+        w._fail(e)
+
+
+class OperationWatcher:
+    """Provides a thread-based watcher that polls operations on behalf of all waiters.
+
+    The polling thread is started on the first registration and exits once no waiter is left.
+
+    Parameters
+    ----------
+    fetch: Callable[[list[str], bool], list[Operation]]
+        Callable fetching the operations for a list of IDs, for example ``DataTransferApi._fetch_operations``.
+    interval: float
+        Interval in seconds. Default is 0.1.
+    cap: float
+        The maximum backoff value used to calculate the next wait time. Default is 5.0.
+    polling: BackoffPolling | None
+        Strategy deciding how long to wait between polls. Default is None, which uses
+        exponential backoff based on ``interval`` and ``cap``.
+    max_failures: int
+        Number of consecutive failed status requests, like connection errors or 5xx responses,
+        after which the waiters are failed. Default is 5.
+    """
+
+    def __init__(
+        self,
+        fetch,
+        interval: float = 0.1,
+        cap: float = 5.0,
+        polling: BackoffPolling | None = None,
+        max_failures: int = 5,
+    ):
+        """Initialize the OperationWatcher class object."""
+        self._fetch = fetch
+        self.polling = polling or BackoffPolling(interval=interval, cap=cap)
+        self.max_failures = max_failures
+        self._failures = {False: 0, True: 0}
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._watches = []
+        self._thread = None
+
+    def __getstate__(self):
+        """Return state of the object."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        del state["_wakeup"]
+        del state["_thread"]
+        state["_watches"] = []
+        return state
+
+    def __setstate__(self, state):
+        """Restore state from pickled state."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    @property
+    def num_watches(self):
+        """Number of registered waiters."""
+        return len(self._watches)
+
+    def watch(self, ids: list[str], expand: bool = False, handler=None) -> OperationWatch:
+        """Register operation IDs with the watcher.
+
+        Parameters
+        ----------
+        ids: list[str]
+            IDs of the operations to wait for.
+        expand: bool
+            Whether to request expanded operation groups. Default is False.
+        handler: Callable[[list[Operation]], None]
+            Optional callable that is called with the operations of this watch on every poll.
+        """
+        w = OperationWatch(ids, expand, handler, concurrent.futures.Future())
+        with self._lock:
+            self._watches.append(w)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="operation_watcher")
+                self._thread.start()
+        self._wakeup.set()
+        return w
+
+    def unwatch(self, w: OperationWatch):
+        """Remove a waiter from the watcher."""
+        with self._lock:
+            if w in self._watches:
+                self._watches.remove(w)
+        if not w.done():
+            w.future.cancel()
+
+    def stop(self):
+        """Stop the watcher and cancel all pending waiters."""
+        with self._lock:
+            watches, self._watches = self._watches, []
+        for w in watches:
+            w.future.cancel()
+        self._wakeup.set()
+
+    def _run(self):
+        attempt = 0
+        while True:
+            with self._lock:
+                self._watches = [w for w in self._watches if not w.done()]
+                watches = list(self._watches)
+                if not watches:
+                    self._thread = None
+                    break
+            # New waiters want a quick first answer, start over with the shortest interval
+            if self._wakeup.is_set():
+                self._wakeup.clear()
+                attempt = 0
+
+            attempt += 1
+            ops = []
+            for expand in (False, True):
+                ops += self._poll([w for w in watches if w.expand == expand], expand)
+
+            duration = self.polling.next_interval(attempt, ops)
+            self._wakeup.wait(duration)
+        log.debug("Operation watcher stopped")
+
+    def _poll(self, watches: list[OperationWatch], expand: bool):
+        if not watches:
+            return []
+        try:
+            ops = self._fetch(_merge_ids(watches), expand=expand)
+        except (TimeoutException, TimeoutError):
+            log.debug("Operations status call timed out, retrying...")
+            return []
+        except Exception as e:
+            _on_error(self, watches, expand, e)
+            return []
+
+        self._failures[expand] = 0
+        by_id = {op.id: op for op in ops}
+        for w in watches:
+            fetched = w._collect(by_id)
+            if w.handler is not None:
+                try:
+                    w.handler(fetched)
+                except Exception as e:
+                    log.warning(f"Handler error: {e}")
+                    log.debug(traceback.format_exc())
+            w._resolve()
+        return ops
+
+
+class AsyncOperationWatcher:
+    """Provides an asyncio-based watcher that polls operations on behalf of all waiters.
+
+    The polling task is started on the first registration and exits once no waiter is left.
+
+    Parameters
+    ----------
+    fetch: Callable[[list[str], bool], Awaitable[list[Operation]]]
+        Coroutine function fetching the operations for a list of IDs,
+        for example ``AsyncDataTransferApi._fetch_operations``.
+    interval: float
+        Interval in seconds. Default is 0.1.
+    cap: float
+        The maximum backoff value used to calculate the next wait time. Default is 5.0.
+    polling: BackoffPolling | None
+        Strategy deciding how long to wait between polls. Default is None, which uses
+        exponential backoff based on ``interval`` and ``cap``.
+    max_failures: int
+        Number of consecutive failed status requests, like connection errors or 5xx responses,
+        after which the waiters are failed. Default is 5.
+    """
+
+    def __init__(
+        self,
+        fetch,
+        interval: float = 0.1,
+        cap: float = 5.0,
+        polling: BackoffPolling | None = None,
+        max_failures: int = 5,
+    ):
+        """Initialize the AsyncOperationWatcher class object."""
+        self._fetch = fetch
+        self.polling = polling or BackoffPolling(interval=interval, cap=cap)
+        self.max_failures = max_failures
+        self._failures = {False: 0, True: 0}
+
+        self._wakeup = asyncio.Event()
+        self._watches = []
+        self._task = None
+
+    def __getstate__(self):
+        """Return state of the object."""
+        state = self.__dict__.copy()
+        del state["_wakeup"]
+        del state["_task"]
+        state["_watches"] = []
+        return state
+
+    def __setstate__(self, state):
+        """Restore state from pickled state."""
+        self.__dict__.update(state)
+        self._wakeup = asyncio.Event()
+        self._task = None
+
+    @property
+    def num_watches(self):
+        """Number of registered waiters."""
+        return len(self._watches)
+
+    def watch(self, ids: list[str], expand: bool = False, handler=None) -> OperationWatch:
+        """Register operation IDs with the watcher.
+
+        Parameters
+        ----------
+        ids: list[str]
+            IDs of the operations to wait for.
+        expand: bool
+            Whether to request expanded operation groups. Default is False.
+        handler: Callable[[list[Operation]], Awaitable[None]]
+            Optional coroutine function that is awaited with the operations of this watch on every poll.
+        """
+        loop = asyncio.get_running_loop()
+        w = OperationWatch(ids, expand, handler, loop.create_future())
+        self._watches.append(w)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+        return w
+
+    def unwatch(self, w: OperationWatch):
+        """Remove a waiter from the watcher."""
+        if w in self._watches:
+            self._watches.remove(w)
+        if not w.done():
+            w.future.cancel()
+
+    def stop(self):
+        """Stop the watcher and cancel all pending waiters."""
+        watches, self._watches = self._watches, []
+        for w in watches:
+            w.future.cancel()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        attempt = 0
+        try:
+            while True:
+                self._watches = [w for w in self._watches if not w.done()]
+                watches = list(self._watches)
+                if not watches:
+                    break
+                if self._wakeup.is_set():
+                    self._wakeup.clear()
+                    attempt = 0
+
+                attempt += 1
+                ops = []
+                for expand in (False, True):
+                    ops += await self._poll([w for w in watches if w.expand == expand], expand)
+
+                duration = self.polling.next_interval(attempt, ops)
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=duration)
+                except asyncio.TimeoutError:
+                    pass
+        except asyncio.CancelledError:
+            log.debug("Operation watcher cancelled")
+            return
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
+        log.debug("Operation watcher stopped")
+
+    async def _poll(self, watches: list[OperationWatch], expand: bool):
+        if not watches:
+            return []
+        try:
+            ops = await self._fetch(_merge_ids(watches), expand=expand)
+        except (TimeoutException, TimeoutError):
+            log.debug("Operations status call timed out, retrying...")
+            return []
+        except Exception as e:
+            _on_error(self, watches, expand, e)
+            return []
+
+        self._failures[expand] = 0
+        by_id = {op.id: op for op in ops}
+        for w in watches:
+            fetched = w._collect(by_id)
+            if w.handler is not None:
+                try:
+                    await w.handler(fetched)
+                except Exception as e:
+                    log.warning(f"Handler error: {e}")
+                    log.debug(traceback.format_exc())
+            w._resolve()
+        return ops
@@ -25,15 +25,27 @@
 This module interacts with the HPS authentication service.
 """
 
+import hashlib
+import json
 import logging
+import os
+import threading
+import time
 import urllib.parse
 
+import filelock
 import requests
 
-from .exceptions import raise_for_status
+from .exceptions import ClientError, raise_for_status
 
 log = logging.getLogger(__name__)
 
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".ansys", "hps", "token_cache.json")
+
+# Sessions shared by all calls in the process, by TLS verification setting
+_sessions = {}
+_sessions_lock = threading.Lock()
+
 
 def authenticate(
     url: str = "https://localhost:8443/hps",
@@ -47,6 +59,7 @@ def authenticate(
     refresh_token: str = None,
     timeout: float = 10.0,
     verify: bool | str = True,
+    cache: bool | str = False,
     **kwargs,
 ):
     """Authenticate the user with a password or refresh token against the HPS authentication service.
@@ -80,6 +93,13 @@ def authenticate(
         If a Boolean, whether to verify the server's TLS certificate. If a string, the
         path to the CA bundle to use. For more information, see the :class:`requests.Session`
         documentation.
+    cache: Union[bool, str], default: False
+        Whether to cache the tokens in a file readable only by the user, shared by all processes.
+        If a string, the path to the cache file. Cached access tokens are returned while more
+        than half of their lifetime is left, then renewed with the cached refresh token if it
+        is still valid, before falling back to ``grant_type``. Tokens are cached by URL, realm
+        and all request parameters, including the grant type and a hash of the credentials, so
+        that only callers with the same identity share tokens.
     """
     auth_postfix = f"auth/realms/{realm}"
     if url.endswith(f"/{auth_postfix}") or url.endswith(f"/{auth_postfix}/"):
@@ -88,12 +108,6 @@ def authenticate(
         auth_url = urllib.parse.urljoin(url + "/", auth_postfix)
     log.debug(f"Authenticating using {auth_url}")
 
-    session = requests.Session()
-    session.verify = verify
-    session.headers = ({"content-type": "application/x-www-form-urlencoded"},)
-
-    token_url = f"{auth_url}/protocol/openid-connect/token"
-
     data = {
         "client_id": client_id,
         "grant_type": grant_type,
@@ -110,8 +124,96 @@ def authenticate(
 
     data.update(**kwargs)
 
-    log.debug(f"Retrieving access token for client {client_id} from {auth_url} using {grant_type} grant.")
-    r = session.post(token_url, data=data, timeout=timeout)
+    if not cache:
+        return _request_token(auth_url, data, timeout, verify)
+
+    path = DEFAULT_CACHE_PATH if cache is True else cache
+    key = _cache_key(auth_url, data)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), mode=0o700, exist_ok=True)
+    # Concurrent processes wait for the first one to fetch the token, then read it from the cache
+    with filelock.FileLock(f"{path}.lock", timeout=max(timeout, 1.0) * 3):
+        entries = _load_cache(path)
+        entry = entries.get(key)
+        now = time.time()
+        if entry is not None and entry["renew_at"] > now:
+            log.debug(f"Using cached access token for client {client_id}")
+            return {**entry["token"], "expires_in": int(entry["expires_at"] - now)}
+
+        token = None
+        if entry is not None and entry["token"].get("refresh_token") and entry["refresh_expires_at"] > now:
+            refresh_data = {k: v for k, v in data.items() if k not in ["username", "password", "refresh_token"]}
+            refresh_data.update(grant_type="refresh_token", refresh_token=entry["token"]["refresh_token"])
+            try:
+                token = _request_token(auth_url, refresh_data, timeout, verify)
+            except ClientError as ex:
+                log.debug(f"Failed to refresh cached token, falling back to {grant_type} grant: {ex}")
+        if token is None:
+            token = _request_token(auth_url, data, timeout, verify)
+
+        entries[key] = _cache_entry(token, now)
+        _save_cache(path, entries)
+    return token
+
+
+def _cache_key(auth_url: str, data: dict) -> str:
+    """Get the cache key of a token request.
+
+    All request parameters are part of the key, including the grant type and the credentials, so
+    that callers only share tokens requested with the same identity. The key is hashed, so that no
+    credential is stored in the cache file.
+    """
+    return hashlib.sha256(json.dumps([auth_url, data], sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _session(verify: bool | str) -> requests.Session:
+    with _sessions_lock:
+        session = _sessions.get(verify)
+        if session is None:
+            session = requests.Session()
+            session.verify = verify
+            session.headers.update({"content-type": "application/x-www-form-urlencoded"})
+            _sessions[verify] = session
+    return session
+
+
+def _request_token(auth_url: str, data: dict, timeout: float, verify: bool | str) -> dict:
+    token_url = f"{auth_url}/protocol/openid-connect/token"
+    log.debug(
+        f"Retrieving access token for client {data['client_id']} from {auth_url} using {data['grant_type']} grant."
+    )
+    r = _session(verify).post(token_url, data=data, timeout=timeout)
 
     raise_for_status(r)
     return r.json()
+
+
+def _cache_entry(token: dict, now: float) -> dict:
+    expires_in = token.get("expires_in") or 0
+    # Keycloak reports 0 for refresh tokens that do not expire, such as offline tokens
+    refresh_expires_in = token.get("refresh_expires_in")
+    return {
+        "token": token,
+        "expires_at": now + expires_in,
+        "renew_at": now + expires_in / 2,
+        "refresh_expires_at": now + refresh_expires_in if refresh_expires_in else float("inf"),
+    }
+
+
+def _load_cache(path: str) -> dict:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as ex:
+        log.debug(f"Ignoring unreadable token cache {path}: {ex}")
+        return {}
+
+
+def _save_cache(path: str, entries: dict):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    # Create the file readable by the user only, before any token is written to it
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(entries, f)
+    os.replace(tmp, path)
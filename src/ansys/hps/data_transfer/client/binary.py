@@ -25,6 +25,7 @@
 This module also handles processes related to the Ansys HPS data transfer client.
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -41,6 +42,9 @@ from .token import prepare_token
 
 log = logging.getLogger(__name__)
 
+# Longest line of worker output read at once by AsyncBinary, longer lines are skipped
+_OUTPUT_LIMIT = 1024 * 1024
+
 level_map = {
     "trace": logging.DEBUG,
     "debug": logging.DEBUG,
@@ -299,6 +303,9 @@ class Binary:
         Binary configuration.
     """
 
+    # Whether the command line is run by a shell, which needs the token quoted
+    _shell = True
+
     def __init__(
         self,
         config: BinaryConfig | None = None,
@@ -349,16 +356,7 @@ class Binary:
         self._stop = threading.Event()
         self._prepared = threading.Event()
 
-        bin_path = self._config.path
-        if not bin_path or not os.path.exists(bin_path):
-            raise BinaryError(f"Binary not found: {bin_path}")
-
-        # Mark binary as executable
-        if not os.access(bin_path, os.X_OK):
-            # log.debug(f"Marking binary as executable: {bin_path}")
-            st = os.stat(bin_path)
-            os.chmod(bin_path, st.st_mode | stat.S_IEXEC)
-
+        self._check_path()
         self._process = None
 
         # if False:
@@ -369,6 +367,17 @@ class Binary:
         if not self._prepared.wait(timeout=5.0):
             log.warning("Worker preparation is taking longer than expected ...")
 
+    def _check_path(self):
+        bin_path = self._config.path
+        if not bin_path or not os.path.exists(bin_path):
+            raise BinaryError(f"Binary not found: {bin_path}")
+
+        # Mark binary as executable
+        if not os.access(bin_path, os.X_OK):
+            # log.debug(f"Marking binary as executable: {bin_path}")
+            st = os.stat(bin_path)
+            os.chmod(bin_path, st.st_mode | stat.S_IEXEC)
+
     def stop(self, wait=5.0):
         """Stop the worker binary."""
         if self._process is None:
@@ -406,47 +415,55 @@ class Binary:
                 if not line:
                     log.debug("Log thread stdout ended normally, reading stopped.")
                     break
-                # If we dont need to log it, it still needs to be read to prevent hangs from full buffers
-                if not self.config.log:
-                    continue
-                line = line.decode(errors="strip").strip()
-                if log_message is not None:
-                    d = json.loads(line)
-                    log_message(self._config.debug, d)
-            except json.decoder.JSONDecodeError:
-                pass
+                self._handle_output(line, log_message)
             except Exception as e:
                 if self._config.debug:
                     log.debug(f"Error reading worker output: {e}")
                 time.sleep(1)
         # log.debug("Worker log output stopped")
 
+    def _handle_output(self, line: bytes, log_message):
+        # If we dont need to log it, it still needs to be read to prevent hangs from full buffers
+        if not self.config.log or log_message is None:
+            return
+        line = line.decode(errors="strip").strip()
+        try:
+            d = json.loads(line)
+        except json.decoder.JSONDecodeError:
+            return
+        log_message(self._config.debug, d)
+
+    def _process_env(self) -> dict:
+        """Get the environment of the worker process, logging the redacted command line."""
+        args = " ".join(self._args)
+
+        redacted = f"{args}"
+        if self._config.token is not None:
+            redacted = args.replace(self._config.token, "***")
+
+        env = os.environ.copy()
+        env_str = ""
+        if self._config.env:
+            env.update(self._config.env)
+            env_str = ",".join([k for k in self._config.env.keys() if k != "PATH"])
+
+        log.debug(f"Command: {redacted}")
+        if self._config.debug:
+            log.debug(f"Environment: {env_str}")
+        return env
+
     def _monitor(self):
         restart_count = 0  # Initialize a counter for restarts
         while not self._stop.is_set():
             if self._process is None:
                 log.info(f"Data Transfer is starting on restart counter {restart_count}")
                 self._prepare()
-                args = " ".join(self._args)
-
-                redacted = f"{args}"
-                if self._config.token is not None:
-                    redacted = args.replace(self._config.token, "***")
-
-                env = os.environ.copy()
-                env_str = ""
-                if self._config.env:
-                    env.update(self._config.env)
-                    env_str = ",".join([k for k in self._config.env.keys() if k != "PATH"])
-
-                log.debug(f"Command: {redacted}")
-                if self._config.debug:
-                    log.debug(f"Environment: {env_str}")
+                env = self._process_env()
 
                 with PrepareSubprocess():
                     log.info("Launching data transfer worker")
                     self._process = subprocess.Popen(
-                        args, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env
+                        " ".join(self._args), shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env
                     )
                     log.info(f"Data transfer worker is running with PID: {self._process.pid}")
 
@@ -480,6 +497,10 @@ class Binary:
         log.debug("Worker monitor stopped")
 
     def _prepare(self):
+        self._prepare_args()
+        self._prepared.set()
+
+    def _prepare_args(self):
         if self._config._selected_port is None:
             self._config._detected_port = self._get_open_port()
             if self._config._on_port_changed is not None:
@@ -488,7 +509,6 @@ class Binary:
         self._build_base_args()
 
         self._build_args()
-        self._prepared.set()
 
     def _get_open_port(self):
         port = portend.find_available_local_port()
@@ -540,9 +560,145 @@ class Binary:
             )
 
         if self._config.token is not None:
+            token = prepare_token(self._config.token)
             self._args.extend(
                 [
                     "-t",
-                    f'"{prepare_token(self._config.token)}"',
+                    f'"{token}"' if self._shell else token,
                 ]
             )
+
+
+class AsyncBinary(Binary):
+    """Provides for starting, stopping, and supervising the worker binary from an asyncio event loop.
+
+    The worker output is read from a ``StreamReader`` and its exit is awaited, so a crash is
+    detected as soon as it happens without threads or periodic polling. The worker is restarted
+    by the supervising task, up to ``max_restarts`` times in a row.
+
+    Parameters
+    ----------
+    config: BinaryConfig
+        Binary configuration.
+    """
+
+    _shell = False
+
+    def __init__(self, config: BinaryConfig | None = None):
+        """Initialize the AsyncBinary class object."""
+        super().__init__(config)
+        self._supervisor = None
+
+    def __getstate__(self):
+        """Return state of the object."""
+        state = super().__getstate__()
+        del state["_supervisor"]
+        return state
+
+    async def start(self):
+        """Start the worker binary and a task supervising it."""
+        if self._process is not None and self._process.returncode is None:
+            raise BinaryError("Worker already started.")
+
+        log.debug("Starting worker ...")
+
+        self._stop = asyncio.Event()
+        self._prepared = asyncio.Event()
+
+        self._check_path()
+        self._process = None
+        self._supervisor = asyncio.create_task(self._supervise(), name="worker_supervisor")
+
+        try:
+            await asyncio.wait_for(self._prepared.wait(), timeout=5.0)
+        except asyncio.TimeoutError:
+            log.warning("Worker preparation is taking longer than expected ...")
+
+    async def stop(self, wait=5.0):
+        """Stop the worker binary."""
+        if self._process is None:
+            return
+
+        self._stop.set()
+        self._prepared.clear()
+
+        try:
+            await asyncio.wait_for(self._process.wait(), timeout=wait)
+            log.debug("Worker stopped.")
+        except asyncio.TimeoutError:
+            log.warning("Worker did not stop in time, killing ...")
+            self._process.kill()
+            await self._process.wait()
+
+        if self._supervisor is not None:
+            await self._supervisor
+            self._supervisor = None
+
+    async def _spawn(self):
+        self._prepare_args()
+        env = self._process_env()
+
+        with PrepareSubprocess():
+            log.info("Launching data transfer worker")
+            self._process = await asyncio.create_subprocess_exec(
+                *self._args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                env=env,
+                limit=_OUTPUT_LIMIT,
+            )
+        log.info(f"Data transfer worker is running with PID: {self._process.pid}")
+        self._prepared.set()
+
+    async def _supervise(self):
+        restart_count = 0
+        while not self._stop.is_set():
+            log.info(f"Data Transfer is starting on restart counter {restart_count}")
+            try:
+                await self._spawn()
+            except Exception as ex:
+                log.error(f"Failed to launch worker: {ex}")
+                break
+
+            started = time.monotonic()
+            await self._log_output()
+            ret_code = await self._process.wait()
+            if self._stop.is_set() or ret_code == 0:
+                break
+
+            # A worker that was up for a while starts over with a fresh restart budget
+            if time.monotonic() - started > self._config.monitor_interval:
+                restart_count = 0
+            restart_count += 1
+            if restart_count > self.config.max_restarts:
+                log.error(f"Worker exceeded maximum restart attempts ({self.config.max_restarts}). Stopping...")
+                break
+
+            log.warning(f"Worker exited with code {ret_code}, restarting ...")
+            self._prepared.clear()
+            if self.config._on_process_died is not None:
+                self.config._on_process_died(ret_code)
+
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=1.0)
+            except asyncio.TimeoutError:
+                pass
+        log.debug("Worker supervisor stopped")
+
+    async def _log_output(self):
+        """Read the worker output until the process closes it."""
+        log_message = self._config._log_message
+        while True:
+            try:
+                line = await self._process.stdout.readline()
+            except ValueError:
+                # Line longer than the stream limit, skip it
+                continue
+            if not line:
+                log.debug("Worker output ended, reading stopped.")
+                return
+            try:
+                self._handle_output(line, log_message)
+            except Exception as e:
+                if self._config.debug:
+                    log.debug(f"Error reading worker output: {e}")
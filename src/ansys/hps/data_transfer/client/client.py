@@ -43,9 +43,9 @@ import humanize as hz
 import psutil
 import urllib3
 
-from ansys.hps.data_transfer.client.binary import Binary, BinaryConfig
+from ansys.hps.data_transfer.client.binary import AsyncBinary, Binary, BinaryConfig
 from ansys.hps.data_transfer.client.exceptions import BinaryError, async_raise_for_status, raise_for_status
-from ansys.hps.data_transfer.client.token import prepare_token, token_is_api_key
+from ansys.hps.data_transfer.client.token import prepare_token, token_expiry, token_is_api_key, token_issued_at
 
 urllib3.disable_warnings()
 
@@ -58,6 +58,22 @@ api_key_value_env = "ANSYS_DT_AUTH__API_KEY__VALUE"
 
 log = logging.getLogger(__name__)
 
+# Longest wait between checks of the token expiry, so that tokens set from outside are picked up
+_RENEWAL_POLL = 30.0
+# Wait before retrying a renewal that did not produce a token expiring later
+_RENEWAL_RETRY = 5.0
+# Largest part of the lifetime of a token used as renewal margin, so that short-lived tokens are not renewed constantly
+_RENEWAL_MAX_FRACTION = 0.5
+
+
+def _require_h2():
+    try:
+        import h2  # noqa: F401
+    except ImportError as ex:
+        raise ImportError(
+            "HTTP/2 requires the 'h2' package, install it with 'pip install ansys-hps-data-transfer-client[http2]'"
+        ) from ex
+
 
 def bin_in_use(bin_path):
     """Check if a binary is in use."""
@@ -153,6 +169,32 @@ class MonitorState:
             log.warning(f"Worker failure detected, binary is {descr}")
 
 
+class _DownloadProgress:
+    """Provides periodic logging of the progress of the binary download."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.start = time.time()
+        self.last = self.start
+        self.written = 0
+
+    def update(self, n: int, headers):
+        now = time.time()
+        self.written += n
+        if now - self.last <= self.interval:
+            return
+        msg = f"Downloading binary, {hz.precisedelta(now - self.start)} so far ..."
+        content_length = headers.get("Content-Length", None)
+        if content_length is not None:
+            content_length = int(content_length)
+            prog = float(self.written) / float(content_length) * 100.0
+            msg += f" {prog:.1f}%, {hz.naturalsize(self.written)}/{hz.naturalsize(content_length)}"
+        else:
+            msg += f" {hz.naturalsize(self.written)} downloaded"
+        log.info(msg)
+        self.last = now
+
+
 class ClientBase:
     """Provides the Python client to the HPS data transfer APIs.
 
@@ -177,6 +219,34 @@ class ClientBase:
         Timeout for the session. This is the maximum time to wait for a response from the server.
     retries: int, default: 1
         Number of times to retry the operation.
+    shared_wait: bool, default: False
+        Whether ``wait_for`` calls of all APIs using this client share a single operation watcher,
+        which polls the worker once per tick for all concurrent waiters.
+    max_active_submissions: int, default: None
+        Maximum number of submitted batches of all APIs using this client that are unfinished on the
+        worker at once. Further submissions wait and are admitted by their ``priority``.
+        If no value is provided, submissions are sent right away.
+    limits: Limits, default: None
+        Bounds on the operations, bytes of uploaded files and operations queued at the worker of
+        all unfinished submissions of APIs using this client, as an ``api.Limits`` object.
+    remote_limits: dict[str, Limits], default: None
+        Bounds on the unfinished submissions by remote name, as ``api.Limits`` objects.
+    block_on_limits: bool, default: True
+        Whether submissions exceeding the limits wait for earlier submissions to finish.
+        Otherwise, ``AdmissionError`` is raised.
+    token_renewal_margin: float, default: 60.0
+        Time in seconds before the expiry of the access token, read from its ``exp`` claim, at which
+        a new token is requested from ``refresh_token_callback`` in the background and passed to
+        the worker. The margin is at most half the lifetime of the token, known from its ``iat`` claim
+        or from when it was renewed. If None, tokens are only refreshed after a request is rejected
+        as unauthorized.
+    pool_limits: httpx.Limits, default: None
+        Limits of the connection pools of the sessions to the worker and to the data transfer
+        service, such as ``httpx.Limits(max_connections=200, max_keepalive_connections=50,
+        keepalive_expiry=30.0)``. If no value is provided, the ``httpx`` defaults are used.
+    http2: bool, default: False
+        Whether to use HTTP/2 for requests to the data transfer service. This requires the
+        ``h2`` package. The local worker is always reached over HTTP/1.1.
 
     Examples:
     --------
@@ -216,6 +286,14 @@ class ClientBase:
         refresh_token_callback: Callable[[], str | Awaitable[str]] = None,
         timeout=5.0,
         retries=4,
+        shared_wait=False,
+        max_active_submissions: int | None = None,
+        limits=None,
+        remote_limits: dict | None = None,
+        block_on_limits=True,
+        token_renewal_margin: float | None = 60.0,
+        pool_limits: httpx.Limits | None = None,
+        http2: bool = False,
     ):
         """Initializes the Client class object."""
         self._bin_config = bin_config or BinaryConfig()
@@ -226,8 +304,22 @@ class ClientBase:
         self._timeout = timeout
         self.retries = retries
         self.refresh_token_callback = refresh_token_callback
+        self.shared_wait = shared_wait
+        self.operation_watcher = None
+        self.max_active_submissions = max_active_submissions
+        self.limits = limits
+        self.remote_limits = remote_limits
+        self.block_on_limits = block_on_limits
+        self.token_renewal_margin = token_renewal_margin
+        self._renewed_token = (None, 0.0)
+        self.pool_limits = pool_limits
+        self.http2 = http2
+        self.scheduler = None
 
         self._session = None
+        # Session to the data transfer service, reused by every binary download
+        self._dt_session = None
+        self._dt_session_url = None
         self.binary = None
         self.panic_file = None
 
@@ -241,19 +333,32 @@ class ClientBase:
         self.progress_interval = 5.0  # seconds
         self._unauthorized_max_retry = 1
         self._unauthorized_num_retry = 0
+        # Serializes token refreshes, so that concurrent unauthorized requests share one refresh
+        self._refresh_lock = threading.RLock()
+        self._retry_lock = threading.Lock()
 
     def __getstate__(self):
         """Return pickled state of the object."""
         state = self.__dict__.copy()
         del state["_session"]
+        del state["_dt_session"]
         del state["_monitor_stop"]
+        del state["operation_watcher"]
+        del state["scheduler"]
+        del state["_refresh_lock"]
+        del state["_retry_lock"]
         return state
 
     def __setstate__(self, state):
         """Restore state from pickled state."""
         self.__dict__.update(state)
         self._session = None
+        self._dt_session = None
         self._monitor_stop = None
+        self.operation_watcher = None
+        self.scheduler = None
+        self._refresh_lock = threading.RLock()
+        self._retry_lock = threading.Lock()
 
     @property
     def unauthorized_max_retry(self):
@@ -319,31 +424,49 @@ class ClientBase:
         if self.binary is not None:
             return
 
+        self._clean_download_dir()
+        self._prepare_platform_binary()
+        self._launch_binary()
+
+        # self._session = self._create_session(self.base_api_url)
+
+    def _clean_download_dir(self):
         if self._clean and os.path.exists(self._download_dir):
             try:
                 shutil.rmtree(self._download_dir)
             except Exception as ex:
                 log.debug(f"Failed to remove directory {self._download_dir}: {ex}")
 
+    def _launch_binary(self):
+        self._configure_binary()
+        self.binary = Binary(config=self._bin_config)
+        self.binary.start()
+
+    def _configure_binary(self):
         self._monitor_stop = threading.Event()
         self._monitor_state.reset()
-        self._prepare_platform_binary()
 
         self._bin_config._on_port_changed = self._on_port_changed
         self._bin_config._on_process_died = self._on_process_died
 
         self._adjust_config()
-        self.binary = Binary(config=self._bin_config)
-        self.binary.start()
-
-        # self._session = self._create_session(self.base_api_url)
 
     def stop(self, wait=5.0):
         """Stop the client session."""
         if self.binary is None:
             return
-        self._monitor_stop.set()
+        self._stop_monitoring()
         self.binary.stop(wait=wait)
+        self._release_binary()
+
+    def _stop_monitoring(self):
+        if self.operation_watcher is not None:
+            self.operation_watcher.stop()
+            self.operation_watcher = None
+        self.scheduler = None
+        self._monitor_stop.set()
+
+    def _release_binary(self):
         self.binary = None
         self._session = None
         self._bin_config._on_port_changed = None
@@ -426,8 +549,7 @@ class ClientBase:
 
     def _prepare_platform_binary(self):
         # Get service build info
-        dt_url = self._bin_config.data_transfer_url
-        session = self._create_session(dt_url, sync=True)
+        session = self._data_transfer_session()
         resp = session.get("/")
         if resp.status_code != 200:
             raise BinaryError(f"Failed to download binary: {resp.text}")
@@ -436,68 +558,24 @@ class ClientBase:
 
         self._get_features(d)
         bin_path = self._prepare_bin_path(d["build_info"])
-        lock_name = f"{os.path.splitext(os.path.basename(bin_path))[0]}.lock"
-        lock_dir = os.path.dirname(bin_path)
-        if not os.path.exists(lock_dir):
-            try:
-                os.makedirs(lock_dir)
-            except Exception as ex:
-                log.debug(f"Failed to create lock dir: {ex}")
-        lock_path = os.path.join(lock_dir, lock_name)
-        lock = filelock.SoftFileLock(lock_path, timeout=60)
+        lock, lock_path = self._binary_lock(bin_path)
 
         try:
             with lock:
-                reason, bin_path = self._check_binary(d["build_info"], bin_path)
-                bin_path = os.path.abspath(bin_path)
-
-                if self._check_in_use and bin_in_use(bin_path):
-                    log.info(f"Skipping download, binary in use: {bin_path}")
-                    return
-
+                reason, bin_path = self._binary_download_reason(d["build_info"], bin_path)
                 if reason is None:
-                    log.debug(f"Using existing binary: {self._bin_config.path}")
                     return
 
-                bin_dir = os.path.dirname(bin_path)
-                bin_ext = os.path.splitext(bin_path)[1]
-                if not os.path.exists(bin_dir):
-                    try:
-                        os.makedirs(bin_dir)
-                    except Exception as ex:
-                        log.warning(f"Failed to create directory {bin_dir}: {ex}")
-
-                platform_str = self._platform()
-                log.info(
-                    f"Downloading data transfer worker for platform '{platform_str}' from {dt_url}, reason: {reason}"
-                )
-                log.debug(f"Binary download path: {bin_path}")
-                url = f"/binaries/worker/{platform_str}/hpsdata{bin_ext}"
+                url = self._binary_url(bin_path, reason)
                 try:
-                    start = time.time()
-                    last_progress = start
-                    written = 0
+                    progress = _DownloadProgress(self.progress_interval)
                     with open(bin_path, "wb") as f, session.stream("GET", url) as resp:
                         resp.read()
                         if resp.status_code != 200:
                             raise BinaryError(f"Failed to download binary: {resp.text}")
 
                         for chunk in resp.iter_bytes():
-                            now = time.time()
-                            written += f.write(chunk)
-
-                            since_last_progress = now - last_progress
-                            if since_last_progress > self.progress_interval:
-                                msg = f"Downloading binary, {hz.precisedelta(now - start)} so far ..."
-                                content_length = resp.headers.get("Content-Length", None)
-                                if content_length is not None:
-                                    content_length = int(content_length)
-                                    prog = float(written) / float(content_length) * 100.0
-                                    msg += f" {prog:.1f}%, {hz.naturalsize(written)}/{hz.naturalsize(content_length)}"
-                                else:
-                                    msg += f" {hz.naturalsize(written)} downloaded"
-                                log.info(msg)
-                                last_progress = now
+                            progress.update(f.write(chunk), resp.headers)
 
                     self._bin_config.path = bin_path
                 except Exception as ex:
@@ -506,32 +584,142 @@ class ClientBase:
                     log.error(f"Failed to download binary: {ex}")
                     os.remove(bin_path)
 
-                st = os.stat(bin_path)
-                # log.debug(f"Marking binary as executable: {bin_path}")
-                os.chmod(bin_path, st.st_mode | stat.S_IEXEC)
-                # if self._bin_config.debug:
-                # log.debug(f"Binary mode: {stat.filemode(os.stat(bin_path).st_mode)}")
+                self._mark_executable(bin_path)
         except filelock.Timeout as ex:
             raise BinaryError(f"Failed to acquire lock for binary download: {lock_path}") from ex
 
-    def _create_session(self, url: str, *, sync: bool = True):
+    async def _async_prepare_platform_binary(self):
+        """Prepare the worker binary without blocking the event loop.
+
+        The lock and the scan of running processes are handled in threads, and the binary is
+        streamed to disk by an async session.
+        """
+        session = self._data_transfer_session()
+        resp = await session.get("/")
+        if resp.status_code != 200:
+            raise BinaryError(f"Failed to download binary: {resp.text}")
+
+        d = resp.json()
+
+        self._get_features(d)
+        bin_path = self._prepare_bin_path(d["build_info"])
+        # The lock is acquired and released in different threads
+        lock, lock_path = await asyncio.to_thread(self._binary_lock, bin_path, thread_local=False)
+
+        try:
+            await asyncio.to_thread(lock.acquire)
+        except filelock.Timeout as ex:
+            raise BinaryError(f"Failed to acquire lock for binary download: {lock_path}") from ex
+
+        try:
+            reason, bin_path = await asyncio.to_thread(self._binary_download_reason, d["build_info"], bin_path)
+            if reason is None:
+                return
+
+            url = await asyncio.to_thread(self._binary_url, bin_path, reason)
+            try:
+                progress = _DownloadProgress(self.progress_interval)
+                async with session.stream("GET", url) as resp:
+                    if resp.status_code != 200:
+                        await resp.aread()
+                        raise BinaryError(f"Failed to download binary: {resp.text}")
+
+                    with open(bin_path, "wb") as f:
+                        async for chunk in resp.aiter_bytes():
+                            progress.update(f.write(chunk), resp.headers)
+
+                self._bin_config.path = bin_path
+            except Exception as ex:
+                if self._bin_config.debug:
+                    log.debug(traceback.format_exc())
+                log.error(f"Failed to download binary: {ex}")
+                os.remove(bin_path)
+
+            self._mark_executable(bin_path)
+        finally:
+            await asyncio.to_thread(lock.release)
+
+    def _binary_lock(self, bin_path: str, thread_local: bool = True) -> tuple[filelock.SoftFileLock, str]:
+        lock_name = f"{os.path.splitext(os.path.basename(bin_path))[0]}.lock"
+        lock_dir = os.path.dirname(bin_path)
+        if not os.path.exists(lock_dir):
+            try:
+                os.makedirs(lock_dir)
+            except Exception as ex:
+                log.debug(f"Failed to create lock dir: {ex}")
+        lock_path = os.path.join(lock_dir, lock_name)
+        return filelock.SoftFileLock(lock_path, timeout=60, thread_local=thread_local), lock_path
+
+    def _binary_download_reason(self, build_info: dict, bin_path: str) -> tuple[str | None, str]:
+        """Get the reason to download the binary, which is None if the existing binary is used."""
+        reason, bin_path = self._check_binary(build_info, bin_path)
+        bin_path = os.path.abspath(bin_path)
+
+        if self._check_in_use and bin_in_use(bin_path):
+            log.info(f"Skipping download, binary in use: {bin_path}")
+            return None, bin_path
+
+        if reason is None:
+            log.debug(f"Using existing binary: {self._bin_config.path}")
+        return reason, bin_path
+
+    def _binary_url(self, bin_path: str, reason: str) -> str:
+        bin_dir = os.path.dirname(bin_path)
+        bin_ext = os.path.splitext(bin_path)[1]
+        if not os.path.exists(bin_dir):
+            try:
+                os.makedirs(bin_dir)
+            except Exception as ex:
+                log.warning(f"Failed to create directory {bin_dir}: {ex}")
+
+        platform_str = self._platform()
+        dt_url = self._bin_config.data_transfer_url
+        log.info(f"Downloading data transfer worker for platform '{platform_str}' from {dt_url}, reason: {reason}")
+        log.debug(f"Binary download path: {bin_path}")
+        return f"/binaries/worker/{platform_str}/hpsdata{bin_ext}"
+
+    def _mark_executable(self, bin_path: str):
+        st = os.stat(bin_path)
+        # log.debug(f"Marking binary as executable: {bin_path}")
+        os.chmod(bin_path, st.st_mode | stat.S_IEXEC)
+        # if self._bin_config.debug:
+        # log.debug(f"Binary mode: {stat.filemode(os.stat(bin_path).st_mode)}")
+
+    def _data_transfer_session(self):
+        """Get the session to the data transfer service, creating it on first use."""
+        url = self._bin_config.data_transfer_url
+        if self._dt_session is not None and self._dt_session_url != url:
+            # The URL was changed since the last start
+            self._discard_session(self._dt_session)
+            self._dt_session = None
+        if self._dt_session is None:
+            self._dt_session = self._create_session(url, sync=not self.Meta.is_async, http2=self.http2)
+            self._dt_session_url = url
+        return self._dt_session
+
+    def _create_session(self, url: str, *, sync: bool = True, http2: bool = False):
         verify = not self._bin_config.insecure
         # log.debug("Creating session for %s with verify=%s", url, verify)
 
         args = {
             "timeout": httpx.Timeout(self._timeout),
         }
+        transport_args = {"retries": self._retries, "verify": verify, "http2": http2}
+        if self.pool_limits is not None:
+            transport_args["limits"] = self.pool_limits
+        if http2:
+            _require_h2()
 
         if sync:
             session = httpx.Client(
-                transport=httpx.HTTPTransport(retries=self._retries, verify=verify),
+                transport=httpx.HTTPTransport(**transport_args),
                 event_hooks={"response": [self._auto_refresh_token, raise_for_status]},
                 **args,
             )
             session._transport.verify = False
         else:
             session = httpx.AsyncClient(
-                transport=httpx.AsyncHTTPTransport(retries=self._retries, verify=verify),
+                transport=httpx.AsyncHTTPTransport(**transport_args),
                 event_hooks={"response": [self._async_auto_refresh_token, async_raise_for_status]},
                 **args,
             )
@@ -546,10 +734,13 @@ class ClientBase:
 
         return session
 
+    def _discard_session(self, session):
+        session.close()
+
     def _on_port_changed(self, port):
         log.debug(f"Port changed to {port}")
         if self._session is not None:
-            self._session.close()
+            self._discard_session(self._session)
         self._session = None
 
     def _on_process_died(self, ret_code):
@@ -560,62 +751,111 @@ class ClientBase:
 
         Automatically refreshes the access token and
         re-sends the request in case of an unauthorized error.
+        Concurrent unauthorized requests share a single refresh.
         """
         if self._bin_config.auth_type in ["api-key"]:
             return
 
         log.debug(f"response status: {response.status_code} for {response.request.method} {response.url}")
-        if response.status_code == 401 and self._unauthorized_num_retry < self._unauthorized_max_retry:
-            log.info("401 authorization error: Trying to get a new access token.")
-            if self.refresh_token_callback is None:
-                log.info("No refresh callback provided, skipping token refresh.")
-                return
-            self._unauthorized_num_retry += 1
-            token = self.refresh_token_callback()
-            self._bin_config.token = token
-            # Update the Authorization header
-            response.request.headers.update({"Authorization": f"Bearer {token}"})
-            log.debug("Retrying request with updated access token.")
-            retried_response = self._session.send(response.request)
-            log.debug(f"Retried response status: {retried_response.status_code}")
-            # Modify the response body
-            response._content = retried_response.content
-            response.status_code = retried_response.status_code
+        if response.status_code != 401:
+            self._reset_unauthorized()
+            return
+        if self.refresh_token_callback is None:
+            log.info("No refresh callback provided, skipping token refresh.")
             return
 
-        self._unauthorized_num_retry = 0
-        return
+        sent = response.request.headers.get("Authorization")
+        with self._refresh_lock:
+            token = self._refreshed_token(sent)
+            if token is None and self._claim_refresh():
+                log.info("401 authorization error: Trying to get a new access token.")
+                token = self.refresh_token_callback()
+                self._bin_config.token = token
+        if token is None:
+            return
+
+        response.request.headers.update({"Authorization": prepare_token(token)})
+        log.debug("Retrying request with updated access token.")
+        self._replace_response(response, self._session.send(response.request))
 
     async def _async_auto_refresh_token(self, response: httpx.Response):
         """Provide a callback for refreshing an expired token.
 
         Automatically refreshes the access token and
         re-sends the request in case of an unauthorized error.
+        Concurrent unauthorized requests share a single refresh.
         """
         if self._bin_config.auth_type in ["api-key"]:
             return
 
         log.debug(f"response status: {response.status_code} for {response.request.method} {response.url}")
-        if response.status_code == 401 and self._unauthorized_num_retry < self._unauthorized_max_retry:
-            log.info("401 authorization error: Trying to get a new access token.")
-            if self.refresh_token_callback is None:
-                log.info("No refresh callback provided, skipping token refresh.")
-                return
-            self._unauthorized_num_retry += 1
-            token = await self.refresh_token_callback()
-            self._bin_config.token = token
-            # Update the Authorization header
-            response.request.headers.update({"Authorization": f"Bearer {token}"})
-            log.debug("Retrying request with updated access token.")
-            retried_response = await self._session.send(response.request)
-            log.debug(f"Retried response status: {retried_response.status_code}")
-            # Modify the response body
-            response._content = retried_response.content
-            response.status_code = retried_response.status_code
+        if response.status_code != 401:
+            self._reset_unauthorized()
+            return
+        if self.refresh_token_callback is None:
+            log.info("No refresh callback provided, skipping token refresh.")
             return
 
-        self._unauthorized_num_retry = 0
-        return
+        sent = response.request.headers.get("Authorization")
+        async with self._async_refresh_lock():
+            token = self._refreshed_token(sent)
+            if token is None and self._claim_refresh():
+                log.info("401 authorization error: Trying to get a new access token.")
+                token = await self.refresh_token_callback()
+                self._bin_config.token = token
+        if token is None:
+            return
+
+        response.request.headers.update({"Authorization": prepare_token(token)})
+        log.debug("Retrying request with updated access token.")
+        self._replace_response(response, await self._session.send(response.request))
+
+    def _refreshed_token(self, sent: str | None) -> str | None:
+        """Get the current token if it was refreshed since a request was sent with ``sent``."""
+        token = self._bin_config.token
+        if sent is None or token is None or prepare_token(token) == sent:
+            return None
+        log.debug("Access token was refreshed by a concurrent request.")
+        return token
+
+    def _claim_refresh(self) -> bool:
+        """Count a refresh attempt, returning False once consecutive attempts reach the limit."""
+        with self._retry_lock:
+            if self._unauthorized_num_retry >= self._unauthorized_max_retry:
+                self._unauthorized_num_retry = 0
+                return False
+            self._unauthorized_num_retry += 1
+            return True
+
+    def _reset_unauthorized(self):
+        if self._unauthorized_num_retry:
+            with self._retry_lock:
+                self._unauthorized_num_retry = 0
+
+    def _replace_response(self, response: httpx.Response, retried: httpx.Response):
+        log.debug(f"Retried response status: {retried.status_code}")
+        # Modify the response body
+        response._content = retried.content
+        response.status_code = retried.status_code
+
+    def _renewal_delay(self) -> float | None:
+        """Get the time in seconds until the access token is due for renewal, or None if it is not renewed."""
+        if self.token_renewal_margin is None or self.refresh_token_callback is None:
+            return None
+        if self._bin_config.auth_type in ["api-key"]:
+            return None
+        token = self._bin_config.token
+        expiry = token_expiry(token)
+        if expiry is None:
+            return None
+        margin = self.token_renewal_margin
+        issued = token_issued_at(token)
+        if issued is None and self._renewed_token[0] == token:
+            # Without an iat claim, a renewed token is known to be issued when it was received
+            issued = self._renewed_token[1]
+        if issued is not None:
+            margin = min(margin, max(expiry - issued, 0.0) * _RENEWAL_MAX_FRACTION)
+        return max(expiry - margin - time.time(), 0.0)
 
     def _adjust_config(self):
         if self._bin_config.auth_type == "none":
@@ -685,42 +925,75 @@ class AsyncClient(ClientBase):
         """Initializes the AsyncClient class object."""
         super().__init__(*args, **kwargs)
         self._bin_config._on_token_update = self._update_token
-        self._monitor_task = None
+        self._renewal_task = None
+        self._token_push = None
+        self._session_close = None
+        # Serializes token refreshes of tasks, created in the event loop using it
+        self._refresh_lock_async = None
+        self._refresh_loop = None
 
     def __getstate__(self):
         """Return pickled state of the object."""
         state = super().__getstate__()
-        del state["_monitor_task"]
+        del state["_renewal_task"]
+        del state["_token_push"]
+        del state["_session_close"]
+        del state["_refresh_lock_async"]
+        del state["_refresh_loop"]
         return state
 
     def __setstate__(self, state):
         """Restore state from pickled state."""
         super().__setstate__(state)
         self.__dict__.update(state)
-        self._monitor_task = None
+        self._renewal_task = None
+        self._token_push = None
+        self._session_close = None
+        self._refresh_lock_async = None
+        self._refresh_loop = None
 
     async def start(self):
-        """Start the async binary worker."""
-        super().start()
+        """Start the async binary worker.
+
+        Blocking work, such as acquiring the binary lock and scanning running processes, is done
+        in threads so that the event loop keeps running. The worker is supervised by a task of the
+        event loop, which restarts it as soon as it exits.
+        """
+        if self.binary is None:
+            await asyncio.to_thread(self._clean_download_dir)
+            await self._async_prepare_platform_binary()
+            self._configure_binary()
+            self.binary = AsyncBinary(config=self._bin_config)
+            await self.binary.start()
         # grab location of panic file
         resp = await self.session.get("/")
         self._fetch_panic_file(resp)
-        self._monitor_task = asyncio.create_task(self._monitor())
+        if self._renewal_task is None or self._renewal_task.done():
+            self._renewal_task = asyncio.create_task(self._token_renewal())
 
     async def stop(self, wait=5.0):
         """Stop the async binary worker."""
+        if self._renewal_task is not None:
+            self._renewal_task.cancel()
+            await asyncio.gather(self._renewal_task, return_exceptions=True)
+            self._renewal_task = None
         if self._session is not None:
             try:
                 await self._session.post(self.base_api_url + "/shutdown")
                 await asyncio.sleep(0.1)
-                if self._monitor_task is not None:
-                    self._monitor_task.cancel()
             except Exception as ex:
                 log.warning(f"Failed to send shutdown request: {ex}")
             finally:
                 await self._session.aclose()  # Ensure the session is closed
                 self._session = None
-        super().stop(wait=wait)
+        if self._dt_session is not None:
+            await self._dt_session.aclose()
+            self._dt_session = None
+        if self.binary is None:
+            return
+        self._stop_monitoring()
+        await self.binary.stop(wait=wait)
+        self._release_binary()
         # asyncio_atexit.register(self.stop)
 
     async def wait(self, timeout: float = 60.0, sleep=0.5):
@@ -741,43 +1014,72 @@ class AsyncClient(ClientBase):
                 await asyncio.sleep(backoff.full_jitter(sleep))
 
     def _update_token(self):
-        loop = asyncio.get_running_loop()
+        if self._dt_session is not None:
+            self._dt_session.headers["Authorization"] = prepare_token(self._bin_config.token)
         if self._session is None:
             return
         log.debug("Updating auth token, ends in %s", self._bin_config.token[-10:])
+        self._session.headers["Authorization"] = prepare_token(self._bin_config.token)
         try:
-            self._session.headers["Authorization"] = prepare_token(self._bin_config.token)
-            # Make sure the token gets intercepted by the worker
-            loop.run_until_complete(self.session.get("/"))
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            log.debug("No running event loop, the token is passed to the worker with the next request")
+            return
+        # Make sure the token gets intercepted by the worker
+        self._token_push = loop.create_task(self._push_token())
+
+    async def _push_token(self):
+        try:
+            resp = await self.session.get("/")
+            if resp.status_code != 200:
+                log.error(f"Failed to update token, server responded with: {resp.status_code}")
         except Exception as e:
             log.debug(f"Error updating token: {e}")
 
-    async def _monitor(self):
+    async def _token_renewal(self):
+        wait = 0.0
         while True:
             try:
-                await asyncio.sleep(self._monitor_state.sleep_for)
-                if self._session is None or self.binary is None:
-                    continue
-
-                resp = await self._session.get(self.base_api_url)
-
-                if resp.status_code == 200:
-                    ready = resp.json().get("ready", False)
-                    self._monitor_state.mark_ready(ready)
+                await asyncio.sleep(wait)
+                delay = self._renewal_delay()
+                if delay is None or delay > 0:
+                    wait = _RENEWAL_POLL if delay is None else min(delay, _RENEWAL_POLL)
                     continue
+                await self._renew_token()
+                wait = _RENEWAL_RETRY if self._renewal_delay() == 0 else 0.0
             except asyncio.CancelledError:
-                log.debug("Monitor task cancelled")
+                log.debug("Token renewal task cancelled")
                 return
+
+    def _async_refresh_lock(self) -> asyncio.Lock:
+        """Get the lock serializing token refreshes, created for the running event loop on first use."""
+        loop = asyncio.get_running_loop()
+        if self._refresh_lock_async is None or self._refresh_loop is not loop:
+            self._refresh_lock_async = asyncio.Lock()
+            self._refresh_loop = loop
+        return self._refresh_lock_async
+
+    async def _renew_token(self):
+        async with self._async_refresh_lock():
+            if self._renewal_delay() != 0:
+                # Refreshed after an unauthorized request in the meantime
+                return
+            log.debug("Renewing access token ahead of its expiry")
+            try:
+                token = await self.refresh_token_callback()
             except Exception as ex:
-                if self.binary_config.debug:
-                    log.debug("URL: %s", self.base_api_url)
-                    log.debug(traceback.format_exc())
-                # Before marking it as failed check if there is a panic file
-                self._panic_file_contents()
-                self._monitor_state.mark_failed(exc=ex, binary=self.binary)
-                continue
+                log.warning(f"Failed to renew access token: {ex}")
+                return
+            self._renewed_token = (token, time.time())
+            self._bin_config.token = token
 
-            self._monitor_state.report(self.binary)
+    def _discard_session(self, session):
+        self._session_close = asyncio.get_running_loop().create_task(session.aclose())
+
+    def _on_process_died(self, ret_code):
+        # Show why the worker died before it is restarted
+        self._panic_file_contents()
+        super()._on_process_died(ret_code)
 
 
 class Client(ClientBase):
@@ -797,11 +1099,13 @@ class Client(ClientBase):
         super().__init__(*args, **kwargs)
         self._bin_config._on_token_update = self._update_token
         self._monitor_thread = None
+        self._renewal_thread = None
 
     def __getstate__(self):
         """Return pickled state of the object."""
         state = super().__getstate__()
         del state["_monitor_thread"]
+        del state["_renewal_thread"]
         return state
 
     def __setstate__(self, state):
@@ -809,6 +1113,7 @@ class Client(ClientBase):
         super().__setstate__(state)
         self.__dict__.update(state)
         self._monitor_thread = None
+        self._renewal_thread = None
 
     def start(self):
         """Start the client session using the binary configuration credentials."""
@@ -817,10 +1122,12 @@ class Client(ClientBase):
         self._monitor_thread = threading.Thread(
             target=self._monitor, args=(), daemon=True, name="worker_status_monitor"
         )
+        self._renewal_thread = threading.Thread(target=self._token_renewal, daemon=True, name="token_renewal")
         # grab location of panic file
         resp = self.session.get("/")
         self._fetch_panic_file(resp)
         self._monitor_thread.start()
+        self._renewal_thread.start()
 
     def stop(self, wait=5.0):
         """Stop the client session."""
@@ -829,6 +1136,9 @@ class Client(ClientBase):
                 self._session.post(self.base_api_url + "/shutdown")
             except Exception as ex:
                 log.warning(f"Failed to send shutdown request: {ex}")
+        if self._dt_session is not None:
+            self._dt_session.close()
+            self._dt_session = None
         super().stop(wait=wait)
 
     def wait(self, timeout: float = 60.0, sleep=0.5):
@@ -849,6 +1159,8 @@ class Client(ClientBase):
                 time.sleep(backoff.full_jitter(sleep))
 
     def _update_token(self):
+        if self._dt_session is not None:
+            self._dt_session.headers["Authorization"] = prepare_token(self._bin_config.token)
         if self._session is None:
             return
         log.debug("Updating auth token, ends in %s", self._bin_config.token[-10:])
@@ -861,6 +1173,30 @@ class Client(ClientBase):
         except Exception as e:
             log.debug(f"Error updating token: {e}")
 
+    def _token_renewal(self):
+        wait = 0.0
+        while not self._monitor_stop.wait(wait):
+            delay = self._renewal_delay()
+            if delay is None or delay > 0:
+                wait = _RENEWAL_POLL if delay is None else min(delay, _RENEWAL_POLL)
+                continue
+            self._renew_token()
+            wait = _RENEWAL_RETRY if self._renewal_delay() == 0 else 0.0
+
+    def _renew_token(self):
+        with self._refresh_lock:
+            if self._renewal_delay() != 0:
+                # Refreshed after an unauthorized request in the meantime
+                return
+            log.debug("Renewing access token ahead of its expiry")
+            try:
+                token = self.refresh_token_callback()
+            except Exception as ex:
+                log.warning(f"Failed to renew access token: {ex}")
+                return
+            self._renewed_token = (token, time.time())
+            self._bin_config.token = token
+
     def _monitor(self):
         while not self._monitor_stop.is_set():
             time.sleep(self._monitor_state.sleep_for)
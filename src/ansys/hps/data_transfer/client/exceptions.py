@@ -92,6 +92,15 @@ class TimeoutError(ClientError):
         super().__init__(*args, **kwargs)
 
 
+class AdmissionError(ClientError):
+    """Provides errors for submissions rejected because the client limits on work in flight are reached."""
+
+    def __init__(self, *args, **kwargs):
+        """Initializes the AdmissionError class object."""
+        kwargs.setdefault("give_up", True)
+        super().__init__(*args, **kwargs)
+
+
 def _raise_for_status(response: httpx.Response):
     r_content = {}
     try:
@@ -24,4 +24,5 @@
 
 import enum
 
+from .batch import CopyBatch, PathBatch  # noqa: F401
 from .models import *  # noqa: F403, F401
@@ -0,0 +1,181 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides columnar batches of storage operations.
+
+Building and dumping one pydantic model per path dominates the submission time of very
+large operation lists. The batches hold paths and remotes as parallel lists of strings,
+validate them in bulk and serialize them straight to the wire format. Items are only turned
+into ``StoragePath`` and ``SrcDst`` models when accessed individually.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from json.encoder import encode_basestring_ascii as _encode
+
+from .models import SrcDst, StoragePath
+
+
+def _column(name: str, values: str | Iterable[str], n: int | None = None) -> str | list[str]:
+    """Validate a column of strings, keeping a single string shared by all items as is."""
+    if isinstance(values, str):
+        return values
+    values = values if isinstance(values, list) else list(values)
+    if n is not None and len(values) != n:
+        raise ValueError(f"Column '{name}' has {len(values)} items, expected {n}")
+    if not all(isinstance(v, str) for v in values):
+        bad = next(v for v in values if not isinstance(v, str))
+        raise TypeError(f"Column '{name}' must only contain strings, got {type(bad).__name__}")
+    return values
+
+
+def _at(column: str | list[str], index: int) -> str:
+    return column if isinstance(column, str) else column[index]
+
+
+def _slice(column: str | list[str], index: slice) -> str | list[str]:
+    return column if isinstance(column, str) else column[index]
+
+
+def _encoded(column: str | list[str], n: int) -> Iterator[str]:
+    if isinstance(column, str):
+        # Encode a shared value only once
+        encoded = _encode(column)
+        return (encoded for _ in range(n))
+    return map(_encode, column)
+
+
+class PathBatch(Sequence):
+    """Provides a columnar list of storage paths, usable wherever a list of ``StoragePath`` is accepted.
+
+    Parameters
+    ----------
+    paths: Iterable[str]
+        Paths.
+    remotes: str | Iterable[str]
+        Remote of each path, or a single remote for all paths. Default is ``any``.
+    """
+
+    def __init__(self, paths: Iterable[str], remotes: str | Iterable[str] = "any"):
+        """Initialize the PathBatch class object."""
+        self.paths = _column("paths", paths)
+        self.remotes = _column("remotes", remotes, len(self.paths))
+
+    @classmethod
+    def from_models(cls, items: Iterable[StoragePath]) -> "PathBatch":
+        """Create a batch from ``StoragePath`` models."""
+        items = list(items)
+        return cls([p.path for p in items], [p.remote for p in items])
+
+    def __len__(self) -> int:
+        """Number of paths."""
+        return len(self.paths)
+
+    def __getitem__(self, index: int | slice) -> "StoragePath | PathBatch":
+        """Get a ``StoragePath`` model, or a batch for a slice."""
+        if isinstance(index, slice):
+            return PathBatch(self.paths[index], _slice(self.remotes, index))
+        return StoragePath(path=self.paths[index], remote=_at(self.remotes, index))
+
+    def iter_json(self) -> Iterator[str]:
+        """Serialize the items to JSON, one string per item."""
+        n = len(self.paths)
+        for path, remote in zip(map(_encode, self.paths), _encoded(self.remotes, n), strict=True):
+            yield f'{{"path":{path},"remote":{remote}}}'
+
+    def __repr__(self) -> str:
+        """Return a string representation of the batch."""
+        return f"PathBatch({len(self)} paths)"
+
+
+class CopyBatch(Sequence):
+    """Provides a columnar list of copy operations, usable wherever a list of ``SrcDst`` is accepted.
+
+    Parameters
+    ----------
+    src_paths: Iterable[str]
+        Source paths.
+    dst_paths: Iterable[str]
+        Destination paths, one per source path.
+    src_remotes: str | Iterable[str]
+        Remote of each source path, or a single remote for all of them. Default is ``any``.
+    dst_remotes: str | Iterable[str]
+        Remote of each destination path, or a single remote for all of them. Default is ``any``.
+    """
+
+    def __init__(
+        self,
+        src_paths: Iterable[str],
+        dst_paths: Iterable[str],
+        src_remotes: str | Iterable[str] = "any",
+        dst_remotes: str | Iterable[str] = "any",
+    ):
+        """Initialize the CopyBatch class object."""
+        self.src_paths = _column("src_paths", src_paths)
+        n = len(self.src_paths)
+        self.dst_paths = _column("dst_paths", dst_paths, n)
+        self.src_remotes = _column("src_remotes", src_remotes, n)
+        self.dst_remotes = _column("dst_remotes", dst_remotes, n)
+
+    @classmethod
+    def from_models(cls, items: Iterable[SrcDst]) -> "CopyBatch":
+        """Create a batch from ``SrcDst`` models."""
+        items = list(items)
+        return cls(
+            [op.src.path for op in items],
+            [op.dst.path for op in items],
+            [op.src.remote for op in items],
+            [op.dst.remote for op in items],
+        )
+
+    def __len__(self) -> int:
+        """Number of copy operations."""
+        return len(self.src_paths)
+
+    def __getitem__(self, index: int | slice) -> "SrcDst | CopyBatch":
+        """Get a ``SrcDst`` model, or a batch for a slice."""
+        if isinstance(index, slice):
+            return CopyBatch(
+                self.src_paths[index],
+                self.dst_paths[index],
+                _slice(self.src_remotes, index),
+                _slice(self.dst_remotes, index),
+            )
+        return SrcDst(
+            src=StoragePath(path=self.src_paths[index], remote=_at(self.src_remotes, index)),
+            dst=StoragePath(path=self.dst_paths[index], remote=_at(self.dst_remotes, index)),
+        )
+
+    def iter_json(self) -> Iterator[str]:
+        """Serialize the items to JSON, one string per item."""
+        n = len(self.src_paths)
+        columns = (
+            map(_encode, self.src_paths),
+            _encoded(self.src_remotes, n),
+            map(_encode, self.dst_paths),
+            _encoded(self.dst_remotes, n),
+        )
+        for src, src_remote, dst, dst_remote in zip(*columns, strict=True):
+            yield f'{{"src":{{"path":{src},"remote":{src_remote}}},"dst":{{"path":{dst},"remote":{dst_remote}}}}}'
+
+    def __repr__(self) -> str:
+        """Return a string representation of the batch."""
+        return f"CopyBatch({len(self)} operations)"
@@ -22,6 +22,10 @@
 
 """Provides a utility function for handling authentication tokens."""
 
+import base64
+import binascii
+import json
+
 API_KEY_PREFIX = "ApiKey "
 BEARER_PREFIX = "Bearer "
 
@@ -43,3 +47,36 @@ def token_is_bearer(token):
 def token_is_api_key(token):
     """Check whether the token is prefixed with ``ApiKey``."""
     return token.lower().startswith(API_KEY_PREFIX.lower())
+
+
+def token_expiry(token):
+    """Get the expiry time of a JWT access token from its ``exp`` claim, as seconds since the epoch.
+
+    The signature is not verified, the claim is only used to schedule renewal. None is returned for
+    API keys and tokens that are not JWTs or carry no ``exp`` claim.
+    """
+    return _time_claim(token, "exp")
+
+
+def token_issued_at(token):
+    """Get the issue time of a JWT access token from its ``iat`` claim, as seconds since the epoch.
+
+    None is returned for API keys and tokens that are not JWTs or carry no ``iat`` claim.
+    """
+    return _time_claim(token, "iat")
+
+
+def _time_claim(token, name):
+    if not token or token_is_api_key(token):
+        return None
+    if token_is_bearer(token):
+        token = token[len(BEARER_PREFIX) :]
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        payload = base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4))
+        value = json.loads(payload).get(name)
+    except (binascii.Error, ValueError, AttributeError):
+        return None
+    return float(value) if isinstance(value, int | float) else None
@@ -0,0 +1,204 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides parallel hashing of local files with the checksum algorithm of the worker.
+
+The worker reports xxHash64 checksums of stored files. Files are memory mapped and hashed in a
+thread pool; the hash function releases the GIL while hashing, so the threads run in parallel.
+Checksums are cached by device, inode, size and modification time, so that unchanged files
+are not read again.
+"""
+
+from collections.abc import Iterable
+import concurrent.futures
+import json
+import logging
+import mmap
+import os
+import threading
+
+from ..models import OperationState
+
+log = logging.getLogger(__name__)
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover
+    xxhash = None
+
+
+def _require_xxhash():
+    if xxhash is None:
+        raise ImportError(
+            "Checksum deduplication requires the 'xxhash' package, "
+            "install it with 'pip install ansys-hps-data-transfer-client[checksum]'"
+        )
+
+
+def file_checksum(path: str) -> str:
+    """Get the xxHash64 checksum of a local file as a hex string, as reported by the worker."""
+    _require_xxhash()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be memory mapped
+            return xxhash.xxh64(b"").hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return xxhash.xxh64(mm).hexdigest()
+
+
+class ChecksumCache:
+    """Provides a thread-safe cache of file checksums keyed by device, inode, size and modification time.
+
+    Parameters
+    ----------
+    path: str | None
+        Optional JSON file the cache is loaded from and saved to. Default is None,
+        which keeps the cache in memory only.
+    """
+
+    def __init__(self, path: str | None = None):
+        """Initialize the ChecksumCache class object."""
+        self.path = path
+        self._checksums = {}
+        self._lock = threading.Lock()
+        if path is not None:
+            self.load()
+
+    def __len__(self):
+        """Get the number of cached checksums."""
+        return len(self._checksums)
+
+    @staticmethod
+    def key(st: os.stat_result) -> str:
+        """Get the cache key of a file from its ``os.stat`` result."""
+        return f"{st.st_dev}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+
+    def get(self, st: os.stat_result) -> str | None:
+        """Get the cached checksum of a file, or None if it is unknown or the file changed."""
+        with self._lock:
+            return self._checksums.get(self.key(st))
+
+    def put(self, st: os.stat_result, checksum: str):
+        """Cache the checksum of a file."""
+        with self._lock:
+            self._checksums[self.key(st)] = checksum
+
+    def load(self):
+        """Load the cache from disk, starting over if it is missing or unreadable."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                checksums = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            log.warning(f"Ignoring unreadable checksum cache {self.path}: {e}")
+            return
+        with self._lock:
+            self._checksums.update(checksums)
+
+    def save(self):
+        """Write the cache atomically, if it has a path."""
+        if self.path is None:
+            return
+        with self._lock:
+            data = json.dumps(self._checksums, separators=(",", ":"))
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp, self.path)
+
+
+def hash_files(paths: Iterable[str], cache: ChecksumCache | None = None, workers: int = 8) -> dict[str, str | None]:
+    """Get the checksums of local files by path, hashing files not in the cache in parallel.
+
+    The checksum of files that cannot be read is None.
+
+    Parameters
+    ----------
+    paths: Iterable[str]
+        Paths of the local files.
+    cache: ChecksumCache | None
+        Cache of previously computed checksums, updated with the new ones. Default is None.
+    workers: int
+        Number of files hashed in parallel. Default is 8.
+    """
+    _require_xxhash()
+    checksums = {}
+    pending = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError as e:
+            log.debug(f"Cannot hash {path}: {e}")
+            checksums[path] = None
+            continue
+        checksum = cache.get(st) if cache is not None else None
+        if checksum is None:
+            pending[path] = st
+        else:
+            checksums[path] = checksum
+
+    if not pending:
+        return checksums
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hash") as pool:
+        futures = {pool.submit(file_checksum, path): path for path in pending}
+        for f in concurrent.futures.as_completed(futures):
+            path = futures[f]
+            try:
+                checksums[path] = f.result()
+            except OSError as e:
+                log.debug(f"Cannot hash {path}: {e}")
+                checksums[path] = None
+                continue
+            if cache is not None and _unchanged(path, pending[path]):
+                cache.put(pending[path], checksums[path])
+    log.debug(f"Hashed {len(pending)} files, {len(checksums) - len(pending)} checksums cached")
+    return checksums
+
+
+def remote_checksums(op, paths: Iterable[str]) -> dict[str, str | None]:
+    """Get the checksums of remote files by path from the result of a ``get_metadata`` operation."""
+    if op.state != OperationState.Succeeded or not op.result:
+        # For example when none of the files exists yet
+        log.debug(f"No remote checksums available: {op.error}")
+        return {}
+    checksums = {}
+    for path in paths:
+        md = op.result.get(path)
+        checksums[path] = (md.get("checksum") or None) if isinstance(md, dict) else None
+    return checksums
+
+
+def identical(op, local: dict[str, str | None], remote: dict[str, str | None]) -> bool:
+    """Check whether a copy operation uploads a local file with the same checksum as its destination."""
+    if op.src.remote != "local":
+        return False
+    checksum = remote.get(op.dst.path)
+    return checksum is not None and local.get(op.src.path) == checksum
+
+
+def _unchanged(path: str, st: os.stat_result) -> bool:
+    """Check that a file was not modified while it was hashed."""
+    try:
+        return ChecksumCache.key(os.stat(path)) == ChecksumCache.key(st)
+    except OSError:
+        return False
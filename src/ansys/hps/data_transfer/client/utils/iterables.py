@@ -0,0 +1,97 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides helpers for working with large lists and iterables in bounded pieces."""
+
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Sequence
+import itertools
+
+
+def _sizes(size: int, first: int | None) -> Iterator[int]:
+    if size is None or size <= 0:
+        raise ValueError(f"Chunk size must be a positive integer, got {size}")
+    n = min(first or size, size)
+    while True:
+        yield n
+        n = min(n * 2, size)
+
+
+def chunked(items: Iterable, size: int, first: int | None = None) -> Iterator[list]:
+    """Split an iterable into lists of at most ``size`` items.
+
+    The input is consumed lazily, so generators are never fully materialized. Sequences other
+    than lists and tuples, such as ``CopyBatch``, are split into slices of their own type.
+
+    Parameters
+    ----------
+    items : Iterable
+        Items to split.
+    size : int
+        Maximum number of items per chunk.
+    first : int | None
+        Size of the first chunk. Following chunks double in size until they reach ``size``,
+        so that the first items can be processed without waiting for a full chunk.
+        Default is None, which makes all chunks ``size`` items long.
+    """
+    sizes = _sizes(size, first)
+    if isinstance(items, Sequence) and not isinstance(items, list | tuple | str):
+        # Slice custom sequences, such as columnar batches, to keep the chunks of the same type
+        start = 0
+        while start < len(items):
+            n = next(sizes)
+            yield items[start : start + n]
+            start += n
+        return
+
+    it = iter(items)
+    while chunk := list(itertools.islice(it, next(sizes))):
+        yield chunk
+
+
+async def achunked(items: Iterable | AsyncIterable, size: int, first: int | None = None) -> AsyncIterator[list]:
+    """Split an iterable or an async iterable into lists of at most ``size`` items.
+
+    Parameters
+    ----------
+    items : Iterable | AsyncIterable
+        Items to split.
+    size : int
+        Maximum number of items per chunk.
+    first : int | None
+        Size of the first chunk. Following chunks double in size until they reach ``size``.
+        Default is None, which makes all chunks ``size`` items long.
+    """
+    if not isinstance(items, AsyncIterable):
+        for chunk in chunked(items, size, first=first):
+            yield chunk
+        return
+
+    sizes = _sizes(size, first)
+    n = next(sizes)
+    chunk = []
+    async for item in items:
+        chunk.append(item)
+        if len(chunk) >= n:
+            yield chunk
+            chunk = []
+            n = next(sizes)
+    if chunk:
+        yield chunk
@@ -0,0 +1,227 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides helpers for streaming large JSON request bodies without building them in memory."""
+
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+import json
+
+from ..exceptions import ClientError
+
+default_buffer_size = 64 * 1024
+
+
+class SinglePass:
+    """Wraps a one-shot iterator so that iterating it again fails loudly.
+
+    Retrying a request whose body was generated from an exhausted iterator would otherwise
+    silently send an empty or partial body.
+
+    Parameters
+    ----------
+    items : Iterator
+        Iterator to wrap.
+    """
+
+    def __init__(self, items: Iterator | AsyncIterator):
+        """Initialize the SinglePass class object."""
+        self._items = items
+        self._started = False
+
+    def _start(self):
+        if self._started:
+            raise ClientError("Operations from a generator were partially sent and cannot be sent again", give_up=True)
+        self._started = True
+
+    def __iter__(self):
+        """Iterate over the wrapped iterator, once."""
+        self._start()
+        return iter(self._items)
+
+
+class AsyncSinglePass(SinglePass):
+    """Wraps a one-shot async iterator so that iterating it again fails loudly."""
+
+    # Not a sync iterable, so that httpx and ``aiter_json_array`` take the async path
+    __iter__ = None
+
+    def __aiter__(self):
+        """Iterate over the wrapped async iterator, once."""
+        self._start()
+        return aiter(self._items)
+
+
+def single_pass(items: Iterable | AsyncIterable) -> Iterable | AsyncIterable:
+    """Wrap one-shot iterators in ``SinglePass``, returning re-iterable collections unchanged."""
+    if isinstance(items, AsyncIterator):
+        return AsyncSinglePass(items)
+    if isinstance(items, Iterator):
+        return SinglePass(items)
+    return items
+
+
+def dump_model(mode: str = "json") -> Callable[[object], str]:
+    """Get a function serializing a pydantic model to a JSON string.
+
+    Parameters
+    ----------
+    mode : str
+        Mode passed to ``model_dump``. Default is ``json``.
+    """
+    if mode == "json":
+        return lambda m: m.model_dump_json()
+    return lambda m: json.dumps(m.model_dump(mode=mode))
+
+
+def _head(key: str) -> bytes:
+    return f"{{{json.dumps(key)}: [".encode()
+
+
+def iter_json_array(
+    key: str, items: Iterable, dump: Callable[[object], str], buffer_size: int = default_buffer_size
+) -> Iterator[bytes]:
+    """Generate the JSON object ``{key: [items...]}`` as a stream of bytes.
+
+    Items are serialized one at a time and written out in pieces of about ``buffer_size`` bytes,
+    so that memory use does not depend on the number of items. Items providing ``iter_json``,
+    such as ``CopyBatch``, are serialized by it instead of ``dump``.
+
+    Parameters
+    ----------
+    key : str
+        Name of the array in the JSON object.
+    items : Iterable
+        Items of the array.
+    dump : Callable[[object], str]
+        Function serializing an item to a JSON string.
+    buffer_size : int
+        Approximate size in bytes of the generated pieces. Default is 64 KiB.
+    """
+    # Columnar batches serialize themselves without creating a model per item
+    strings = items.iter_json() if hasattr(items, "iter_json") else map(dump, items)
+    buf = bytearray(_head(key))
+    sep = b""
+    for item in strings:
+        buf += sep + item.encode()
+        sep = b","
+        if len(buf) >= buffer_size:
+            yield bytes(buf)
+            buf.clear()
+    buf += b"]}"
+    yield bytes(buf)
+
+
+async def aiter_json_array(
+    key: str, items: Iterable | AsyncIterable, dump: Callable[[object], str], buffer_size: int = default_buffer_size
+) -> AsyncIterator[bytes]:
+    """Generate the JSON object ``{key: [items...]}`` as an async stream of bytes.
+
+    Parameters
+    ----------
+    key : str
+        Name of the array in the JSON object.
+    items : Iterable | AsyncIterable
+        Items of the array.
+    dump : Callable[[object], str]
+        Function serializing an item to a JSON string.
+    buffer_size : int
+        Approximate size in bytes of the generated pieces. Default is 64 KiB.
+    """
+    if not isinstance(items, AsyncIterable):
+        for piece in iter_json_array(key, items, dump, buffer_size=buffer_size):
+            yield piece
+        return
+
+    buf = bytearray(_head(key))
+    sep = b""
+    async for item in items:
+        buf += sep + dump(item).encode()
+        sep = b","
+        if len(buf) >= buffer_size:
+            yield bytes(buf)
+            buf.clear()
+    buf += b"]}"
+    yield bytes(buf)
+
+
+class JsonArrayBody:
+    """Provides a streamed request body holding the JSON object ``{key: [items...]}``.
+
+    Unlike a generator, the body can be sent again, for example when a request is retried
+    after refreshing the access token, as long as ``items`` can be iterated again.
+
+    Parameters
+    ----------
+    key : str
+        Name of the array in the JSON object.
+    items : Iterable
+        Items of the array.
+    dump : Callable[[object], str]
+        Function serializing an item to a JSON string.
+    buffer_size : int
+        Approximate size in bytes of the generated pieces. Default is 64 KiB.
+    """
+
+    def __init__(
+        self, key: str, items: Iterable, dump: Callable[[object], str], buffer_size: int = default_buffer_size
+    ):
+        """Initialize the JsonArrayBody class object."""
+        self.key = key
+        self.items = items
+        self.dump = dump
+        self.buffer_size = buffer_size
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Generate the body."""
+        return iter_json_array(self.key, self.items, self.dump, buffer_size=self.buffer_size)
+
+
+class AsyncJsonArrayBody:
+    """Provides an asynchronously streamed request body holding the JSON object ``{key: [items...]}``.
+
+    Parameters
+    ----------
+    key : str
+        Name of the array in the JSON object.
+    items : Iterable | AsyncIterable
+        Items of the array.
+    dump : Callable[[object], str]
+        Function serializing an item to a JSON string.
+    buffer_size : int
+        Approximate size in bytes of the generated pieces. Default is 64 KiB.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        items: Iterable | AsyncIterable,
+        dump: Callable[[object], str],
+        buffer_size: int = default_buffer_size,
+    ):
+        """Initialize the AsyncJsonArrayBody class object."""
+        self.key = key
+        self.items = items
+        self.dump = dump
+        self.buffer_size = buffer_size
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        """Generate the body."""
+        return aiter_json_array(self.key, self.items, self.dump, buffer_size=self.buffer_size)
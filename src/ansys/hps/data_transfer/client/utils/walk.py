@@ -0,0 +1,159 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides a parallel directory walker that yields files while the walk is still running."""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterable, Iterator
+import concurrent.futures
+import fnmatch
+import logging
+import os
+
+log = logging.getLogger(__name__)
+
+
+def as_patterns(patterns: str | Iterable[str] | None) -> list[str]:
+    """Normalize glob patterns given as None, a single string or an iterable of strings to a list."""
+    if patterns is None:
+        return []
+    if isinstance(patterns, str):
+        return [patterns]
+    return list(patterns)
+
+
+def matches(name: str, rel: str, patterns: list[str]) -> bool:
+    """Check whether a file or directory name or its relative path matches any of the glob patterns."""
+    return any(fnmatch.fnmatch(rel, p) or fnmatch.fnmatch(name, p) for p in patterns)
+
+
+def _scan(path: str, rel_dir: str, include: list[str], exclude: list[str]):
+    """Scan a single directory, returning its matching files and its subdirectories."""
+    files = []
+    dirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if exclude and matches(entry.name, rel, exclude):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append((entry.path, rel))
+                    elif entry.is_file() and (not include or matches(entry.name, rel, include)):
+                        files.append((entry.path, rel))
+                except OSError as e:
+                    log.warning(f"Skipping {entry.path}: {e}")
+    except OSError as e:
+        log.warning(f"Skipping directory {path}: {e}")
+    return files, dirs
+
+
+def walk_files(
+    root: str,
+    include: str | Iterable[str] | None = None,
+    exclude: str | Iterable[str] | None = None,
+    workers: int = 8,
+) -> Iterator[tuple[str, str]]:
+    """Walk a directory tree with parallel ``os.scandir`` workers.
+
+    Files are yielded as soon as the directory containing them is scanned, in no particular order.
+
+    Parameters
+    ----------
+    root : str
+        Directory to walk.
+    include : str | Iterable[str] | None
+        Glob patterns of files to include, matched against the file name and the path relative
+        to ``root``. Default is None, which includes all files.
+    exclude : str | Iterable[str] | None
+        Glob patterns of files and directories to exclude. Excluded directories are not walked.
+    workers : int
+        Number of directories scanned in parallel. Default is 8.
+
+    Yields:
+    ------
+    tuple[str, str]
+        Path of the file and its path relative to ``root`` with forward slashes.
+    """
+    include, exclude = as_patterns(include), as_patterns(exclude)
+    todo = deque([(os.fspath(root), "")])
+    pending = set()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="walk") as pool:
+        try:
+            while todo or pending:
+                while todo and len(pending) < workers:
+                    path, rel = todo.popleft()
+                    pending.add(pool.submit(_scan, path, rel, include, exclude))
+                done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for f in done:
+                    files, dirs = f.result()
+                    todo.extend(dirs)
+                    yield from files
+        finally:
+            # The consumer may stop early, do not wait for directories nobody is interested in
+            for f in pending:
+                f.cancel()
+
+
+async def awalk_files(
+    root: str,
+    include: str | Iterable[str] | None = None,
+    exclude: str | Iterable[str] | None = None,
+    workers: int = 8,
+) -> AsyncIterator[tuple[str, str]]:
+    """Walk a directory tree with parallel ``os.scandir`` workers without blocking the event loop.
+
+    Parameters
+    ----------
+    root : str
+        Directory to walk.
+    include : str | Iterable[str] | None
+        Glob patterns of files to include, matched against the file name and the path relative
+        to ``root``. Default is None, which includes all files.
+    exclude : str | Iterable[str] | None
+        Glob patterns of files and directories to exclude. Excluded directories are not walked.
+    workers : int
+        Number of directories scanned in parallel. Default is 8.
+
+    Yields:
+    ------
+    tuple[str, str]
+        Path of the file and its path relative to ``root`` with forward slashes.
+    """
+    include, exclude = as_patterns(include), as_patterns(exclude)
+    todo = deque([(os.fspath(root), "")])
+    pending = set()
+    try:
+        while todo or pending:
+            while todo and len(pending) < workers:
+                path, rel = todo.popleft()
+                pending.add(asyncio.create_task(asyncio.to_thread(_scan, path, rel, include, exclude)))
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for t in done:
+                files, dirs = t.result()
+                todo.extend(dirs)
+                for f in files:
+                    yield f
+    finally:
+        for t in pending:
+            t.cancel()
@@ -0,0 +1,275 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""This module contains fakes of the worker shared by the unit tests.
+
+Unlike the fixtures of ``conftest.py``, they need no running worker.
+"""
+
+import asyncio
+import concurrent.futures
+import itertools
+import os
+import threading
+import time
+
+from ansys.hps.data_transfer.client import AsyncClient, AsyncDataTransferApi, Client, DataTransferApi
+from ansys.hps.data_transfer.client.models import Operation, OperationIdResponse, OperationState
+
+# Modification time of the files uploaded to a fake remote
+UPLOAD_MTIME = 2_000_000_000
+
+
+class FakeWorker:
+    """Pretends to be the worker's endpoints for submitting and polling operations.
+
+    Submitted operations get the IDs ``op-0``, ``op-1`` and so on, each submission taking ``delay``
+    seconds. Cancelled operation IDs are recorded in ``cancelled``. Operations succeed after
+    ``polls_until_done`` polls, a number or a callable getting it from the operation ID, or fail
+    if their ID is in ``failed``. Until then, they are queued if ``queued`` and running otherwise.
+    Finished operations have transferred ``size`` bytes. Operation groups are given by the IDs of
+    their children and finish with their last child. If ``grouped``, submissions become groups with
+    a child per entry, ``op-0.0``, ``op-0.1`` and so on, described by the paths of the entry.
+
+    Subclasses serving more API routes list them in ``routes``, by API attribute.
+    """
+
+    size = 10
+    routes = {}
+
+    def __init__(self, polls_until_done=1, groups=None, failed=(), delay=0.0, queued=False, grouped=False):
+        self.polls_until_done = polls_until_done
+        self.queued = queued
+        self.grouped = grouped
+        # Children of the operation groups, by group ID
+        self.groups = groups or {}
+        self.descriptions = {}
+        self.failed = set(failed)
+        self.delay = delay
+        self.counter = itertools.count()
+        # Storage operation and operations of every submission, by operation ID
+        self.submissions = {}
+        # Results of the operations, by operation ID
+        self.results = {}
+        self.cancelled = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.polls = {}
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def _enter(self):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _new_id(self):
+        return f"op-{next(self.counter)}"
+
+    def _exit(self, storage_operation, operations, params):
+        with self.lock:
+            self.in_flight -= 1
+            id = self._new_id()
+            operations = list(operations)
+            self.submissions[id] = (storage_operation, operations)
+            if self.grouped:
+                self.groups[id] = []
+                for n, op in enumerate(operations):
+                    paths = [f"{p.remote}:{p.path}" for p in (op.src, op.dst)] if hasattr(op, "src") else [op.path]
+                    self.groups[id].append(f"{id}.{n}")
+                    self.descriptions[f"{id}.{n}"] = f"{storage_operation} {' to '.join(paths)}"
+            self._apply(id, storage_operation, operations, params)
+        return OperationIdResponse(id=id)
+
+    def _apply(self, id, storage_operation, operations, params):
+        """Carry out a submission, see ``FakeRemote``."""
+
+    def submit(self, storage_operation, operations, params=None):
+        self._enter()
+        time.sleep(self.delay)
+        return self._exit(storage_operation, operations, params)
+
+    async def async_submit(self, storage_operation, operations, params=None):
+        self._enter()
+        await asyncio.sleep(self.delay)
+        return self._exit(storage_operation, operations, params)
+
+    def paths(self, id):
+        """Get the paths of the operations submitted as ``id``, the source paths for copies and moves."""
+        return [getattr(op, "src", op).path for op in self.submissions[id][1]]
+
+    def cancel(self, ids):
+        self.cancelled.extend(ids)
+
+    async def async_cancel(self, ids):
+        self.cancel(ids)
+
+    def _done(self, id):
+        polls_until_done = self.polls_until_done(id) if callable(self.polls_until_done) else self.polls_until_done
+        return self.polls.get(id, 0) >= polls_until_done
+
+    def _operation(self, id, expand):
+        if id in self.groups:
+            children = self.groups[id]
+            done = all(self._done(ch) for ch in children)
+            op = {"id": id, "description": id, "state": "succeeded" if done else "running", "children": list(children)}
+            if expand:
+                op["children_detail"] = [self._operation(ch, False) for ch in children]
+            return op
+        self.polls[id] = self.polls.get(id, 0) + 1
+        if not self._done(id):
+            return {"id": id, "state": "queued" if self.queued else "running", "progress_current": 0}
+        state = "failed" if id in self.failed else "succeeded"
+        op = {"id": id, "state": state, "progress_current": self.size, "result": self.results.get(id)}
+        if id in self.descriptions:
+            op["description"] = self.descriptions[id]
+        if state == "failed":
+            op["error"] = f"{id} failed"
+        return op
+
+    def operations_raw(self, ids, expand=False):
+        with self.lock:
+            self.calls.append(list(ids))
+            return [self._operation(id, expand) for id in ids]
+
+    def operations(self, ids, expand=False):
+        return [Operation(**op) for op in self.operations_raw(ids, expand=expand)]
+
+    async def async_operations_raw(self, ids, expand=False):
+        return self.operations_raw(ids, expand=expand)
+
+    async def async_operations(self, ids, expand=False):
+        return self.operations(ids, expand=expand)
+
+
+class FakeRemote(FakeWorker):
+    """Pretends to be a worker with an in-memory remote storage.
+
+    Listings are requested in extended mode. Uploaded files get the modification time ``UPLOAD_MTIME``.
+    """
+
+    def __init__(self, files=None, root="", mtimes=None):
+        super().__init__()
+        # Contents and modification times of the files of the remote directory ``root``, by relative path
+        self.files = files or {}
+        self.mtimes = mtimes or {}
+        self.root = root
+        self.lists = 0
+        self.copied = []
+        self.removed = []
+
+    def _rel(self, path):
+        return path[len(self.root) :].strip("/") if self.root else path
+
+    def _apply(self, id, storage_operation, operations, params):
+        if storage_operation == "list":
+            assert params == {"mode": "extended"}
+            self.lists += 1
+            self.results[id] = {f"{op.remote}:{op.path}": self._entries(op.path) for op in operations}
+            return
+        for op in operations:
+            self._apply_one(storage_operation, op)
+
+    def _apply_one(self, storage_operation, op):
+        if storage_operation == "remove":
+            self.removed.append(op.path)
+            return
+        assert storage_operation == "copy"
+        self.copied.append(op.dst.path)
+        if op.src.remote == "local":
+            with open(op.src.path, "rb") as f:
+                self.files[self._rel(op.dst.path)] = f.read()
+            self.mtimes[self._rel(op.dst.path)] = UPLOAD_MTIME
+        else:
+            os.makedirs(os.path.dirname(op.dst.path), exist_ok=True)
+            with open(op.dst.path, "wb") as f:
+                f.write(self.files[self._rel(op.src.path)])
+
+    def _entries(self, path):
+        rel = self._rel(path)
+        prefix = f"{rel}/" if rel else ""
+        entries = {}
+        for p, data in self.files.items():
+            if not p.startswith(prefix):
+                continue
+            name, _, rest = p[len(prefix) :].partition("/")
+            if rest:
+                entries[name] = {"name": name, "type": "directory"}
+            else:
+                entries[name] = {"name": name, "type": "file", "size": len(data)}
+                if p in self.mtimes:
+                    entries[name]["mod_time"] = self.mtimes[p]
+        return list(entries.values())
+
+
+class FakeWatch:
+    def __init__(self, future):
+        self.future = future
+
+
+class FakeWatcher:
+    """Lets the test decide when submitted operations start and finish."""
+
+    def __init__(self, make_future=concurrent.futures.Future):
+        self.make_future = make_future
+        self.watches = {}
+        self.handlers = {}
+
+    def watch(self, ids, expand=False, handler=None):
+        w = FakeWatch(self.make_future())
+        self.watches[ids[0]] = w
+        self.handlers[ids[0]] = handler
+        return w
+
+    def start(self, id):
+        return self.handlers[id]([Operation(id=id, state=OperationState.Running)])
+
+    def finish(self, id):
+        self.watches[id].future.set_result([])
+
+
+def wait_until(predicate, timeout=5.0):
+    start = time.monotonic()
+    while not predicate():
+        assert time.monotonic() - start < timeout
+        time.sleep(0.01)
+
+
+def make_api(worker, client=None):
+    api = DataTransferApi(client or Client())
+    api._exec_operation_req = worker.submit
+    api._operations = worker.operations
+    api._operations_raw = worker.operations_raw
+    api._cancel = worker.cancel
+    for attr, name in worker.routes.items():
+        setattr(api, attr, getattr(worker, name))
+    return api
+
+
+def make_async_api(worker, client=None):
+    api = AsyncDataTransferApi(client or AsyncClient())
+    api._exec_async_operation_req = worker.async_submit
+    api._operations = worker.async_operations
+    api._operations_raw = worker.async_operations_raw
+    api._cancel = worker.async_cancel
+    for attr, name in worker.routes.items():
+        setattr(api, attr, getattr(worker, f"async_{name}"))
+    return api
@@ -0,0 +1,196 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""This module contains tests for verifying admission control of submissions."""
+
+import asyncio
+import concurrent.futures
+
+import pytest
+
+from ansys.hps.data_transfer.client import AsyncClient, AsyncDataTransferApi, Client
+from ansys.hps.data_transfer.client.api import AsyncPriorityScheduler, Cost, Limits, Priority, PriorityScheduler
+from ansys.hps.data_transfer.client.api.scheduler import batch_cost
+from ansys.hps.data_transfer.client.exceptions import AdmissionError
+from ansys.hps.data_transfer.client.models import OperationIdResponse, SrcDst, StoragePath
+
+from .fakes import FakeWatcher, FakeWorker, make_api, wait_until
+
+
+def submitter(name):
+    return lambda: OperationIdResponse(id=name)
+
+
+def test_operation_limit():
+    """Test that batches wait until the operations in flight leave room for them."""
+    watcher = FakeWatcher()
+    scheduler = PriorityScheduler(watcher, limits=Limits(max_operations=4))
+    scheduler.submit(Priority.normal, submitter("a"), cost=Cost(3))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        waiting = pool.submit(scheduler.submit, Priority.normal, submitter("b"), Cost(2))
+        wait_until(lambda: scheduler.num_waiting == 1)
+        assert scheduler.usage() == (3, 0, 3)
+        watcher.finish("a")
+        waiting.result(timeout=5)
+    assert scheduler.usage() == (2, 0, 2)
+
+
+def test_oversized_batch():
+    """Test that a batch above the limits is admitted once nothing else is in flight."""
+    watcher = FakeWatcher()
+    scheduler = PriorityScheduler(watcher, limits=Limits(max_operations=2, max_bytes=10))
+    scheduler.submit(Priority.normal, submitter("big"), cost=Cost(5, bytes=100))
+    assert scheduler.num_active == 1
+
+
+def test_queued_limit():
+    """Test that batches are admitted as soon as earlier ones leave the queue of the worker."""
+    watcher = FakeWatcher()
+    scheduler = PriorityScheduler(watcher, limits=Limits(max_queued=2))
+    scheduler.submit(Priority.normal, submitter("a"), cost=Cost(2))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        waiting = pool.submit(scheduler.submit, Priority.normal, submitter("b"), Cost(2))
+        wait_until(lambda: scheduler.num_waiting == 1)
+        watcher.start("a")
+        waiting.result(timeout=5)
+    assert scheduler.usage() == (4, 0, 2)
+
+
+def test_remote_limits():
+    """Test that a saturated remote does not hold back submissions to other remotes."""
+    watcher = FakeWatcher()
+    scheduler = PriorityScheduler(watcher, remote_limits={"slow": Limits(max_operations=1)}, block=False)
+    scheduler.submit(Priority.normal, submitter("a"), cost=Cost(1, remote="slow"))
+    scheduler.submit(Priority.normal, submitter("b"), cost=Cost(1, remote="fast"))
+
+    with pytest.raises(AdmissionError):
+        scheduler.submit(Priority.normal, submitter("c"), cost=Cost(1, remote="slow"))
+    assert scheduler.num_waiting == 0
+    assert scheduler.usage("slow") == (1, 0, 1)
+
+
+def test_remote_limits_head_of_line():
+    """Test that a waiting batch held back by the limits of its remote does not block other remotes."""
+    watcher = FakeWatcher()
+    scheduler = PriorityScheduler(watcher, remote_limits={"A": Limits(max_operations=1)})
+    scheduler.submit(Priority.normal, submitter("a1"), cost=Cost(1, remote="A"))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        waiting = pool.submit(scheduler.submit, Priority.interactive, submitter("a2"), Cost(1, remote="A"))
+        wait_until(lambda: scheduler.num_waiting == 1)
+        # Lower priority, but on a remote without limits
+        pool.submit(scheduler.submit, Priority.normal, submitter("b"), Cost(1, remote="B")).result(timeout=5)
+        assert scheduler.num_waiting == 1
+        watcher.finish("a1")
+        waiting.result(timeout=5)
+    assert scheduler.usage("A") == (1, 0, 1)
+
+
+def test_global_limits_strict():
+    """Test that the global limits keep the admission order strict across remotes."""
+    watcher = FakeWatcher()
+    scheduler = PriorityScheduler(watcher, limits=Limits(max_operations=2))
+    scheduler.submit(Priority.normal, submitter("a1"), cost=Cost(2, remote="A"))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(scheduler.submit, Priority.interactive, submitter("a2"), Cost(2, remote="A"))
+        wait_until(lambda: scheduler.num_waiting == 1)
+        second = pool.submit(scheduler.submit, Priority.normal, submitter("b"), Cost(1, remote="B"))
+        wait_until(lambda: scheduler.num_waiting == 2)
+        watcher.finish("a1")
+        first.result(timeout=5)
+        assert not second.done()
+        watcher.finish("a2")
+        second.result(timeout=5)
+
+
+async def test_async_remote_limits_head_of_line():
+    """Test that async submissions to other remotes pass a batch held back by its remote."""
+    watcher = FakeWatcher(make_future=asyncio.get_running_loop().create_future)
+    scheduler = AsyncPriorityScheduler(watcher, remote_limits={"A": Limits(max_operations=1)})
+
+    async def submit(name):
+        return OperationIdResponse(id=name)
+
+    await scheduler.submit(Priority.normal, lambda: submit("a1"), cost=Cost(1, remote="A"))
+    task = asyncio.create_task(scheduler.submit(Priority.interactive, lambda: submit("a2"), cost=Cost(1, remote="A")))
+    await asyncio.sleep(0)
+    await asyncio.wait_for(scheduler.submit(Priority.normal, lambda: submit("b"), cost=Cost(1, remote="B")), 5)
+    assert not task.done()
+    watcher.finish("a1")
+    await asyncio.wait_for(task, 5)
+
+
+def test_batch_cost(tmp_path):
+    """Test that the cost of a batch counts its operations, remote and uploaded bytes."""
+    (tmp_path / "a.txt").write_bytes(b"x" * 10)
+    ops = [
+        SrcDst(src=StoragePath(path=str(tmp_path / "a.txt"), remote="local"), dst=StoragePath(path="a.txt")),
+        SrcDst(src=StoragePath(path=str(tmp_path / "gone.txt"), remote="local"), dst=StoragePath(path="b.txt")),
+    ]
+    cost = batch_cost(ops, count_bytes=True)
+    assert (cost.operations, cost.bytes, cost.remote) == (2, 10, "any")
+    assert batch_cost(ops).bytes == 0
+
+    cost = batch_cost([StoragePath(path="x", remote="scratch")])
+    assert (cost.operations, cost.remote) == (1, "scratch")
+
+
+def test_api_rejects():
+    """Test that the API raises once the limits of the client are reached."""
+    api = make_api(FakeWorker(queued=True), Client(limits=Limits(max_operations=3), block_on_limits=False))
+
+    api.remove(StoragePath(path=f"a/{i}") for i in range(2))
+    with pytest.raises(AdmissionError):
+        api.remove([StoragePath(path=f"b/{i}") for i in range(2)])
+    assert api.scheduler.usage() == (2, 0, 2)
+    api.client.operation_watcher.stop()
+
+
+async def test_async_limits():
+    """Test that waiting tasks are admitted once the operations in flight leave room for them."""
+    watcher = FakeWatcher(make_future=asyncio.get_running_loop().create_future)
+    scheduler = AsyncPriorityScheduler(watcher, limits=Limits(max_queued=2))
+
+    async def submit(name):
+        return OperationIdResponse(id=name)
+
+    await scheduler.submit(Priority.normal, lambda: submit("a"), cost=Cost(2))
+    task = asyncio.create_task(scheduler.submit(Priority.normal, lambda: submit("b"), cost=Cost(1)))
+    await asyncio.sleep(0)
+    assert scheduler.num_waiting == 1
+
+    await watcher.start("a")
+    await task
+    assert scheduler.usage() == (3, 0, 1)
+
+    scheduler.block = False
+    with pytest.raises(AdmissionError):
+        await scheduler.submit(Priority.normal, lambda: submit("c"), cost=Cost(2))
+
+
+async def test_async_api_scheduler():
+    """Test that the async API creates a scheduler for clients with limits."""
+    api = AsyncDataTransferApi(AsyncClient(remote_limits={"any": Limits(max_bytes=1)}))
+    assert api.scheduler.needs_bytes
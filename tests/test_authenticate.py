@@ -0,0 +1,152 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""This module contains tests for verifying the token cache of ``authenticate``."""
+
+import itertools
+import json
+import os
+import sys
+
+import pytest
+
+from ansys.hps.data_transfer.client import authenticate as auth
+from ansys.hps.data_transfer.client.exceptions import ClientError
+
+
+class FakeIdentityProvider:
+    """Records token requests and issues numbered tokens."""
+
+    def __init__(self, fail_refresh=False):
+        self.requests = []
+        self.counter = itertools.count()
+        self.fail_refresh = fail_refresh
+
+    def request_token(self, auth_url, data, timeout, verify):
+        self.requests.append(data)
+        if data["grant_type"] == "refresh_token" and self.fail_refresh:
+            raise ClientError("invalid_grant")
+        n = next(self.counter)
+        return {"access_token": f"access-{n}", "refresh_token": f"refresh-{n}", "expires_in": 300}
+
+
+@pytest.fixture
+def idp(monkeypatch):
+    idp = FakeIdentityProvider()
+    monkeypatch.setattr(auth, "_request_token", idp.request_token)
+    return idp
+
+
+def login(cache, username="repuser"):
+    return auth.authenticate(url="https://hps", username=username, password="secret", cache=cache)
+
+
+def expire(cache):
+    """Make the cached access tokens due for renewal."""
+    with open(cache) as f:
+        entries = json.load(f)
+    for entry in entries.values():
+        entry["renew_at"] = 0
+    with open(cache, "w") as f:
+        json.dump(entries, f)
+
+
+def test_no_cache(idp):
+    """Test that every call logs in without a cache."""
+    login(cache=False)
+    login(cache=False)
+    assert len(idp.requests) == 2
+
+
+def test_cached_token_reused(idp, tmp_path):
+    """Test that an unexpired access token is reused from the cache."""
+    cache = str(tmp_path / "tokens" / "cache.json")
+    first = login(cache)
+    second = login(cache)
+
+    assert len(idp.requests) == 1
+    assert second["access_token"] == first["access_token"]
+    assert 0 < second["expires_in"] <= 300
+    if sys.platform != "win32":
+        assert os.stat(cache).st_mode & 0o777 == 0o600
+
+    # Other users get their own tokens
+    assert login(cache, username="other")["access_token"] == "access-1"
+
+
+def test_cache_keyed_by_credential(idp, tmp_path):
+    """Test that callers without a username only share tokens requested with the same credentials."""
+    cache = str(tmp_path / "cache.json")
+
+    def refresh(refresh_token):
+        return auth.authenticate(
+            url="https://hps", grant_type="refresh_token", refresh_token=refresh_token, cache=cache
+        )
+
+    alice = refresh("alice-rt")
+    bob = refresh("bob-rt")
+    assert bob["access_token"] != alice["access_token"]
+    assert [d["refresh_token"] for d in idp.requests] == ["alice-rt", "bob-rt"]
+    assert refresh("alice-rt")["access_token"] == alice["access_token"]
+
+    # The grant type, client secret and extra parameters are part of the key too
+    auth.authenticate(url="https://hps", grant_type="client_credentials", client_secret="s1", cache=cache)
+    auth.authenticate(url="https://hps", grant_type="client_credentials", client_secret="s2", cache=cache)
+    auth.authenticate(
+        url="https://hps", grant_type="client_credentials", client_secret="s2", audience="other", cache=cache
+    )
+    assert len(idp.requests) == 5
+
+    with open(cache) as f:
+        content = f.read()
+    for secret in ["alice-rt", "bob-rt", "s1", "s2"]:
+        assert secret not in content
+
+
+def test_refresh_grant_preferred(idp, tmp_path):
+    """Test that tokens due for renewal are renewed with the cached refresh token."""
+    cache = str(tmp_path / "cache.json")
+    login(cache)
+    expire(cache)
+
+    assert login(cache)["access_token"] == "access-1"
+    data = idp.requests[-1]
+    assert data["grant_type"] == "refresh_token"
+    assert data["refresh_token"] == "refresh-0"
+    assert "password" not in data
+
+
+def test_refresh_failure_falls_back(idp, tmp_path):
+    """Test that the password grant is used if the cached refresh token is rejected."""
+    cache = str(tmp_path / "cache.json")
+    login(cache)
+    expire(cache)
+    idp.fail_refresh = True
+
+    assert login(cache)["access_token"] == "access-1"
+    assert [d["grant_type"] for d in idp.requests] == ["password", "refresh_token", "password"]
+
+
+def test_pooled_session():
+    """Test that one session is used per TLS verification setting."""
+    assert auth._session(False) is auth._session(False)
+    assert auth._session(False) is not auth._session(True)
@@ -0,0 +1,98 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""This module contains tests for verifying columnar operation batches."""
+
+import json
+
+import httpx
+import pytest
+
+from ansys.hps.data_transfer.client import Client, DataTransferApi
+from ansys.hps.data_transfer.client.models import CopyBatch, PathBatch, SrcDst, StoragePath
+from ansys.hps.data_transfer.client.utils.iterables import chunked
+from ansys.hps.data_transfer.client.utils.stream import dump_model, iter_json_array
+
+
+def _body(operations):
+    return json.loads(b"".join(iter_json_array("operations", operations, dump_model())))
+
+
+def test_copy_batch_wire_format():
+    """Test that a batch serializes exactly like the equivalent models."""
+    src = ["a.txt", 'we"ird\\näme.txt']
+    dst = ["x/a.txt", "x/b.txt"]
+    batch = CopyBatch(src, dst, src_remotes="local", dst_remotes=["s3", "any"])
+    models = [
+        SrcDst(src=StoragePath(path=src[0], remote="local"), dst=StoragePath(path=dst[0], remote="s3")),
+        SrcDst(src=StoragePath(path=src[1], remote="local"), dst=StoragePath(path=dst[1], remote="any")),
+    ]
+    assert _body(batch) == _body(models)
+    assert list(batch) == models
+    assert CopyBatch.from_models(models)[1] == models[1]
+
+
+def test_path_batch():
+    """Test item access, slicing and serialization of path batches."""
+    batch = PathBatch([f"{i}.txt" for i in range(10)])
+    assert len(batch) == 10
+    assert batch[3] == StoragePath(path="3.txt")
+    assert isinstance(batch[2:5], PathBatch)
+    assert [p.path for p in batch[2:5]] == ["2.txt", "3.txt", "4.txt"]
+    assert _body(batch) == _body(list(batch))
+
+    chunks = list(chunked(batch, 4))
+    assert all(isinstance(c, PathBatch) for c in chunks)
+    assert [len(c) for c in chunks] == [4, 4, 2]
+
+
+def test_batch_validation():
+    """Test that columns are validated in bulk."""
+    with pytest.raises(ValueError):
+        CopyBatch(["a", "b"], ["a"])
+    with pytest.raises(TypeError):
+        PathBatch(["a", None])
+    with pytest.raises(ValueError):
+        PathBatch(["a", "b"], remotes=["any"])
+
+
+def test_api_copy_batch():
+    """Test that the API streams batches without creating models."""
+    bodies = []
+
+    def worker(request):
+        bodies.append(json.loads(request.read()))
+        return httpx.Response(200, json={"id": f"op-{len(bodies)}"})
+
+    client = Client()
+    client._session = httpx.Client(transport=httpx.MockTransport(worker), base_url="http://worker")
+    api = DataTransferApi(client)
+
+    batch = CopyBatch([f"{i}" for i in range(1000)], [f"dst/{i}" for i in range(1000)], src_remotes="local")
+    api.copy(batch)
+    result = api.copy(batch, batch_size=300)
+    assert len(result) == 4
+    assert [len(b["operations"]) for b in bodies] == [1000, 300, 300, 300, 100]
+    assert bodies[0]["operations"][999] == {
+        "src": {"path": "999", "remote": "local"},
+        "dst": {"path": "dst/999", "remote": "any"},
+    }
@@ -0,0 +1,121 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""This module contains tests for verifying chunked submission of large operation lists."""
+
+import pytest
+
+from ansys.hps.data_transfer.client.api import OperationBatch, TransferFuture
+from ansys.hps.data_transfer.client.exceptions import APIError
+from ansys.hps.data_transfer.client.models import OperationState, StoragePath
+
+from .fakes import FakeWorker, make_api, make_async_api
+
+
+def _paths(n):
+    # A generator, so that the input is never materialized as a whole
+    return (StoragePath(path=f"{i}.txt") for i in range(n))
+
+
+def test_batch_submit():
+    """Test that large lists are submitted in bounded concurrent chunks."""
+    worker = FakeWorker(delay=0.01)
+    api = make_api(worker)
+
+    batch = api.remove(_paths(1050), batch_size=100, max_in_flight=3)
+    assert isinstance(batch, OperationBatch)
+    assert len(batch) == 11
+    assert worker.max_in_flight <= 3
+    # Responses are in submission order
+    paths = [p for id in batch.ids for p in worker.paths(id)]
+    assert paths == [f"{i}.txt" for i in range(1050)]
+
+    ops = api.wait_for(batch)
+    assert [op.id for op in ops] == batch.ids
+    ops = api.wait_for([batch, "op-extra"])
+    assert len(ops) == 12
+
+
+def test_batch_submit_futures():
+    """Test that each batch gets its own future."""
+    worker = FakeWorker(delay=0.01)
+    api = make_api(worker)
+
+    batch = api.copy([], batch_size=10)
+    assert len(batch) == 0
+
+    batch = api.exists(list(_paths(25)), future=True, batch_size=10)
+    assert all(isinstance(f, TransferFuture) for f in batch)
+    assert [f.result(timeout=5).state for f in batch] == [OperationState.Succeeded] * 3
+
+
+async def test_async_batch_submit():
+    """Test chunked submission with the async API."""
+    worker = FakeWorker(delay=0.01)
+    api = make_async_api(worker)
+
+    batch = await api.remove(_paths(1050), batch_size=100, max_in_flight=3)
+    assert len(batch) == 11
+    assert worker.max_in_flight == 3
+    paths = [p for id in batch.ids for p in worker.paths(id)]
+    assert paths == [f"{i}.txt" for i in range(1050)]
+
+    ops = await api.wait_for(batch)
+    assert [op.id for op in ops] == batch.ids
+
+
+class FailingWorker(FakeWorker):
+    """Rejects the chunk starting at ``fail_at``."""
+
+    def __init__(self, fail_at):
+        super().__init__(delay=0.01)
+        self.fail_at = fail_at
+
+    def submit(self, storage_operation, operations, params=None):
+        if operations[0].path == f"{self.fail_at}.txt":
+            raise APIError("500 Server Error")
+        return super().submit(storage_operation, operations)
+
+    async def async_submit(self, storage_operation, operations, params=None):
+        return self.submit(storage_operation, operations)
+
+
+def test_batch_submit_failure():
+    """Test that the accepted chunks are cancelled when a chunk fails."""
+    worker = FailingWorker(fail_at=20)
+    api = make_api(worker)
+
+    with pytest.raises(APIError):
+        api.remove(_paths(50), batch_size=10, max_in_flight=1)
+    assert sorted(worker.cancelled) == ["op-0", "op-1"]
+
+
+async def test_async_batch_submit_failure():
+    """Test that the accepted chunks are cancelled when a chunk of an async submission fails."""
+    worker = FailingWorker(fail_at=20)
+    api = make_async_api(worker)
+
+    with pytest.raises(APIError):
+        await api.remove(_paths(50), batch_size=10, max_in_flight=2)
+    # The chunk in flight next to the failing one is cancelled as well
+    assert sorted(worker.cancelled) == sorted(worker.submissions)
+    assert {"op-0", "op-1"} <= set(worker.cancelled)
@@ -0,0 +1,97 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""This module contains tests for verifying the asyncio supervision of the worker binary."""
+
+import asyncio
+import os
+import sys
+import textwrap
+
+import pytest
+
+from ansys.hps.data_transfer.client.binary import AsyncBinary, BinaryConfig
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Uses a shell script as fake worker")
+
+
+def fake_worker(tmp_path, body):
+    """Create a fake worker recording its arguments on every start."""
+    path = tmp_path / "hpsdata"
+    path.write_text(
+        textwrap.dedent(
+            f"""\
+            #!/bin/sh
+            echo "$@" >> {tmp_path / "runs"}
+            echo '{{"level": "info", "msg": "started"}}'
+            echo 'not json'
+            """
+        )
+        + body
+    )
+    return str(path)
+
+
+def config(path, **kwargs):
+    cfg = BinaryConfig(path=path, port=1234, token="tok", data_transfer_url="https://dt", **kwargs)
+    cfg.log = True
+    return cfg
+
+
+def runs(tmp_path):
+    with open(tmp_path / "runs") as f:
+        return f.read().splitlines()
+
+
+async def test_restart_on_crash(tmp_path):
+    """Test that a crashing worker is restarted until the restart limit is reached."""
+    messages = []
+    died = []
+    cfg = config(fake_worker(tmp_path, "exit 3\n"), max_restarts=2)
+    cfg.log_message = lambda debug, d: messages.append(d["msg"])
+    cfg._on_process_died = died.append
+
+    binary = AsyncBinary(config=cfg)
+    await binary.start()
+    await asyncio.wait_for(binary._supervisor, 10)
+
+    assert len(runs(tmp_path)) == 3
+    assert died == [3, 3]
+    assert messages == ["started"] * 3
+    assert not binary.is_started
+    await binary.stop()
+
+
+async def test_stop(tmp_path):
+    """Test that a worker that does not exit on its own is killed on stop."""
+    binary = AsyncBinary(config=config(fake_worker(tmp_path, "exec sleep 30\n")))
+    await binary.start()
+    assert binary.is_started
+
+    await binary.stop(wait=0.2)
+    assert not binary.is_started
+    assert binary._supervisor is None
+
+    # The token is passed without the quotes needed by a shell
+    args = runs(tmp_path)[0].split()
+    assert args[args.index("-t") + 1 :][:2] == ["Bearer", "tok"]
+    assert os.access(binary.config.path, os.X_OK)
@@ -0,0 +1,144 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""This module contains tests for verifying cancellation of operations."""
+
+import asyncio
+import time
+from unittest import mock
+
+import pytest
+
+from ansys.hps.data_transfer.client import AsyncClient, AsyncDataTransferApi, Client, DataTransferApi
+from ansys.hps.data_transfer.client.exceptions import ClientError, TimeoutError
+from ansys.hps.data_transfer.client.models import Operation, OperationState
+
+
+def _operations(ids, expand=False):
+    # op-0 completes right away, all others keep running
+    return [Operation(id=i, state=OperationState.Succeeded if i == "op-0" else OperationState.Running) for i in ids]
+
+
+async def _async_operations(ids, expand=False):
+    return _operations(ids, expand=expand)
+
+
+def _cancelled_ids(post):
+    return [i for c in post.call_args_list if c.args[0] == "/operations:cancel" for i in c.kwargs["json"]["ids"]]
+
+
+def test_cancel():
+    """Test that cancel requests are split into bounded chunks."""
+    client = Client()
+    client._session = mock.MagicMock()
+    api = DataTransferApi(client)
+    api.max_ids_per_request = 2
+
+    api._cancel_operations(["op-0", Operation(id="op-1"), "op-2"])
+    assert client._session.post.call_count == 2
+    assert _cancelled_ids(client._session.post) == ["op-0", "op-1", "op-2"]
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_cancel_on_timeout(shared):
+    """Test that unfinished operations are cancelled when the wait times out."""
+    client = Client()
+    client._session = mock.MagicMock()
+    api = DataTransferApi(client)
+    api._operations = _operations
+
+    with pytest.raises(TimeoutError):
+        api.wait_for(["op-0", "op-1", "op-2"], timeout=0.3, shared=shared, cancel_on_timeout=True)
+    assert _cancelled_ids(client._session.post) == ["op-1", "op-2"]
+
+    client._session.reset_mock()
+    with pytest.raises(TimeoutError):
+        api.wait_for(["op-1"], timeout=0.3, shared=shared, cancel_on_timeout=False)
+    client._session.post.assert_not_called()
+
+
+async def test_async_cancel_on_timeout():
+    """Test that unfinished operations are cancelled when the async wait times out."""
+    client = AsyncClient()
+    client._session = mock.AsyncMock()
+    api = AsyncDataTransferApi(client)
+    api._operations = _async_operations
+
+    with pytest.raises(TimeoutError):
+        await api.wait_for(["op-0", "op-1"], timeout=0.3, cancel_on_timeout=True)
+    assert _cancelled_ids(client._session.post) == ["op-1"]
+
+
+@pytest.mark.parametrize("shared", [False, True])
+async def test_async_cancel_on_task_cancel(shared):
+    """Test that unfinished operations are cancelled when the waiting task is cancelled."""
+    client = AsyncClient()
+    client._session = mock.AsyncMock()
+    api = AsyncDataTransferApi(client)
+    api._operations = _async_operations
+
+    task = asyncio.create_task(api.wait_for(["op-0", "op-1"], shared=shared, cancel_on_task_cancel=True))
+    await asyncio.sleep(0.3)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert _cancelled_ids(client._session.post) == ["op-1"]
+
+
+def _not_found(url, **kwargs):
+    raise ClientError(f"404 Client Error: Not Found for: POST {url}", give_up=False)
+
+
+def test_cancel_not_found():
+    """Test that a cancel request rejected by the worker is neither retried nor raised."""
+    client = Client()
+    client._session = mock.MagicMock()
+    client._session.post.side_effect = _not_found
+    api = DataTransferApi(client)
+    api._operations = _operations
+
+    assert api._cancel_operations(["op-1"]) is False
+    assert client._session.post.call_count == 1
+
+    start = time.time()
+    with pytest.raises(TimeoutError):
+        api.wait_for(["op-1"], timeout=0.3, cancel_on_timeout=True)
+    assert time.time() - start < 5
+    assert client._session.post.call_count == 2
+
+
+async def test_async_cancel_not_found():
+    """Test that a rejected cancel request does not hold up the cancellation of the waiting task."""
+    client = AsyncClient()
+    client._session = mock.AsyncMock()
+    client._session.post.side_effect = _not_found
+    api = AsyncDataTransferApi(client)
+    api._operations = _async_operations
+
+    assert await api._cancel_operations(["op-1"]) is False
+
+    task = asyncio.create_task(api.wait_for(["op-1"], cancel_on_task_cancel=True))
+    await asyncio.sleep(0.3)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(task, timeout=5)
+    assert client._session.post.call_count == 2
@@ -0,0 +1,145 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""This module contains tests for verifying checksum-based upload deduplication."""
+
+import os
+
+import pytest
+
+from ansys.hps.data_transfer.client.models import OperationIdResponse, SrcDst, StoragePath
+from ansys.hps.data_transfer.client.utils import checksum
+from ansys.hps.data_transfer.client.utils.checksum import ChecksumCache, hash_files
+
+from .fakes import FakeRemote, make_api, make_async_api
+
+xxhash = pytest.importorskip("xxhash")
+
+
+class ChecksumRemote(FakeRemote):
+    """Pretends to be a worker storing checksums of uploaded files."""
+
+    routes = {"get_metadata": "get_metadata"}
+
+    def __init__(self, checksums=None):
+        super().__init__()
+        self.checksums = checksums or {}
+
+    def get_metadata(self, paths):
+        with self.lock:
+            id = self._new_id()
+            self.results[id] = {p: {"checksum": self.checksums[p]} for p in paths if p in self.checksums}
+        return OperationIdResponse(id=id)
+
+    async def async_get_metadata(self, paths):
+        return self.get_metadata(paths)
+
+
+@pytest.fixture
+def files(tmp_path):
+    (tmp_path / "same.txt").write_text("Mock file")
+    (tmp_path / "other.txt").write_text("changed")
+    (tmp_path / "new.txt").write_text("new")
+    (tmp_path / "empty.txt").write_text("")
+    return tmp_path
+
+
+def test_hash_files(files, monkeypatch):
+    """Test that checksums match the worker and are cached by file identity."""
+    calls = []
+    file_checksum = checksum.file_checksum
+    monkeypatch.setattr(checksum, "file_checksum", lambda path: calls.append(path) or file_checksum(path))
+
+    cache = ChecksumCache()
+    paths = [str(files / "same.txt"), str(files / "empty.txt"), str(files / "missing.txt")]
+    result = hash_files(paths, cache=cache, workers=2)
+    assert result[paths[0]] == "ac2390bba2edaa01"
+    assert result[paths[1]] == xxhash.xxh64(b"").hexdigest()
+    assert result[paths[2]] is None
+    assert len(calls) == 2
+
+    assert hash_files(paths, cache=cache) == result
+    assert len(calls) == 2
+
+    # Modified files are hashed again
+    (files / "same.txt").write_text("Mock file, modified")
+    os.utime(files / "same.txt", ns=(0, 1))
+    assert hash_files(paths[:1], cache=cache)[paths[0]] != "ac2390bba2edaa01"
+    assert len(calls) == 3
+
+
+def test_checksum_cache_file(files, tmp_path):
+    """Test that the cache can be kept on disk."""
+    path = str(tmp_path / "cache.json")
+    cache = ChecksumCache(path)
+    hash_files([str(files / "same.txt")], cache=cache)
+    cache.save()
+    assert len(ChecksumCache(path)) == 1
+
+
+def test_filter_identical(files):
+    """Test that uploads with a matching remote checksum are dropped."""
+    remote = ChecksumRemote({"r/same.txt": "ac2390bba2edaa01", "r/other.txt": "0000000000000000"})
+    api = make_api(remote)
+    ops = [
+        SrcDst(src=StoragePath(path=str(files / name), remote="local"), dst=StoragePath(path=f"r/{name}"))
+        for name in ["same.txt", "other.txt", "new.txt"]
+    ]
+    ops.append(SrcDst(src=StoragePath(path="r/same.txt"), dst=StoragePath(path="r2/same.txt")))
+
+    kept = api.filter_identical(ops)
+    assert [op.dst.path for op in kept] == ["r/other.txt", "r/new.txt", "r2/same.txt"]
+
+
+def test_upload_tree_skip_identical(files):
+    """Test that upload_tree skips identical files."""
+    remote = ChecksumRemote({"r/same.txt": "ac2390bba2edaa01"})
+    api = make_api(remote)
+    api.upload_tree(str(files), "r", skip_identical=True, batch_size=2)
+    assert sorted(remote.copied) == ["r/empty.txt", "r/new.txt", "r/other.txt"]
+
+
+def test_sync_checksum(files):
+    """Test that touched but identical files are not uploaded again by sync."""
+    remote = ChecksumRemote()
+    api = make_api(remote)
+    api.sync(str(files), "r")
+    assert len(remote.copied) == 4
+
+    remote.copied.clear()
+    remote.checksums["r/same.txt"] = "ac2390bba2edaa01"
+    os.utime(files / "same.txt", ns=(0, 1))
+    assert api.sync(str(files), "r", checksum=True) == []
+    assert remote.copied == []
+
+    # Recorded in the manifest, so no checksum comparison is needed next time
+    remote.checksums.clear()
+    assert api.sync(str(files), "r", checksum=True) == []
+
+
+async def test_async_filter_identical(files):
+    """Test the async deduplication."""
+    remote = ChecksumRemote({"r/same.txt": "ac2390bba2edaa01"})
+    api = make_async_api(remote)
+
+    await api.upload_tree(str(files), "r", skip_identical=True)
+    assert sorted(remote.copied) == ["r/empty.txt", "r/new.txt", "r/other.txt"]
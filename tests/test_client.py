@@ -20,6 +20,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import asyncio
+import base64
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import threading
+import time
 import unittest
 from unittest.mock import AsyncMock, MagicMock, mock_open, patch
 
@@ -234,9 +241,275 @@ async def test_async_auto_refresh_token_non_401_response(mock_async_client):
     assert "_content" not in response.__dict__
 
 
+def unauthorized_response(token):
+    """Create a 401 response to a request sent with the given token."""
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = 401
+    response.request = MagicMock()
+    response.request.headers = {"Authorization": f"Bearer {token}"}
+    response.request.method = "GET"
+    response.request.url = "https://example.com"
+    return response
+
+
+def test_auto_refresh_token_single_flight(mock_client):
+    """Test that concurrent unauthorized requests from threads share a single token refresh."""
+    mock_client._bin_config.token = "old_token"
+
+    def refresh():
+        time.sleep(0.1)
+        return "new_token"
+
+    mock_client.refresh_token_callback = MagicMock(side_effect=refresh)
+    retried_response = MagicMock(spec=httpx.Response)
+    retried_response.status_code = 200
+    retried_response.content = b"retried content"
+    mock_client._session.send.return_value = retried_response
+
+    responses = [unauthorized_response("old_token") for _ in range(10)]
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        list(pool.map(mock_client._auto_refresh_token, responses))
+
+    mock_client.refresh_token_callback.assert_called_once()
+    assert mock_client._session.send.call_count == 10
+    for response in responses:
+        assert response.request.headers["Authorization"] == "Bearer new_token"
+        assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_async_auto_refresh_token_single_flight(mock_async_client):
+    """Test that concurrent unauthorized requests from tasks share a single token refresh."""
+    mock_async_client._bin_config.token = "old_token"
+
+    async def refresh():
+        await asyncio.sleep(0.1)
+        return "new_token"
+
+    mock_async_client.refresh_token_callback = AsyncMock(side_effect=refresh)
+    retried_response = MagicMock(spec=httpx.Response)
+    retried_response.status_code = 200
+    retried_response.content = b"retried content"
+    mock_async_client._session.send.return_value = retried_response
+
+    responses = [unauthorized_response("old_token") for _ in range(10)]
+    await asyncio.gather(*[mock_async_client._async_auto_refresh_token(r) for r in responses])
+
+    mock_async_client.refresh_token_callback.assert_awaited_once()
+    for response in responses:
+        assert response.request.headers["Authorization"] == "Bearer new_token"
+        assert response.status_code == 200
+
+
 """This module contains tests for verifying the functionality of the Client class"""
 
 
+@pytest.mark.asyncio
+async def test_async_prepare_platform_binary(tmp_path, monkeypatch):
+    """Test that the worker binary is streamed to disk by an async session."""
+    payload = b"#!/bin/sh\n" * 10_000
+
+    def serve(request):
+        if request.url.path == "/":
+            return httpx.Response(200, json={"build_info": {"version_hash": "abc", "branch": "main"}})
+        assert request.url.path.startswith("/binaries/worker/")
+        return httpx.Response(200, content=payload)
+
+    client = AsyncClient(download_dir=str(tmp_path), check_in_use=False)
+    monkeypatch.setattr(
+        client,
+        "_create_session",
+        lambda url, sync, http2: httpx.AsyncClient(transport=httpx.MockTransport(serve), base_url="http://dt"),
+    )
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(ticker())
+    await client._async_prepare_platform_binary()
+    task.cancel()
+
+    assert client.binary_config.path.endswith("hpsdata-abc" + (".exe" if os.name == "nt" else ""))
+    with open(client.binary_config.path, "rb") as f:
+        assert f.read() == payload
+    assert os.access(client.binary_config.path, os.X_OK)
+    # The event loop kept running while the lock was taken and the binary written
+    assert ticks > 1
+
+    # The existing binary and the session to the data transfer service are reused
+    session = client._dt_session
+    monkeypatch.setattr(client, "_binary_url", MagicMock())
+    await client._async_prepare_platform_binary()
+    client._binary_url.assert_not_called()
+    assert client._dt_session is session
+
+
+def test_pool_limits():
+    """Test that the connection pool configuration is applied to the sessions."""
+    limits = httpx.Limits(max_connections=7, max_keepalive_connections=3, keepalive_expiry=30.0)
+    client = Client(pool_limits=limits)
+    pool = client._create_session("http://localhost:1234")._transport._pool
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+    assert pool._keepalive_expiry == 30.0
+
+    session = client._data_transfer_session()
+    assert client._data_transfer_session() is session
+    client.binary_config.data_transfer_url = "https://other/dt/api/v1"
+    assert client._data_transfer_session() is not session
+
+
+def test_stop_closes_data_transfer_session():
+    """Test that stopping the client closes the session to the data transfer service."""
+    client = Client()
+    session = client._data_transfer_session()
+    client.stop()
+    assert session.is_closed
+    assert client._dt_session is None
+
+
+@pytest.mark.asyncio
+async def test_async_stop_closes_data_transfer_session():
+    """Test that stopping the async client closes the session to the data transfer service."""
+    client = AsyncClient()
+    session = client._data_transfer_session()
+    await client.stop()
+    assert session.is_closed
+    assert client._dt_session is None
+
+
+def jwt(expires_in, issued_ago=None):
+    """Create an unsigned JWT expiring in the given number of seconds."""
+    claims = {"exp": int(time.time() + expires_in)}
+    if issued_ago is not None:
+        claims["iat"] = int(time.time() - issued_ago)
+    payload = json.dumps(claims).encode()
+    return f"header.{base64.urlsafe_b64encode(payload).decode().rstrip('=')}.signature"
+
+
+def test_renewal_delay():
+    """Test that renewal is scheduled from the exp claim of the token."""
+    client = Client(bin_config=BinaryConfig(token=jwt(100)), token_renewal_margin=60.0)
+    assert client._renewal_delay() is None
+
+    client.refresh_token_callback = MagicMock()
+    assert 35 < client._renewal_delay() <= 40
+    client.binary_config.token = jwt(30)
+    assert client._renewal_delay() == 0
+    client.binary_config.token = "opaque"
+    assert client._renewal_delay() is None
+    client.binary_config.token = jwt(30)
+    client.token_renewal_margin = None
+    assert client._renewal_delay() is None
+
+
+def test_renewal_delay_short_lived():
+    """Test that the renewal margin is at most half the lifetime of the token."""
+    client = Client(bin_config=BinaryConfig(token=jwt(40, issued_ago=0)), token_renewal_margin=60.0)
+    client.refresh_token_callback = MagicMock()
+    assert 15 < client._renewal_delay() <= 20
+
+    # Without an iat claim, the lifetime of a renewed token counts from its renewal
+    client.binary_config.token = jwt(30)
+    assert client._renewal_delay() == 0
+    client._renewed_token = (client.binary_config.token, time.time())
+    assert 10 < client._renewal_delay() <= 15
+
+
+def test_token_renewal():
+    """Test that the token is renewed in the background before it expires."""
+    client = Client(bin_config=BinaryConfig(token=jwt(10)))
+    new_token = jwt(3600)
+    client.refresh_token_callback = MagicMock(return_value=new_token)
+    client._monitor_stop = threading.Event()
+    thread = threading.Thread(target=client._token_renewal)
+    thread.start()
+    try:
+        start = time.monotonic()
+        while client.binary_config.token != new_token:
+            assert time.monotonic() - start < 5
+            time.sleep(0.01)
+    finally:
+        client._monitor_stop.set()
+        thread.join()
+    client.refresh_token_callback.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_token_renewal():
+    """Test that the token is renewed by a task and passed to the session and the worker."""
+    client = AsyncClient(bin_config=BinaryConfig(token=jwt(10)))
+    client._session = AsyncMock()
+    client._session.headers = {}
+    client._session.get.return_value = MagicMock(status_code=200)
+    new_token = jwt(3600)
+    client.refresh_token_callback = AsyncMock(return_value=new_token)
+
+    task = asyncio.create_task(client._token_renewal())
+    await asyncio.wait_for(_wait_token(client, new_token), 5)
+    await client._token_push
+    task.cancel()
+    await task
+
+    client.refresh_token_callback.assert_awaited_once()
+    assert client._session.headers["Authorization"] == f"Bearer {new_token}"
+    client._session.get.assert_awaited_once_with("/")
+
+
+@pytest.mark.asyncio
+async def test_async_stop_cancels_renewal():
+    """Test that stopping the client ends token renewal even without a worker to shut down."""
+    client = AsyncClient(bin_config=BinaryConfig(token=jwt(10)))
+    client.refresh_token_callback = AsyncMock(return_value=jwt(10))
+    task = client._renewal_task = asyncio.create_task(client._token_renewal())
+    await asyncio.sleep(0)
+
+    await client.stop()
+    assert task.done()
+    assert client._renewal_task is None
+
+
+def test_async_refresh_lock_per_loop():
+    """Test that the refresh lock of the async client is created in the event loop using it."""
+    client = AsyncClient()
+    assert client._refresh_lock_async is None
+
+    async def lock():
+        return client._async_refresh_lock()
+
+    first = asyncio.run(lock())
+    assert client._refresh_lock_async is first
+    assert asyncio.run(lock()) is not first
+
+
+@pytest.mark.asyncio
+async def test_async_start_single_renewal():
+    """Test that starting the client again keeps the running token renewal task."""
+    client = AsyncClient(bin_config=BinaryConfig(token=jwt(3600)))
+    client.binary = MagicMock()
+    client._session = AsyncMock()
+    client._session.get.return_value = MagicMock(status_code=404)
+
+    await client.start()
+    task = client._renewal_task
+    await client.start()
+    assert client._renewal_task is task
+    assert not task.done()
+
+    client.binary = None
+    await client.stop()
+    assert task.done()
+
+
+async def _wait_token(client, token):
+    while client.binary_config.token != token:
+        await asyncio.sleep(0.01)
+
+
 class TestClientBase(unittest.TestCase):
     """Test suite for the ClientBase class."""
 
@@ -0,0 +1,189 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""This module contains tests for verifying coalescing of small submissions."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ansys.hps.data_transfer.client.api import AsyncCoalescer, CoalescedOperation, Coalescer
+from ansys.hps.data_transfer.client.models import OperationState, SrcDst, StoragePath
+
+from .fakes import FakeWorker, make_api, make_async_api
+
+
+def test_merge_concurrent_submissions():
+    """Test that concurrent submissions of the same kind are sent as one request."""
+    worker = FakeWorker()
+    api = make_api(worker)
+    api.coalescer = Coalescer(window=0.5, max_entries=20)
+
+    def remove(i):
+        return api.remove([StoragePath(path=f"{i}/a"), StoragePath(path=f"{i}/b")])
+
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        handles = list(pool.map(remove, range(10)))
+
+    # The batch is full after 10 submissions of 2 entries, without waiting for the window
+    assert list(worker.submissions) == ["op-0"]
+    assert worker.submissions["op-0"][0] == "remove"
+    assert sorted(worker.paths("op-0")) == sorted(f"{i}/{n}" for i in range(10) for n in "ab")
+    assert all(isinstance(h, CoalescedOperation) and h.id == "op-0" for h in handles)
+    assert all(h.shared and h.submissions == 10 for h in handles)
+
+
+def test_shared_handle_not_cancelled():
+    """Test that a handle shared with other callers is not cancelled on the worker."""
+    worker = FakeWorker(polls_until_done=100)
+    api = make_api(worker)
+    api.coalescer = Coalescer(window=0.2)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        handles = list(pool.map(lambda i: api.remove([StoragePath(path=f"{i}")]), range(2)))
+        f = pool.submit(api.remove, [StoragePath(path="alone")], future=True).result()
+
+    api._cancel_operations([handles[0], "op-other"])
+    assert worker.cancelled == ["op-other"]
+    assert not f.shared
+    assert f.cancel()
+    assert worker.cancelled == ["op-other", "op-1"]
+    api.client.operation_watcher.stop()
+
+
+def test_scoped_handles():
+    """Test that each caller gets the state of its own entries from the children of the merged operation."""
+    worker = FakeWorker(polls_until_done=0, grouped=True)
+    api = make_api(worker)
+    api.coalescer = Coalescer(window=0.2)
+
+    ops = [
+        [SrcDst(src=StoragePath(path=f"{i}/{n}", remote="local"), dst=StoragePath(path=f"r/{i}/{n}")) for n in "ab"]
+        for i in range(3)
+    ]
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        handles = list(pool.map(api.copy, ops))
+    assert {h.id for h in handles} == {"op-0"}
+    worker.failed.update(ch for ch, d in worker.descriptions.items() if "local:1/b" in d.split())
+
+    results = api.wait_for(handles)
+    assert [op.state for op in results] == [OperationState.Succeeded, OperationState.Failed, OperationState.Succeeded]
+    assert results[1].error.endswith("failed")
+    for i, op in enumerate(results):
+        assert op.id == "op-0"
+        assert op.progress_current == 2 * FakeWorker.size
+        assert sorted(worker.descriptions[ch] for ch in op.children) == [
+            f"copy local:{i}/{n} to any:r/{i}/{n}" for n in "ab"
+        ]
+
+    f = api.as_future(handles[1])
+    assert f.result(timeout=5).state == OperationState.Failed
+    api.client.operation_watcher.stop()
+
+
+def test_unmatched_handles():
+    """Test that handles resolve to the merged operation if its children cannot be matched."""
+    worker = FakeWorker(polls_until_done=0, failed=["op-0"])
+    api = make_api(worker)
+    api.coalescer = Coalescer(window=0.2)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        handles = list(pool.map(lambda i: api.remove([StoragePath(path=f"{i}")]), range(2)))
+    assert [op.state for op in api.wait_for(handles)] == [OperationState.Failed] * 2
+
+
+def test_kinds_not_merged():
+    """Test that different operations are sent in separate requests."""
+    worker = FakeWorker()
+    api = make_api(worker)
+    api.coalescer = Coalescer(window=0.05)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        rm = pool.submit(api.remove, [StoragePath(path="a")])
+        mk = pool.submit(api.mkdir, [StoragePath(path="b")])
+        assert rm.result().id != mk.result().id
+    assert sorted((op, worker.paths(id)) for id, (op, _) in worker.submissions.items()) == [
+        ("mkdir", ["b"]),
+        ("remove", ["a"]),
+    ]
+
+
+def test_failure_reaches_all_callers():
+    """Test that a failing merged request raises in every caller."""
+    coalescer = Coalescer(window=0.1)
+
+    def send(entries):
+        raise RuntimeError("boom")
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(coalescer.submit, "remove", [i], send) for i in range(3)]
+        for f in futures:
+            with pytest.raises(RuntimeError):
+                f.result()
+
+
+async def test_async_merge():
+    """Test that submissions of concurrent tasks are sent as one request."""
+    worker = FakeWorker()
+    api = make_async_api(worker)
+    api.coalescer = AsyncCoalescer(window=0.05)
+
+    ops = [SrcDst(src=StoragePath(path=f"{i}"), dst=StoragePath(path=f"{i}", remote="local")) for i in range(5)]
+    tasks = [asyncio.create_task(api.copy([op])) for op in ops]
+    await asyncio.sleep(0)
+    # Cancelling the first caller neither cancels the merged request nor sends its entries
+    tasks[0].cancel()
+    handles = await asyncio.gather(*tasks[1:])
+
+    assert worker.paths("op-0") == ["1", "2", "3", "4"]
+    assert [h.submissions for h in handles] == [4] * 4
+    assert {h.id for h in handles} == {"op-0"}
+
+
+async def test_async_scoped_handles():
+    """Test that async handles and futures are scoped to the entries of their caller."""
+    worker = FakeWorker(polls_until_done=0, grouped=True, failed=["op-0.0"])
+    api = make_async_api(worker)
+    api.coalescer = AsyncCoalescer(window=0.05)
+
+    handles = await asyncio.gather(*(api.remove([StoragePath(path=f"{i}")]) for i in range(3)))
+    failed = [op.state == OperationState.Failed for op in await api.wait_for(handles)]
+    assert sorted(failed) == [False, False, True]
+
+    futures = [api.as_future(h) for h in handles]
+    ops = await asyncio.gather(*futures)
+    assert [op.state == OperationState.Failed for op in ops] == failed
+    api.client.operation_watcher.stop()
+
+
+async def test_async_all_cancelled():
+    """Test that nothing is sent if all callers of a merged request are cancelled."""
+    worker = FakeWorker()
+    api = make_async_api(worker)
+    api.coalescer = AsyncCoalescer(window=0.05)
+
+    task = asyncio.create_task(api.remove([StoragePath(path="a")]))
+    await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.sleep(0.1)
+    assert worker.submissions == {}
@@ -0,0 +1,119 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module contains tests for verifying futures returned for submitted operations."""
+
+import asyncio
+import concurrent.futures
+
+from ansys.hps.data_transfer.client.api import AsyncTransferFuture, TransferFuture
+from ansys.hps.data_transfer.client.models import OperationIdResponse, OperationState, SrcDst, StoragePath
+
+from .fakes import FakeWorker, make_api, make_async_api
+
+
+def _worker():
+    # Operation op-N succeeds after N + 1 polls
+    return FakeWorker(polls_until_done=lambda id: int(id.split("-")[1]) + 1)
+
+
+def _copy_args(i):
+    return [SrcDst(src=StoragePath(path=f"{i}.txt", remote="local"), dst=StoragePath(path=f"dst/{i}.txt"))]
+
+
+def test_transfer_future():
+    """Test that futures work with concurrent.futures helpers."""
+    worker = _worker()
+    api = make_api(worker)
+
+    futures = [api.copy(_copy_args(i), future=True) for i in range(3)]
+    assert all(isinstance(f, TransferFuture) for f in futures)
+
+    done, not_done = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+    assert futures[0] in done
+
+    callback_results = []
+    futures[2].add_done_callback(lambda f: callback_results.append(f.result().id))
+    assert futures[2].result(timeout=5).state == OperationState.Succeeded
+    assert callback_results == ["op-2"]
+    assert all(f.done() for f in futures)
+
+    # Futures can be passed to wait_for like other operation handles
+    ops = api.wait_for(futures, handler=lambda ops: None)
+    assert [op.id for op in ops] == ["op-0", "op-1", "op-2"]
+
+
+def test_transfer_future_cancel():
+    """Test that cancelling a future stops watching the operation and cancels it on the worker."""
+    worker = _worker()
+    api = make_api(worker)
+    cancelled = []
+    api._cancel = cancelled.extend
+
+    f = api.as_future(OperationIdResponse(id="op-1000"))
+    assert f.cancel()
+    assert f.cancelled()
+    assert api.operation_watcher.num_watches == 0
+    assert cancelled == ["op-1000"]
+
+
+async def test_async_transfer_future_cancel():
+    """Test that cancelling an async future cancels the operation on the worker."""
+    worker = _worker()
+    api = make_async_api(worker)
+    cancelled = []
+
+    async def _cancel(ids):
+        cancelled.extend(ids)
+
+    api._cancel = _cancel
+
+    f = api.as_future(OperationIdResponse(id="op-1000"))
+    assert f.cancel()
+    assert await f.cancel_task
+    assert cancelled == ["op-1000"]
+    assert api.operation_watcher.num_watches == 0
+
+
+async def test_async_transfer_future():
+    """Test that async futures work with asyncio helpers."""
+    worker = _worker()
+    api = make_async_api(worker)
+
+    futures = [await api.copy(_copy_args(i), future=True) for i in range(3)]
+    assert all(isinstance(f, AsyncTransferFuture) for f in futures)
+
+    done, _ = await asyncio.wait(futures, return_when=asyncio.FIRST_COMPLETED)
+    assert futures[0] in done
+
+    ops = await asyncio.gather(*futures)
+    assert [op.id for op in ops] == ["op-0", "op-1", "op-2"]
+
+
+async def test_wrap_transfer_future():
+    """Test that sync futures can be awaited from asyncio code."""
+    worker = _worker()
+    api = make_api(worker)
+
+    op = await asyncio.wrap_future(api.as_future(OperationIdResponse(id="op-2")))
+    assert op.state == OperationState.Succeeded
@@ -0,0 +1,114 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""This module contains tests for verifying delta polling of operation groups."""
+
+from unittest import mock
+
+from ansys.hps.data_transfer.client.api import (
+    AsyncSummaryWaitHandler,
+    GroupTracker,
+    OperationGroup,
+    SummaryWaitHandler,
+)
+from ansys.hps.data_transfer.client.models import OperationState
+
+from .fakes import FakeWorker, make_api, make_async_api
+
+
+def _worker(num_children=2000):
+    # Children succeed on their second poll, the last one fails
+    children = [f"ch-{i}" for i in range(num_children)]
+    return FakeWorker(polls_until_done=2, groups={"group": children}, failed=children[-1:])
+
+
+def _check_result(ops, worker):
+    num_children = len(worker.groups["group"])
+    assert len(ops) == 1
+    group = ops[0]
+    assert isinstance(group, OperationGroup)
+    assert group.state == OperationState.Succeeded
+    assert group.num_children == num_children
+    assert group.child_counts == {OperationState.Succeeded: num_children - 1, OperationState.Failed: 1}
+    assert group.children_bytes == worker.size * num_children
+    assert len(group.failed_children) == 1
+
+
+def _group_requests(worker):
+    # Responses for the group carry the IDs of all of its children
+    return [ids for ids in worker.calls if "group" in ids]
+
+
+def test_delta_wait_for():
+    """Test that only changed children are handed out and children are requested by ID."""
+    worker = _worker()
+    api = make_api(worker)
+
+    seen = []
+
+    class Handler(SummaryWaitHandler):
+        def __call__(self, ops):
+            seen.extend(ch.id for op in ops for ch in op.children_detail)
+            super().__call__(ops)
+
+    with mock.patch("time.sleep"):
+        ops = api.wait_for(["group"], handler=Handler())
+
+    _check_result(ops, worker)
+    # Every child is parsed once per state change only
+    assert len(seen) <= 2 * len(worker.groups["group"])
+    assert len(set(seen)) == len(worker.groups["group"])
+    # The group is requested to learn its children and to get its final state only
+    assert len(_group_requests(worker)) == 2
+
+
+def test_bounded_poll():
+    """Test that every poll of a large group requests a bounded number of children."""
+    worker = _worker(num_children=5000)
+    tracker = GroupTracker(lambda ids, expand=False, raw=False: worker.operations_raw(ids, expand), max_children=500)
+
+    polls = 0
+    while True:
+        n = len(worker.calls)
+        ops = tracker.poll(["group"])
+        polls += 1
+        children = [i for ids in worker.calls[n:] for i in ids if i != "group"]
+        assert len(children) <= 500
+        if ops[0].state == OperationState.Succeeded:
+            break
+        # Only children whose state changed are handed out
+        assert len(ops[0].children_detail) <= 500
+
+    _check_result(ops, worker)
+    # Every child is requested twice, in turn
+    assert polls == 2 * 5000 // 500 + 1
+    assert len(_group_requests(worker)) == 2
+
+
+async def test_async_delta_wait_for():
+    """Test delta polling with the async API."""
+    worker = _worker()
+    api = make_async_api(worker)
+
+    ops = await api.wait_for(["group"], handler=AsyncSummaryWaitHandler(), interval=0.01, cap=0.01)
+    _check_result(ops, worker)
+    assert len(_group_requests(worker)) == 2
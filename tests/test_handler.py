@@ -0,0 +1,77 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""This module contains tests for verifying the operation wait handlers."""
+
+import logging
+
+from ansys.hps.data_transfer.client.api import AsyncSummaryWaitHandler, SummaryWaitHandler, WaitHandler
+from ansys.hps.data_transfer.client.models import Operation, OperationState
+
+
+def _group(num_children, num_failed=0, state=OperationState.Running):
+    children = []
+    for i in range(num_children):
+        ch_state = OperationState.Failed if i < num_failed else OperationState.Succeeded
+        children.append(Operation(id=f"ch-{i}", state=ch_state, progress_current=10, error="boom"))
+    return Operation(id="group", description="group", state=state, children_detail=children)
+
+
+def test_wait_handler_completed_ids():
+    """Test that completed children are tracked once and progress state is released."""
+    handler = WaitHandler()
+    op = _group(100, state=OperationState.Succeeded)
+    handler(ops=[op])
+    handler(ops=[op])
+    assert handler.completed_ids == {f"ch-{i}" for i in range(100)}
+    assert handler.last_progress == {}
+
+
+def test_summary_wait_handler(caplog):
+    """Test that a large group is logged as a single summary line."""
+    handler = SummaryWaitHandler()
+    handler.max_failures_logged = 5
+    assert handler.Meta.expand_group
+
+    with caplog.at_level(logging.INFO, logger="ansys.hps.data_transfer.client.api.handler"):
+        handler([_group(10_000, num_failed=50)])
+        handler([_group(10_000, num_failed=50)])
+        handler([_group(10_000, num_failed=50, state=OperationState.Failed)])
+
+    failures = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert len(failures) == 5
+
+    summaries = [r.getMessage() for r in caplog.records if r.levelno == logging.INFO]
+    # The second poll is throttled by min_progress_interval
+    assert len(summaries) == 2
+    assert "9950 succeeded, 50 failed" in summaries[-1]
+    assert "10000/10000 done" in summaries[-1]
+    assert "finished" in summaries[-1]
+    assert handler._groups == {}
+
+
+async def test_async_summary_wait_handler(caplog):
+    """Test that the async summary handler logs the group summary."""
+    handler = AsyncSummaryWaitHandler()
+    with caplog.at_level(logging.INFO, logger="ansys.hps.data_transfer.client.api.handler"):
+        await handler([_group(10, state=OperationState.Succeeded)])
+    assert any("10 succeeded" in r.getMessage() for r in caplog.records)
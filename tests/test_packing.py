@@ -0,0 +1,206 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""This module contains tests for verifying small-file packing on upload."""
+
+import io
+import os
+import posixpath
+import tarfile
+import zipfile
+
+import pytest
+
+from ansys.hps.data_transfer.client.api.packing import Packer, extract_archive
+from ansys.hps.data_transfer.client.models import Format, OperationIdResponse, OperationState
+
+from .fakes import FakeRemote, make_api, make_async_api
+
+
+def write_archive(path, format, files):
+    if format == Format.Zip:
+        with zipfile.ZipFile(path, "w") as zf:
+            for name, data in files.items():
+                zf.writestr(name, data)
+        return
+    with tarfile.open(path, "w:gz") as tf:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+
+
+class PackingRemote(FakeRemote):
+    """Pretends to be a worker that also builds and extracts archives."""
+
+    routes = {"_extract": "extract", "_archive": "archive"}
+
+    def __init__(self, files=None, root=""):
+        super().__init__(files, root)
+        self.archives = {}
+        self.packed = {}
+        self.extracted = []
+
+    def _apply_one(self, storage_operation, op):
+        if storage_operation == "copy" and op.src.path in self.archives:
+            body = self.archives[op.src.path]
+            files = {k: v for k, v in self.files.items() if body.paths is None or k in body.paths}
+            write_archive(op.dst.path, body.format, files)
+            self.copied.append(op.src.path)
+        elif storage_operation == "copy" and op.src.path.endswith(".zip"):
+            with zipfile.ZipFile(op.src.path) as zf:
+                self.packed[op.dst.path] = sorted(zf.namelist())
+        else:
+            super()._apply_one(storage_operation, op)
+
+    def extract(self, body):
+        with self.lock:
+            assert body.format == Format.Zip
+            self.extracted.append((body.archive_path, body.destination))
+            return OperationIdResponse(id=self._new_id())
+
+    def archive(self, body):
+        with self.lock:
+            self.archives[body.dst] = body
+            return OperationIdResponse(id=self._new_id())
+
+    async def async_extract(self, body):
+        return self.extract(body)
+
+    async def async_archive(self, body):
+        return self.archive(body)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "decks").mkdir()
+    for i in range(10):
+        (tmp_path / "decks" / f"{i}.inp").write_text("x" * 100)
+    (tmp_path / "big.bin").write_bytes(b"0" * 5000)
+    return tmp_path
+
+
+def check_upload(remote, ops):
+    assert remote.copied == ["r/big.bin"]
+    assert len(remote.packed) == 3
+    assert sorted(name for names in remote.packed.values() for name in names) == [f"decks/{i}.inp" for i in range(10)]
+    assert sorted(remote.extracted) == sorted((path, "r") for path in remote.packed)
+    assert sorted(remote.removed) == sorted(remote.packed)
+    assert all(path.startswith("r/.dt-pack-") for path in remote.packed)
+    assert len(ops) == 4
+
+
+def test_packer():
+    """Test that packs are bounded by size and number of files."""
+    packer = Packer(pack_size=250, max_files=3)
+    packs = [packer.add(f"/p/{i}", str(i), 100) for i in range(7)]
+    packs.append(packer.flush())
+    packs = [[rel for _, rel in p] for p in packs if p]
+    assert packs == [["0", "1"], ["2", "3"], ["4", "5"], ["6"]]
+    assert packer.flush() is None
+
+    packer = Packer(pack_size=10_000, max_files=3)
+    assert [packer.add("/p", "f", 1) for _ in range(4)][-1] == [("/p", "f")] * 3
+
+
+def test_upload_packed(tree):
+    """Test that small files are uploaded as archives extracted on the worker."""
+    remote = PackingRemote()
+    api = make_api(remote)
+
+    ops = api.upload_packed(str(tree), "r/", pack_threshold=1000, pack_size=400)
+    check_upload(remote, ops)
+
+
+async def test_async_upload_packed(tree):
+    """Test the async small-file upload."""
+    remote = PackingRemote()
+    api = make_async_api(remote)
+
+    ops = await api.upload_packed(str(tree), "r", pack_threshold=1000, pack_size=400)
+    check_upload(remote, ops)
+
+
+@pytest.mark.parametrize("format", ["zip", "tar.gz"])
+def test_download_dir_as_archive(tmp_path, format):
+    """Test that a remote directory is downloaded as one archive and extracted locally."""
+    remote = PackingRemote({"a.txt": b"a", "sub/b.txt": b"b"}, root="results/run1")
+    api = make_api(remote)
+
+    op = api.download_dir_as_archive("results/run1", str(tmp_path / "out"), format=format, extract=True)
+    assert op.state == OperationState.Succeeded
+    (archive, body), *_ = remote.archives.items()
+    assert body.src == "results/run1"
+    assert body.paths == ["a.txt", "sub/b.txt"]
+    assert archive.startswith("results/run1/.dt-pack-")
+    assert archive.endswith(f".{format}")
+    assert remote.removed == [archive]
+    assert sorted(os.listdir(tmp_path / "out")) == ["a.txt", "sub"]
+    assert (tmp_path / "out" / "sub" / "b.txt").read_bytes() == b"b"
+
+
+def test_download_dir_as_archive_keep(tmp_path):
+    """Test that the archive is kept as it is without extraction."""
+    remote = PackingRemote({"a.txt": b"a"}, root="results")
+    api = make_api(remote)
+
+    api.download_dir_as_archive("results", str(tmp_path / "results.zip"))
+    with zipfile.ZipFile(tmp_path / "results.zip") as zf:
+        assert zf.namelist() == ["a.txt"]
+
+
+def test_download_dir_as_archive_top_level(tmp_path):
+    """Test that the archive of a top-level directory is built inside it, or in the scratch directory."""
+    remote = PackingRemote({"a.txt": b"a", ".keep": b""}, root="results")
+    api = make_api(remote)
+
+    api.download_dir_as_archive("results", str(tmp_path / "results.zip"))
+    (archive, body), *_ = remote.archives.items()
+    assert posixpath.dirname(archive) == "results"
+    assert body.paths == [".keep", "a.txt"]
+    assert remote.removed == [archive]
+
+    remote.archives.clear()
+    api.download_dir_as_archive("results", str(tmp_path / "results.zip"), scratch_dir="scratch")
+    (archive, body), *_ = remote.archives.items()
+    assert posixpath.dirname(archive) == "scratch"
+    assert body.paths is None
+
+
+def test_extract_archive_outside(tmp_path):
+    """Test that archive members leaving the destination are rejected."""
+    path = str(tmp_path / "evil.tar.gz")
+    write_archive(path, Format.Tar_gz, {"../evil.txt": b"x"})
+    with pytest.raises((tarfile.TarError, ValueError)):
+        extract_archive(path, str(tmp_path / "out"), Format.Tar_gz)
+    assert not (tmp_path / "evil.txt").exists()
+
+
+async def test_async_download_dir_as_archive(tmp_path):
+    """Test the async archive download."""
+    remote = PackingRemote({"a.txt": b"a"}, root="results")
+    api = make_async_api(remote)
+
+    op = await api.download_dir_as_archive("results", str(tmp_path / "out"), format=Format.Tar_gz, extract=True)
+    assert op.state == OperationState.Succeeded
+    assert os.listdir(tmp_path / "out") == ["a.txt"]
+    assert len(remote.removed) == 1
@@ -0,0 +1,94 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module contains tests for verifying the polling strategies used by ``wait_for``."""
+
+from unittest.mock import patch
+
+import pytest
+
+from ansys.hps.data_transfer.client import Client, DataTransferApi
+from ansys.hps.data_transfer.client.api import BackoffPolling, ProgressRatePolling
+from ansys.hps.data_transfer.client.models import Operation, OperationState
+
+
+def _op(current, total=1000, state=OperationState.Running, id="op-1"):
+    return Operation(id=id, state=state, progress_current=current, progress_total=total)
+
+
+def test_backoff_polling():
+    """Test that the default strategy stays within the backoff bounds."""
+    polling = BackoffPolling(interval=0.1, cap=5.0)
+    for attempt in range(1, 20):
+        assert 0.1 <= polling.next_interval(attempt, []) <= 5.0
+
+
+@patch("ansys.hps.data_transfer.client.api.polling.time.monotonic")
+def test_progress_rate_polling(mock_time):
+    """Test that the next poll is scheduled close to the predicted completion."""
+    polling = ProgressRatePolling(min_interval=0.1, max_interval=30.0, margin=1.0)
+
+    # First sample, no rate known yet
+    mock_time.return_value = 0.0
+    assert polling.next_interval(1, [_op(0)]) <= 5.0
+
+    # 100 units per second, 800 left
+    mock_time.return_value = 2.0
+    assert polling.next_interval(2, [_op(200)]) == 8.0
+
+    # Slow transfers are bounded by the maximum interval
+    mock_time.return_value = 1000.0
+    assert polling.next_interval(3, [_op(201)]) == 30.0
+
+    # Almost done transfers are bounded by the minimum interval
+    mock_time.return_value = 1001.0
+    assert polling.next_interval(4, [_op(999)]) == 0.1
+
+    # Final operations are forgotten
+    polling.next_interval(5, [_op(1000, state=OperationState.Succeeded)])
+    assert polling._samples == {}
+
+
+@patch("ansys.hps.data_transfer.client.api.polling.time.monotonic")
+def test_progress_rate_polling_earliest_completion(mock_time):
+    """Test that the operation closest to completion decides the next poll."""
+    polling = ProgressRatePolling(margin=1.0)
+    mock_time.return_value = 0.0
+    polling.next_interval(1, [_op(0, id="a"), Operation(id="b", state=OperationState.Running, progress=0.0)])
+    mock_time.return_value = 1.0
+    ops = [_op(10, id="a"), Operation(id="b", state=OperationState.Running, progress=0.5)]
+    assert polling.next_interval(2, ops) == 1.0
+
+
+def test_polling_with_shared_wait():
+    """Test that a polling strategy is rejected by the shared watcher and bypasses it by default."""
+    client = Client(shared_wait=True)
+    api = DataTransferApi(client)
+    api._operations = lambda ids, expand=False: [Operation(id=i, state=OperationState.Succeeded) for i in ids]
+
+    with pytest.raises(ValueError, match="polling"):
+        api.wait_for(["op-1"], shared=True, polling=BackoffPolling())
+
+    ops = api.wait_for(["op-1"], polling=BackoffPolling())
+    assert ops[0].state == OperationState.Succeeded
+    assert client.operation_watcher is None
@@ -0,0 +1,158 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""This module contains tests for verifying client-side scheduling of submissions by priority."""
+
+import asyncio
+import concurrent.futures
+import threading
+
+import pytest
+
+from ansys.hps.data_transfer.client import AsyncClient, AsyncDataTransferApi, Client
+from ansys.hps.data_transfer.client.api import AsyncPriorityScheduler, Priority, PriorityScheduler
+from ansys.hps.data_transfer.client.models import OperationIdResponse, StoragePath
+
+from .fakes import FakeWatcher, FakeWorker, make_api, wait_until
+
+
+class Recorder:
+    def __init__(self):
+        self.order = []
+        self.lock = threading.Lock()
+
+    def submitter(self, name):
+        def submit():
+            with self.lock:
+                self.order.append(name)
+            return OperationIdResponse(id=name)
+
+        return submit
+
+
+def test_priority_order():
+    """Test that waiting submissions are admitted highest priority first."""
+    watcher = FakeWatcher()
+    scheduler = PriorityScheduler(watcher, max_active=1, reserved=0)
+    rec = Recorder()
+    scheduler.submit(Priority.bulk, rec.submitter("first"))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+        futures = []
+        for name, priority in [("bulk", Priority.bulk), ("normal", Priority.normal), ("interactive", 100)]:
+            futures.append(pool.submit(scheduler.submit, priority, rec.submitter(name)))
+            num_waiting = len(futures)
+            wait_until(lambda n=num_waiting: scheduler.num_waiting == n)
+
+        for name in ["first", "interactive", "normal"]:
+            wait_until(lambda n=name: n in watcher.watches)
+            watcher.finish(name)
+        for f in futures:
+            f.result()
+
+    assert rec.order == ["first", "interactive", "normal", "bulk"]
+    watcher.finish("bulk")
+    assert scheduler.num_active == 0
+
+
+def test_reserved_slot():
+    """Test that bulk submissions leave a slot free for interactive ones."""
+    watcher = FakeWatcher()
+    scheduler = PriorityScheduler(watcher, max_active=2, reserved=1)
+    rec = Recorder()
+    scheduler.submit(Priority.bulk, rec.submitter("bulk-1"))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        waiting = pool.submit(scheduler.submit, Priority.bulk, rec.submitter("bulk-2"))
+        wait_until(lambda: scheduler.num_waiting == 1)
+
+        # Does not block although a bulk batch is waiting
+        scheduler.submit(Priority.interactive, rec.submitter("interactive"))
+        assert rec.order == ["bulk-1", "interactive"]
+
+        # Bulk batches may only use the unreserved slot
+        watcher.finish("interactive")
+        assert scheduler.num_waiting == 1
+        watcher.finish("bulk-1")
+        waiting.result(timeout=5)
+    assert rec.order == ["bulk-1", "interactive", "bulk-2"]
+
+
+def test_failed_submission_releases_slot():
+    """Test that a failing request frees its slot."""
+    scheduler = PriorityScheduler(FakeWatcher(), max_active=1, reserved=0)
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        scheduler.submit(Priority.normal, fail)
+    assert scheduler.num_active == 0
+
+
+def test_api_priority():
+    """Test that the API submits through the scheduler of the client."""
+    worker = FakeWorker(polls_until_done=2)
+    api = make_api(worker, Client(max_active_submissions=2))
+
+    batch = api.remove([StoragePath(path=f"bulk/{i}") for i in range(6)], batch_size=2, priority=Priority.bulk)
+    assert len(batch) == 3
+    api.remove([StoragePath(path="one")], priority=Priority.interactive)
+    assert worker.paths("op-3") == ["one"]
+    wait_until(lambda: api.scheduler.num_active == 0)
+
+
+async def test_async_priority_order():
+    """Test that waiting tasks are admitted highest priority first."""
+    watcher = FakeWatcher(make_future=asyncio.get_running_loop().create_future)
+    scheduler = AsyncPriorityScheduler(watcher, max_active=1, reserved=0)
+    order = []
+
+    async def submitter(name):
+        order.append(name)
+        return OperationIdResponse(id=name)
+
+    await scheduler.submit(Priority.bulk, lambda: submitter("first"))
+    tasks = [
+        asyncio.create_task(scheduler.submit(priority, lambda n=name: submitter(n)))
+        for name, priority in [("bulk", Priority.bulk), ("normal", Priority.normal), ("interactive", 100)]
+    ]
+    cancelled = asyncio.create_task(scheduler.submit(Priority.interactive, lambda: submitter("cancelled")))
+    await asyncio.sleep(0)
+    assert scheduler.num_waiting == 4
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    assert scheduler.num_waiting == 3
+
+    for name in ["first", "interactive", "normal"]:
+        watcher.finish(name)
+        await asyncio.sleep(0.01)
+    await asyncio.gather(*tasks)
+    assert order == ["first", "interactive", "normal", "bulk"]
+
+
+async def test_async_api_scheduler():
+    """Test that the async API creates the scheduler of the client."""
+    assert AsyncDataTransferApi(AsyncClient()).scheduler is None
+    api = AsyncDataTransferApi(AsyncClient(max_active_submissions=3))
+    assert isinstance(api.scheduler, AsyncPriorityScheduler)
+    assert api.scheduler is AsyncDataTransferApi(api.client).scheduler
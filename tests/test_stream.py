@@ -0,0 +1,117 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""This module contains tests for verifying streamed operation request bodies."""
+
+import json
+
+import httpx
+import pytest
+
+from ansys.hps.data_transfer.client import AsyncClient, AsyncDataTransferApi, Client, DataTransferApi
+from ansys.hps.data_transfer.client.exceptions import ClientError
+from ansys.hps.data_transfer.client.models import StoragePath
+from ansys.hps.data_transfer.client.utils.stream import JsonArrayBody, dump_model, iter_json_array, single_pass
+
+
+class Recorder:
+    """Stands in for the worker, recording request bodies."""
+
+    def __init__(self, fail_first=False):
+        self.bodies = []
+        self.headers = []
+        self.fail_first = fail_first
+
+    def __call__(self, request: httpx.Request):
+        self.headers.append(request.headers)
+        self.bodies.append(json.loads(request.read()))
+        if self.fail_first and len(self.bodies) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"id": f"op-{len(self.bodies)}"})
+
+
+def _paths(n):
+    return (StoragePath(path=f"{i}.txt") for i in range(n))
+
+
+def test_iter_json_array():
+    """Test that the body is generated in bounded pieces forming valid JSON."""
+    pieces = list(iter_json_array("operations", _paths(1000), dump_model(), buffer_size=1024))
+    assert len(pieces) > 10
+    assert max(len(p) for p in pieces) < 2048
+    body = json.loads(b"".join(pieces))
+    assert [op["path"] for op in body["operations"]] == [f"{i}.txt" for i in range(1000)]
+
+    assert json.loads(b"".join(iter_json_array("operations", [], dump_model()))) == {"operations": []}
+
+
+def test_single_pass():
+    """Test that one-shot iterators cannot be consumed twice, while collections can."""
+    items = [1, 2]
+    assert single_pass(items) is items
+
+    once = single_pass(iter(items))
+    assert list(once) == [1, 2]
+    with pytest.raises(ClientError):
+        list(once)
+
+
+def test_streamed_copy():
+    """Test that generator inputs are streamed to the worker."""
+    worker = Recorder()
+    client = Client()
+    client._session = httpx.Client(transport=httpx.MockTransport(worker), base_url="http://worker")
+    api = DataTransferApi(client)
+
+    r = api.remove(_paths(5000))
+    assert r.id == "op-1"
+    assert worker.headers[0]["transfer-encoding"] == "chunked"
+    assert worker.headers[0]["content-type"] == "application/json"
+    assert len(worker.bodies[0]["operations"]) == 5000
+
+
+def test_streamed_body_replay():
+    """Test that collections can be sent again, while generators are not sent twice."""
+    body = JsonArrayBody("operations", list(_paths(3)), dump_model())
+    assert b"".join(body) == b"".join(body)
+
+    body = JsonArrayBody("operations", single_pass(_paths(3)), dump_model())
+    b"".join(body)
+    with pytest.raises(ClientError):
+        b"".join(body)
+
+
+async def test_async_streamed_copy():
+    """Test that sync and async generators are streamed by the async API."""
+    worker = Recorder()
+    client = AsyncClient()
+    client._session = httpx.AsyncClient(transport=httpx.MockTransport(worker), base_url="http://worker")
+    api = AsyncDataTransferApi(client)
+
+    async def agen(n):
+        for p in _paths(n):
+            yield p
+
+    await api.remove(_paths(300))
+    await api.remove(agen(200))
+    assert [len(b["operations"]) for b in worker.bodies] == [300, 200]
+    assert worker.headers[1]["transfer-encoding"] == "chunked"
@@ -0,0 +1,150 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""This module contains tests for verifying incremental directory sync."""
+
+import pytest
+
+from ansys.hps.data_transfer.client.api.sync import default_manifest_name, parse_entry
+
+from .fakes import UPLOAD_MTIME, FakeRemote, make_api, make_async_api
+
+
+@pytest.fixture
+def tree(tmp_path):
+    local = tmp_path / "local"
+    (local / "a" / "b").mkdir(parents=True)
+    for f in ["1.txt", "a/2.txt", "a/b/3.txt"]:
+        (local / f).write_text(f)
+    return local
+
+
+def test_sync_upload(tree):
+    """Test that only new and changed files are uploaded."""
+    remote = FakeRemote()
+    api = make_api(remote)
+
+    ops = api.sync(str(tree), "data", batch_size=2)
+    assert len(ops) == 2
+    assert sorted(remote.copied) == ["data/1.txt", "data/a/2.txt", "data/a/b/3.txt"]
+    assert remote.lists == 1
+    assert (tree / default_manifest_name).exists()
+
+    # Unchanged tree, the manifest makes the listing unnecessary
+    remote.copied.clear()
+    assert api.sync(str(tree), "data") == []
+    assert remote.copied == []
+    assert remote.lists == 1
+
+    (tree / "a" / "2.txt").write_text("changed content")
+    (tree / "4.txt").write_text("new")
+    api.sync(str(tree), "data")
+    assert sorted(remote.copied) == ["data/4.txt", "data/a/2.txt"]
+    assert remote.lists == 1
+
+
+def test_sync_upload_without_manifest(tree):
+    """Test that files already on the remote are skipped when there is no manifest."""
+    remote = FakeRemote({"data/1.txt": b"1.txt", "data/a/2.txt": b"stale"})
+    remote.mtimes = dict.fromkeys(remote.files, UPLOAD_MTIME)
+    api = make_api(remote)
+
+    api.sync(str(tree), "data", exclude="b")
+    assert sorted(remote.copied) == ["data/a/2.txt"]
+    # Directory levels are listed one request each
+    assert remote.lists == 2
+
+
+def test_sync_download(tree, tmp_path):
+    """Test that only missing and changed remote files are downloaded."""
+    remote = FakeRemote({"r/x.txt": b"x", "r/sub/y.txt": b"yy", "r/sub/z.log": b"z"})
+    remote.mtimes = dict.fromkeys(remote.files, 1_000)
+    api = make_api(remote)
+    dst = tmp_path / "download"
+
+    api.sync(str(dst), "r", direction="download", include="*.txt")
+    assert sorted(remote.copied) == [str(dst / "sub" / "y.txt"), str(dst / "x.txt")]
+    assert (dst / "sub" / "y.txt").read_bytes() == b"yy"
+
+    remote.copied.clear()
+    assert api.sync(str(dst), "r", direction="download", include="*.txt") == []
+
+    remote.files["r/x.txt"] = b"xxx"
+    remote.mtimes["r/x.txt"] = 2_000
+    api.sync(str(dst), "r", direction="download", include="*.txt")
+    assert remote.copied == [str(dst / "x.txt")]
+
+
+def test_sync_invalid_direction(tree):
+    """Test that an unknown direction is rejected."""
+    with pytest.raises(ValueError, match="direction"):
+        make_api(FakeRemote()).sync(str(tree), "data", direction="both")
+
+
+def test_sync_missing_operation(tree):
+    """Test that a listing missing from the first status response is waited for."""
+    remote = FakeRemote()
+    api = make_api(remote)
+    calls = []
+
+    def _operations(ids, expand=False):
+        calls.append(ids)
+        return remote.operations(ids, expand=expand) if len(calls) > 1 else []
+
+    api._operations = _operations
+    api.sync(str(tree), "data")
+    assert calls[0] == calls[1]
+    assert len(remote.copied) == 3
+
+
+def test_parse_entry():
+    """Test parsing of listing entries."""
+    assert parse_entry("dir/") == ("dir", True, None, None)
+    assert parse_entry({"name": "f", "size": 3, "mtime": "1970-01-01T00:00:10Z"}) == ("f", False, 3, 10.0)
+
+
+async def test_async_sync(tree):
+    """Test the async incremental upload."""
+    remote = FakeRemote()
+    api = make_async_api(remote)
+
+    await api.sync(str(tree), "data")
+    assert len(remote.copied) == 3
+    remote.copied.clear()
+    assert await api.sync(str(tree), "data") == []
+    assert remote.copied == []
+
+
+async def test_async_sync_missing_operation(tree):
+    """Test that the async sync waits for a listing missing from the first status response."""
+    remote = FakeRemote()
+    api = make_async_api(remote)
+    calls = []
+
+    async def _operations(ids, expand=False):
+        calls.append(ids)
+        return remote.operations(ids, expand=expand) if len(calls) > 1 else []
+
+    api._operations = _operations
+    await api.sync(str(tree), "data")
+    assert calls[0] == calls[1]
+    assert len(remote.copied) == 3
@@ -0,0 +1,109 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""This module contains tests for verifying streaming directory-tree uploads."""
+
+import pytest
+
+from ansys.hps.data_transfer.client.utils.iterables import achunked, chunked
+from ansys.hps.data_transfer.client.utils.walk import awalk_files, walk_files
+
+from .fakes import FakeWorker, make_api, make_async_api
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for d in ["a", "a/b", "a/b/c", "skip", "d"]:
+        (tmp_path / d).mkdir()
+    files = ["1.txt", "2.log", "a/3.txt", "a/b/4.txt", "a/b/c/5.txt", "skip/6.txt", "d/7.bin"]
+    for f in files:
+        (tmp_path / f).write_text(f)
+    return tmp_path
+
+
+def _chunks(worker):
+    assert all(storage_operation == "copy" for storage_operation, _ in worker.submissions.values())
+    return [operations for _, operations in worker.submissions.values()]
+
+
+def _uploads(worker):
+    return sorted((op.src.path, op.dst.path) for chunk in _chunks(worker) for op in chunk)
+
+
+def test_chunked_first():
+    """Test that chunks grow from the first size up to the maximum size."""
+    assert [len(c) for c in chunked(range(40), 10, first=2)] == [2, 4, 8, 10, 10, 6]
+    assert [len(c) for c in chunked(range(25), 10)] == [10, 10, 5]
+
+
+async def test_achunked():
+    """Test chunking of async iterables."""
+
+    async def gen():
+        for i in range(40):
+            yield i
+
+    chunks = [c async for c in achunked(gen(), 10, first=2)]
+    assert [len(c) for c in chunks] == [2, 4, 8, 10, 10, 6]
+    assert [i for c in chunks for i in c] == list(range(40))
+
+
+def test_walk_files(tree):
+    """Test include and exclude patterns of the parallel walker."""
+    rels = sorted(rel for _, rel in walk_files(tree, exclude="skip", workers=2))
+    assert rels == ["1.txt", "2.log", "a/3.txt", "a/b/4.txt", "a/b/c/5.txt", "d/7.bin"]
+
+    rels = sorted(rel for _, rel in walk_files(tree, include="*.txt", exclude=["skip", "c"]))
+    assert rels == ["1.txt", "a/3.txt", "a/b/4.txt"]
+
+
+async def test_awalk_files(tree):
+    """Test the async walker."""
+    rels = sorted([rel async for _, rel in awalk_files(tree, include=["*.txt"], exclude="skip")])
+    assert rels == ["1.txt", "a/3.txt", "a/b/4.txt", "a/b/c/5.txt"]
+
+
+def test_upload_tree(tree):
+    """Test that the tree is uploaded in growing batches."""
+    worker = FakeWorker()
+    api = make_api(worker)
+
+    batch = api.upload_tree(str(tree), "remote/dir/", exclude="skip", batch_size=4)
+    assert len(batch) == len(worker.submissions)
+    assert [len(c) for c in _chunks(worker)] == [1, 2, 3]
+    assert _uploads(worker) == sorted(
+        (str(tree / rel), f"remote/dir/{rel}")
+        for rel in ["1.txt", "2.log", "a/3.txt", "a/b/4.txt", "a/b/c/5.txt", "d/7.bin"]
+    )
+    assert all(op.src.remote == "local" and op.dst.remote == "any" for chunk in _chunks(worker) for op in chunk)
+
+
+async def test_async_upload_tree(tree):
+    """Test the async directory-tree upload."""
+    worker = FakeWorker()
+    api = make_async_api(worker)
+
+    batch = await api.upload_tree(str(tree), "", include="*.txt", remote="s3")
+    assert len(batch) == 3
+    assert _uploads(worker) == sorted(
+        (str(tree / rel), rel) for rel in ["1.txt", "a/3.txt", "a/b/4.txt", "a/b/c/5.txt", "skip/6.txt"]
+    )
@@ -0,0 +1,145 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""This module contains tests for verifying how ``wait_for`` polls operations."""
+
+import pytest
+
+from ansys.hps.data_transfer.client import AsyncClient, AsyncDataTransferApi, Client, DataTransferApi
+from ansys.hps.data_transfer.client.models import OperationState
+
+from .fakes import FakeWorker
+
+
+def _worker():
+    # Operations finish after a number of polls that depends on their index
+    return FakeWorker(polls_until_done=lambda id: _index(id) % 5 + 1)
+
+
+def _index(id):
+    return int(id.split("-")[1])
+
+
+def _ids(n):
+    return [f"op-{i}" for i in range(n)]
+
+
+def _check(worker, ops, max_ids):
+    assert [op.id for op in ops] == _ids(1000)
+    assert all(op.state == OperationState.Succeeded for op in ops)
+    # Finished operations are never queried again
+    assert all(n == _index(id) % 5 + 1 for id, n in worker.polls.items())
+    assert max(len(ids) for ids in worker.calls) <= max_ids
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_wait_for_incremental(shared):
+    """Test that wait_for only re-queries running operations and splits large ID lists."""
+    worker = _worker()
+    api = DataTransferApi(Client())
+    api.max_ids_per_request = 128
+    api._operations = worker.operations
+
+    ops = api.wait_for(_ids(1000), interval=0.01, cap=0.01, handler=lambda ops: None, shared=shared)
+    _check(worker, ops, api.max_ids_per_request)
+
+
+@pytest.mark.parametrize("shared", [False, True])
+async def test_async_wait_for_incremental(shared):
+    """Test that the async wait_for only re-queries running operations and splits large ID lists."""
+    worker = _worker()
+    api = AsyncDataTransferApi(AsyncClient())
+    api.max_ids_per_request = 128
+    api._operations = worker.async_operations
+
+    async def handler(ops):
+        pass
+
+    ops = await api.wait_for(_ids(1000), interval=0.01, cap=0.01, handler=handler, shared=shared)
+    _check(worker, ops, api.max_ids_per_request)
+
+
+def test_iter_completed():
+    """Test that operations are yielded as soon as they complete."""
+    worker = _worker()
+    api = DataTransferApi(Client())
+    api._operations = worker.operations
+
+    completed = []
+    for op in api.iter_completed(list(reversed(_ids(20))), interval=0.01, cap=0.01, handler=lambda ops: None):
+        assert op.state == OperationState.Succeeded
+        # Nothing has been queried after the operation completed
+        assert worker.polls[op.id] == _index(op.id) % 5 + 1
+        completed.append(op.id)
+
+    assert sorted(completed) == sorted(_ids(20))
+    # Operations finishing on the first poll come first
+    assert all(_index(id) % 5 == 0 for id in completed[:4])
+
+
+async def test_async_iter_completed():
+    """Test that the async iterator yields operations as soon as they complete."""
+    worker = _worker()
+    api = AsyncDataTransferApi(AsyncClient())
+    api._operations = worker.async_operations
+
+    async def handler(ops):
+        pass
+
+    completed = [op.id async for op in api.iter_completed(_ids(20), interval=0.01, cap=0.01, handler=handler)]
+    assert sorted(completed) == sorted(_ids(20))
+    assert all(_index(id) % 5 == 0 for id in completed[:4])
+
+
+def _partial(worker):
+    # Only the first operation, then nothing at all, then all of them
+    responses = iter([lambda ids: worker.operations(ids[:1]), lambda ids: []])
+    return lambda ids: next(responses, worker.operations)(ids)
+
+
+def test_wait_for_missing_operations():
+    """Test that operations left out of a status response are still waited for."""
+    partial = _partial(FakeWorker())
+    api = DataTransferApi(Client())
+    api._operations = lambda ids, expand=False: partial(ids)
+
+    ops = api.wait_for(["op-0", "op-1"], interval=0.01, cap=0.01, handler=lambda ops: None)
+    assert [op.id for op in ops] == ["op-0", "op-1"]
+    assert all(op.state == OperationState.Succeeded for op in ops)
+
+
+async def test_async_wait_for_missing_operations():
+    """Test that the async wait_for keeps waiting for operations left out of a status response."""
+    partial = _partial(FakeWorker())
+    api = AsyncDataTransferApi(AsyncClient())
+
+    async def _operations(ids, expand=False):
+        return partial(ids)
+
+    async def handler(ops):
+        pass
+
+    api._operations = _operations
+    ops = await api.wait_for(["op-0", "op-1"], interval=0.01, cap=0.01, handler=handler)
+    assert [op.id for op in ops] == ["op-0", "op-1"]
+    assert all(op.state == OperationState.Succeeded for op in ops)
@@ -0,0 +1,165 @@
+# Copyright (C) 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""This module contains tests for verifying the shared operation watcher."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from ansys.hps.data_transfer.client import AsyncClient, AsyncDataTransferApi, Client, DataTransferApi
+from ansys.hps.data_transfer.client.api.watcher import AsyncOperationWatcher, OperationWatcher
+from ansys.hps.data_transfer.client.exceptions import TimeoutError
+from ansys.hps.data_transfer.client.models import OperationState
+
+from .fakes import FakeWorker
+
+
+def test_shared_wait_for():
+    """Test that concurrent waiters share a single polling stream."""
+    worker = FakeWorker(polls_until_done=3)
+    client = Client(shared_wait=True)
+    api = DataTransferApi(client)
+    api._operations = worker.operations
+
+    num_waiters = 20
+    with ThreadPoolExecutor(max_workers=num_waiters) as pool:
+        results = list(pool.map(lambda i: api.wait_for([f"op-{i}"], handler=lambda ops: None), range(num_waiters)))
+
+    for i, ops in enumerate(results):
+        assert len(ops) == 1
+        assert ops[0].id == f"op-{i}"
+        assert ops[0].state == OperationState.Succeeded
+
+    # Far fewer requests than independent loops would make
+    assert len(worker.calls) < num_waiters * worker.polls_until_done
+    assert max(len(ids) for ids in worker.calls) > 1
+    assert client.operation_watcher.num_watches == 0
+
+
+def test_shared_wait_for_timeout():
+    """Test that a shared wait times out and unregisters."""
+    worker = FakeWorker(polls_until_done=1_000_000)
+    client = Client(shared_wait=True)
+    api = DataTransferApi(client)
+    api._operations = worker.operations
+
+    with pytest.raises(TimeoutError):
+        api.wait_for(["op-1"], timeout=0.3, handler=lambda ops: None)
+    assert client.operation_watcher.num_watches == 0
+
+
+async def test_async_shared_wait_for():
+    """Test that concurrent tasks share a single polling stream."""
+    worker = FakeWorker(polls_until_done=3)
+    client = AsyncClient(shared_wait=True)
+    api = AsyncDataTransferApi(client)
+    api._operations = worker.async_operations
+
+    async def handler(ops):
+        pass
+
+    num_waiters = 20
+    results = await asyncio.gather(*[api.wait_for([f"op-{i}"], handler=handler) for i in range(num_waiters)])
+
+    for i, ops in enumerate(results):
+        assert ops[0].id == f"op-{i}"
+        assert ops[0].state == OperationState.Succeeded
+
+    assert len(worker.calls) < num_waiters * worker.polls_until_done
+    assert client.operation_watcher.num_watches == 0
+
+
+def test_shared_wait_for_flaky_fetch():
+    """Test that a single failed status request does not fail the waiters."""
+    worker = FakeWorker(polls_until_done=3)
+    client = Client(shared_wait=True)
+    api = DataTransferApi(client)
+    failures = []
+
+    def flaky(ids, expand=False):
+        if not failures:
+            failures.append(ids)
+            raise httpx.ConnectError("connection reset")
+        return worker.operations(ids, expand=expand)
+
+    api._operations = flaky
+    ops = api.wait_for(["op-1"], raise_on_error=True, handler=lambda ops: None)
+    assert failures
+    assert ops[0].state == OperationState.Succeeded
+
+
+def test_watcher_fails_after_consecutive_errors():
+    """Test that waiters are failed once the status requests keep failing."""
+    calls = []
+
+    def broken(ids, expand=False):
+        calls.append(ids)
+        raise httpx.ConnectError("connection refused")
+
+    watcher = OperationWatcher(broken, interval=0.01, cap=0.01, max_failures=3)
+    w = watcher.watch(["op-1"])
+    with pytest.raises(httpx.ConnectError):
+        w.future.result(timeout=5)
+    assert len(calls) == 3
+
+
+async def test_async_watcher_flaky_fetch():
+    """Test that the async watcher keeps polling after a transient error."""
+    worker = FakeWorker()
+    failures = []
+
+    async def flaky(ids, expand=False):
+        if not failures:
+            failures.append(ids)
+            raise httpx.ConnectError("connection reset")
+        return worker.operations(ids, expand=expand)
+
+    watcher = AsyncOperationWatcher(flaky, interval=0.01, cap=0.01)
+    w = watcher.watch(["op-1"])
+    ops = await asyncio.wait_for(w.future, timeout=5)
+    assert failures
+    assert ops[0].state == OperationState.Succeeded
+
+
+def test_watcher_missing_operations():
+    """Test that operations left out of a status response are still waited for."""
+    worker = FakeWorker()
+    calls = []
+
+    def partial(ids, expand=False):
+        calls.append(ids)
+        # Only the first operation, then nothing at all
+        if len(calls) == 1:
+            return worker.operations(ids[:1])
+        if len(calls) == 2:
+            return []
+        return worker.operations(ids)
+
+    watcher = OperationWatcher(partial, interval=0.01, cap=0.01)
+    w = watcher.watch(["op-1", "op-2"])
+    ops = w.future.result(timeout=5)
+    assert [op.id for op in ops] == ["op-1", "op-2"]
+    assert all(op.state == OperationState.Succeeded for op in ops)
+    assert len(calls) == 3